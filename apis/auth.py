@@ -1,11 +1,18 @@
+from hashlib import sha256
+from time import time
+
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.utils.translation import gettext_lazy as _
 
-from apps.common.utils import get_object, jwt_decode, to_object
+from apps.accounts.cache import get_user, get_user_perms
+from apps.common.cache import LRUCache
+from apps.common.utils import jwt_decode, to_object
 
 User = get_user_model()
 
+token_cache = LRUCache(settings.AUTH_CACHE_SIZE, settings.AUTH_CACHE_TIMEOUT)
+
 
 def auth_user(cls, ctx, exc=True):
     """Auth user."""
@@ -26,6 +33,15 @@ def auth_test(cls):
     return fn_test
 
 
+def has_perm(user, perm):
+    """Check user permission against its precomputed permission set."""
+    if not user.is_active:
+        return False
+    if user.is_superuser:
+        return True
+    return perm in get_user_perms(user)
+
+
 def get_authorization_header(request):
     """Return request's 'Authorization:' header, as a bytestring."""
     auth = request.META.get("HTTP_AUTHORIZATION", b"")
@@ -75,10 +91,20 @@ class TokenAuth(BaseAuth):
 
         return user
 
+    @classmethod
+    def decode_key(cls, key):
+        digest = sha256(key.encode()).digest()
+        payload = token_cache.get(digest)
+
+        if payload is None or payload.get("exp", float("inf")) <= time():
+            payload = jwt_decode(key)
+            token_cache.set(digest, payload)
+        return payload
+
     @classmethod
     def validate_key(cls, request, key):
         try:
-            payload = jwt_decode(key)
+            payload = cls.decode_key(key)
         except Exception:
             raise AuthError(_("The token provided is wrong."))
 
@@ -93,7 +119,7 @@ class TokenAuth(BaseAuth):
             user = request.user
         else:
             request._user_check = True
-            user = get_object(cls.model, pk=payload.get("sub"))
+            user = get_user(cls.model, payload.get("sub"))
 
         if not user:
             raise AuthError(_("The user does not exist."))
@@ -0,0 +1,19 @@
+from django.utils import timezone
+
+from apps.common.datasets import Dataset
+from apps.common.utils import unique_id
+
+
+def load_fruits():
+    return [
+        {
+            "id": unique_id(11),
+            "name": f"Orange {x}",
+            "type": "citrus",
+            "created": timezone.now(),
+        }
+        for x in range(1, 1001)
+    ]
+
+
+fruits = Dataset("fruits", load_fruits, search_fields=("name",))
@@ -129,6 +129,12 @@ class UpdateNoteInput(graphene.InputObjectType):
     content = graphene.String(required=True)
 
 
+class BulkUpdateNoteInput(UpdateNoteInput):
+    """Bulk update note input."""
+
+    id = graphene.ID(required=True, description="Note ID.")
+
+
 class PersonInput(graphene.InputObjectType):
     """Person input."""
 
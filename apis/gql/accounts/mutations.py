@@ -749,6 +749,97 @@ class DeleteNote(mutations.ModelDeleteMutation):
         return super().perform_mutation(root, info, **kwargs)
 
 
+class NoteOwnerMixin:
+    """Allow mutating only the notes of the request user."""
+
+    @classmethod
+    def check_instance(cls, info, instance):
+        if instance.user_id != info.context.user.pk:
+            raise ValidationError(
+                {
+                    "perm": _("Permission denied."),
+                }
+            )
+
+
+class CreateNotes(mutations.ModelBulkMutation):
+    """Create notes."""
+
+    class Arguments:
+        input = graphene.List(
+            graphene.NonNull(inputs.CreateNoteInput),
+            required=True,
+            description="Create note inputs.",
+        )
+
+    class Meta:
+        description = "Create notes."
+        model = models.Note
+        exclude = (
+            "id",
+            "user",
+        )
+        field_name = "notes"
+        field_type = types.Note
+
+    @classmethod
+    def bulk_save(cls, info, instances, cleaned_inputs):
+        for instance in instances:
+            instance.user = info.context.user
+        super().bulk_save(info, instances, cleaned_inputs)
+
+    @classmethod
+    @gql_lock(name="CreateNotes")
+    @auth_required
+    def perform_mutation(cls, root, info, **kwargs):
+        return super().perform_mutation(root, info, **kwargs)
+
+
+class UpdateNotes(NoteOwnerMixin, mutations.ModelBulkMutation):
+    """Update notes."""
+
+    class Arguments:
+        input = graphene.List(
+            graphene.NonNull(inputs.BulkUpdateNoteInput),
+            required=True,
+            description="Update note inputs.",
+        )
+
+    class Meta:
+        description = "Update notes."
+        model = models.Note
+        exclude = ("user",)
+        field_name = "notes"
+        field_type = types.Note
+
+    @classmethod
+    @gql_lock(name="UpdateNotes")
+    @auth_required
+    def perform_mutation(cls, root, info, **kwargs):
+        return super().perform_mutation(root, info, **kwargs)
+
+
+class DeleteNotes(NoteOwnerMixin, mutations.ModelBulkDeleteMutation):
+    """Delete notes."""
+
+    class Arguments:
+        ids = graphene.List(
+            graphene.NonNull(graphene.ID), required=True, description="Note IDs."
+        )
+
+    class Meta:
+        description = "Delete notes."
+        model = models.Note
+        field_name = "notes"
+        field_type = types.Note
+
+    @classmethod
+    @gql_lock(name="DeleteNotes")
+    @auth_required
+    def perform_mutation(cls, root, info, **kwargs):
+        return super().perform_mutation(root, info, **kwargs)
+
+
 class CreateUser(mutations.ModelMutation):
     """Create user."""
 
@@ -852,6 +943,61 @@ class CreateComment(mutations.ModelMutation):
         return super().perform_mutation(root, info, **kwargs)
 
 
+class CreateComments(mutations.ModelBulkMutation):
+    """Create comments."""
+
+    class Arguments:
+        input = graphene.List(
+            graphene.NonNull(inputs.CreateCommentInput),
+            required=True,
+            description="Create comment inputs.",
+        )
+
+    class Meta:
+        description = "Create comments."
+        model = models.Note
+        exclude = (
+            "id",
+            "user",
+            "username",
+        )
+        field_name = "comments"
+        field_type = types.Comment
+
+    @classmethod
+    def clean_item(cls, info, instance, input, input_cls):
+        user = models.User(
+            username=f"user.{unique_id(11)}", password="...", is_active=False
+        )
+        errors = {}
+        try:
+            super().clean_item(info, user, input["user"], input_cls.user)
+        except ValidationError as error:
+            errors.update(mutations.prefix_errors("user", error))
+        try:
+            cleaned_input = super().clean_item(
+                info, instance, {**input, "user": user}, input_cls
+            )
+        except ValidationError as error:
+            errors.update(error.message_dict)
+        if errors:
+            raise ValidationError(errors)
+        return cleaned_input
+
+    @classmethod
+    def bulk_save(cls, info, instances, cleaned_inputs):
+        users = models.User.objects.bulk_create(
+            [instance.user for instance in instances]
+        )
+        models.UserSearchKey.update_users(users, adding=True)
+        super().bulk_save(info, instances, cleaned_inputs)
+
+    @classmethod
+    @gql_lock(name="CreateComments")
+    def perform_mutation(cls, root, info, **kwargs):
+        return super().perform_mutation(root, info, **kwargs)
+
+
 class UpdateComment(mutations.ModelMutation):
     """Update comment."""
 
@@ -944,12 +1090,16 @@ class NoteMutation:
     create_note = CreateNote.Field()
     update_note = UpdateNote.Field()
     delete_note = DeleteNote.Field()
+    create_notes = CreateNotes.Field()
+    update_notes = UpdateNotes.Field()
+    delete_notes = DeleteNotes.Field()
 
 
 class CommentMutation:
     """Comment mutation type"""
 
     create_comment = CreateComment.Field()
+    create_comments = CreateComments.Field()
     update_comment = UpdateComment.Field()
     delete_comment = DeleteComment.Field()
 
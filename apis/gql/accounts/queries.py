@@ -1,14 +1,13 @@
 import graphene
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
-from django.db.models import Prefetch
 from django.utils.translation import gettext_lazy as _
 
 from apis.gql.accounts import types
 from apis.gql.auth import auth_required, has_perm, staff_required
 from apps.common.utils import get_object
 from apps.gql.fields import ModelCursorConnectionField
-from apps.gql.utils import id_from_global_id, node_from_global_id
+from apps.gql.utils import defer_node_from_global_id, id_from_global_id
 
 User = get_user_model()
 
@@ -32,22 +31,14 @@ class UserQuery:
     @staff_required
     @has_perm("accounts.view_user")
     def resolve_users(cls, root, info, **kwargs):
-        return types.User._meta.model.objects.defer(
-            "password",
-            "renewed",
-            "is_active",
-            "is_staff",
-            "is_superuser",
-            "tfa_secret",
-            "tfa_last_code",
-        )
+        return types.User._meta.model.objects.all()
 
     @classmethod
     @staff_required
     @has_perm("accounts.view_user")
     def resolve_user(cls, root, info, id=None, username=None):
         if id:
-            return node_from_global_id(info, id, only_type=types.User)
+            return defer_node_from_global_id(info, id, only_type=types.User)
         if username:
             return get_object(types.User._meta.model, username=username)
 
@@ -55,13 +46,16 @@ class UserQuery:
 class NoteQuery:
     """Note query type"""
 
-    notes = ModelCursorConnectionField(types.Note, description="Notes.")
+    notes = ModelCursorConnectionField(
+        types.Note, cursor_field=("created", "id"), description="Notes."
+    )
     note = graphene.Field(
         types.Note, id=graphene.ID(required=True), description="Note."
     )
 
     user_notes = ModelCursorConnectionField(
         types.Note,
+        cursor_field=("created", "id"),
         user_id=graphene.ID(),
         username=graphene.String(),
         description="User notes.",
@@ -75,15 +69,17 @@ class NoteQuery:
     @classmethod
     @auth_required
     def resolve_note(cls, root, info, id):
-        note = node_from_global_id(info, id, only_type=types.Note)
-
-        if note and note.user_id != info.context.user.pk:
-            raise ValidationError(
-                {
-                    "perm": _("Permission denied."),
-                }
-            )
-        return note
+        def check_note(note):
+            if note and note.user_id != info.context.user.pk:
+                raise ValidationError(
+                    {
+                        "perm": _("Permission denied."),
+                    }
+                )
+            return note
+
+        note = defer_node_from_global_id(info, id, only_type=types.Note)
+        return note.then(check_note)
 
     @classmethod
     @staff_required
@@ -104,21 +100,20 @@ class NoteQuery:
 class CommentQuery:
     """Comment query type"""
 
-    comments = ModelCursorConnectionField(types.Comment, description="Comments.")
+    comments = ModelCursorConnectionField(
+        types.Comment, cursor_field=("created", "id"), description="Comments."
+    )
     comment = graphene.Field(
         types.Comment, id=graphene.ID(required=True), description="Comment."
     )
 
     @classmethod
     def resolve_comments(cls, root, info, **kwargs):
-        prefetch_user = Prefetch(
-            "user", queryset=User.objects.only("first_name", "last_name", "email")
-        )
-        return types.Comment._meta.model.objects.prefetch_related(prefetch_user)
+        return types.Comment._meta.model.objects.all()
 
     @classmethod
     def resolve_comment(cls, root, info, id):
-        return node_from_global_id(info, id, only_type=types.Comment)
+        return defer_node_from_global_id(info, id, only_type=types.Comment)
 
 
 class Query(UserQuery, NoteQuery, CommentQuery):
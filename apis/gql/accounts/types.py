@@ -1,10 +1,11 @@
 import graphene
 from django.contrib.auth import get_user_model
 
-from apis.gql.accounts import filters
 from apis.gql.common.fields import Image
-from apps.accounts import models
+from apps.accounts import filters, models
+from apps.gql.connections import Connection
 from apps.gql.fields import DateTimeTZ
+from apps.gql.loaders import ModelLoader, get_loader
 from apps.gql.types import ModelObjectType
 
 
@@ -18,6 +19,7 @@ class Note(ModelObjectType, interfaces=(graphene.Node,)):
         model = models.Note
         exclude = ("user",)
         filterset_class = filters.NoteFilter
+        connection_class = Connection
 
     @classmethod
     def get_queryset(cls, queryset, info):
@@ -34,6 +36,10 @@ class User(ModelObjectType, interfaces=(graphene.Node,)):
 
     tfa_active = graphene.Boolean(description="TFA authentication active.")
 
+    projection = {
+        "tfa_active": ("tfa_secret",),
+    }
+
     class Meta:
         model = get_user_model()
         exclude = (
@@ -47,6 +53,7 @@ class User(ModelObjectType, interfaces=(graphene.Node,)):
             "tfa_last_code",
         )
         filterset_class = filters.UserFilter
+        connection_class = Connection
 
     @classmethod
     def get_queryset(cls, queryset, info):
@@ -75,6 +82,10 @@ class Comment(ModelObjectType, interfaces=(graphene.Node,)):
     user = graphene.Field(Person, required=True)
     created = DateTimeTZ(required=True)
 
+    projection = {
+        "user": ("user",),
+    }
+
     class Meta:
         model = models.Note
         fields = (
@@ -83,3 +94,25 @@ class Comment(ModelObjectType, interfaces=(graphene.Node,)):
             "created",
         )
         filterset_class = filters.CommentFilter
+        connection_class = Connection
+
+    @classmethod
+    def get_user_loader(cls, info):
+        model = Person._meta.model
+        return get_loader(
+            info,
+            (cls, "user"),
+            ModelLoader,
+            model,
+            queryset=model.objects.only("first_name", "last_name", "email"),
+        )
+
+    @classmethod
+    def prime_loaders(cls, info, nodes):
+        cls.get_user_loader(info).enqueue_many(node.user_id for node in nodes)
+
+    @classmethod
+    def resolve_user(cls, root, info):
+        if cls._meta.model.user.field.is_cached(root):
+            return root.user
+        return cls.get_user_loader(info).defer(root.user_id)
@@ -1,6 +1,6 @@
 import graphene
-from django.core.cache import cache
 
+from apis import datasets
 from apis.gql.common.enums import FruitType
 from apps.gql.connections import Connection
 from apps.gql.fields import DateTimeTZ
@@ -15,9 +15,7 @@ class Fruit(graphene.ObjectType, interfaces=(graphene.Node,)):
 
     @classmethod
     def get_node(cls, info, id):
-        for fruit in cache.get("fruits", []):
-            if fruit["id"] == id:
-                return fruit
+        return datasets.fruits.get(id)
 
 
 class FruitConnection(Connection):
@@ -1,4 +1,5 @@
 from rest_framework.exceptions import ErrorDetail
+from rest_framework.serializers import ReturnList
 from rest_framework.status import is_client_error
 from rest_framework.views import exception_handler as _exception_handler
 
@@ -41,16 +42,30 @@ class ResponseHandler:
             "errors": error_list,
         }
 
+    @staticmethod
+    def is_bulk_errors(data):
+        from apis.pi.common.serializers import BulkListSerializer
+
+        serializer = getattr(data, "serializer", None)
+        return isinstance(data, ReturnList) and isinstance(
+            serializer, BulkListSerializer
+        )
+
     @classmethod
     def process(cls, response):
         status = getattr(response, "status_code", 200)
 
         if not is_client_error(status):
             return response
-        if not hasattr(response.data, "items"):
+
+        data = response.data
+        # Bulk errors are a list with the errors of each item.
+        if cls.is_bulk_errors(data):
+            data = dict(enumerate(data))
+        if not hasattr(data, "items"):
             return response
 
-        response.data = cls.parse_errors(response.data)
+        response.data = cls.parse_errors(data)
         return response
 
 
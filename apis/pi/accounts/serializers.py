@@ -2,13 +2,17 @@ from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.validators import RegexValidator
 from django.db import transaction
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
 
 from apis.pi import mixins
+from apis.pi.common.serializers import BulkListSerializer
 from apps.accounts.auth.exceptions import AuthError
 from apps.accounts.auth.utils import get_auth_backend
-from apps.accounts.models import Note
+from apps.accounts.cache import expire_users
+from apps.accounts.models import Note, UserSearchKey
+from apps.accounts.search import USER_SEARCH_FIELDS
 from apps.accounts.utils import signup_token
 from apps.common.utils import exec_task, get_object, to_object, unique_id
 
@@ -296,6 +300,11 @@ class ListUserSerializer(mixins.QueryFieldsMixin, serializers.ModelSerializer):
 
     tfa_active = serializers.BooleanField()
 
+    compiled = True
+    projection = {
+        "tfa_active": ("tfa_secret",),
+    }
+
     class Meta:
         model = User
         exclude = (
@@ -439,14 +448,23 @@ class CreateNoteSerializer(serializers.ModelSerializer):
         user = self.context["request"].user
         return user.notes.create(**validated_data)
 
+    def bulk_create(self, validated_data):
+        user = self.context["request"].user
+        return Note.objects.bulk_create(
+            [Note(user=user, **attrs) for attrs in validated_data]
+        )
+
     class Meta:
         model = Note
         fields = ("content",)
+        list_serializer_class = BulkListSerializer
 
 
 class ListNoteSerializer(mixins.QueryFieldsMixin, serializers.ModelSerializer):
     """List note serializer"""
 
+    compiled = True
+
     class Meta:
         model = Note
         fields = (
@@ -472,9 +490,22 @@ class UpdateNoteSerializer(serializers.ModelSerializer):
             )
         return instance
 
+    def bulk_update(self, instances, validated_data):
+        modified = timezone.now()
+        notes = []
+        for instance, attrs in zip(instances, validated_data):
+            content = attrs.get("content", instance.content)
+            if instance.content != content:
+                instance.content = content
+                instance.modified = modified
+                notes.append(instance)
+        Note.objects.bulk_update(notes, ["content", "modified"])
+        return instances
+
     class Meta:
         model = Note
         fields = ("content",)
+        list_serializer_class = BulkListSerializer
 
 
 class CreatePersonSerializer(serializers.ModelSerializer):
@@ -528,17 +559,41 @@ class CreateCommentSerializer(serializers.ModelSerializer):
         )
         return Note.objects.create(**validated_data)
 
+    @transaction.atomic
+    def bulk_create(self, validated_data):
+        users = User.objects.bulk_create(
+            [
+                User(
+                    username=f"user.{unique_id(11)}",
+                    password="...",
+                    is_active=False,
+                    **attrs["user"],
+                )
+                for attrs in validated_data
+            ]
+        )
+        UserSearchKey.update_users(users, adding=True)
+        return Note.objects.bulk_create(
+            [
+                Note(content=attrs["content"], user=user)
+                for attrs, user in zip(validated_data, users)
+            ]
+        )
+
     class Meta:
         model = Note
         fields = (
             "content",
             "user",
         )
+        list_serializer_class = BulkListSerializer
 
 
 class ListCommentSerializer(mixins.QueryFieldsMixin, serializers.ModelSerializer):
     """List comment serializer"""
 
+    compiled = True
+
     user = ListPersonSerializer(many=False)
 
     class Meta:
@@ -572,9 +627,34 @@ class UpdateCommentSerializer(serializers.ModelSerializer):
 
         return instance
 
+    @transaction.atomic
+    def bulk_update(self, instances, validated_data):
+        notes, users, user_fields = [], [], set()
+        for instance, attrs in zip(instances, validated_data):
+            content = attrs.get("content", instance.content)
+            user = attrs.get("user")
+
+            if content != instance.content:
+                instance.content = content
+                notes.append(instance)
+            if user:
+                for field, value in user.items():
+                    setattr(instance.user, field, value)
+                users.append(instance.user)
+                user_fields.update(user)
+
+        Note.objects.bulk_update(notes, ["content"])
+        if users:
+            User.objects.bulk_update(users, user_fields)
+            if USER_SEARCH_FIELDS.intersection(user_fields):
+                UserSearchKey.update_users(users)
+            expire_users(user.pk for user in users)
+        return instances
+
     class Meta:
         model = Note
         fields = (
             "content",
             "user",
         )
+        list_serializer_class = BulkListSerializer
@@ -40,10 +40,12 @@ urlpatterns = [
         "me/passwd/reset", views.ResetPasswordAPIView.as_view(), name="reset_password"
     ),
     path("me/notes", views.NoteAPIView.as_view(), name="note"),
+    path("me/notes/bulk", views.NoteBulkAPIView.as_view(), name="note_bulk"),
     path(
         "me/notes/<b64:note_id>", views.NoteDetailAPIView.as_view(), name="note_detail"
     ),
     path("comments", views.CommentAPIView.as_view(), name="comment"),
+    path("comments/bulk", views.CommentBulkAPIView.as_view(), name="comment_bulk"),
     path(
         "comments/<b64:comment_id>",
         views.CommentDetailAPIView.as_view(),
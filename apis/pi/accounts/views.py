@@ -7,8 +7,8 @@ from rest_framework.exceptions import PermissionDenied
 from rest_framework.parsers import MultiPartParser
 from rest_framework.response import Response
 
-from apis.pi import generics, mixins
-from apis.pi.accounts import filters, serializers
+from apis.pi import generics, mixins, pagination
+from apis.pi.accounts import serializers
 from apis.pi.accounts.mixins import SigninMixin
 from apis.pi.auth import (
     auth_required,
@@ -18,8 +18,10 @@ from apis.pi.auth import (
     signup_token_required,
     staff_required,
 )
-from apis.pi.common.serializers import EmptySerializer
+from apis.pi.common.serializers import BulkDeleteSerializer, EmptySerializer
 from apis.pi.decorators import pi_lock, pi_throttle
+from apps.accounts import filters
+from apps.accounts.cache import expire_users
 from apps.accounts.models import Note
 
 User = get_user_model()
@@ -240,6 +242,8 @@ class UserAPIView(generics.ListCreateAPIView):
     serializer_create_class = serializers.CreateUserSerializer
     serializer_list_class = serializers.ListUserSerializer
     filterset_class = filters.UserFilter
+    pagination_class = pagination.KeysetPagination
+    streaming = True
 
     @staff_required
     @has_perm("accounts.view_user")
@@ -292,6 +296,9 @@ class NoteAPIView(generics.ListCreateAPIView):
     serializer_create_class = serializers.CreateNoteSerializer
     serializer_list_class = serializers.ListNoteSerializer
     filterset_class = filters.NoteFilter
+    pagination_class = pagination.KeysetPagination
+    ordering = ("created", "id")
+    streaming = True
 
     def get_queryset(self):
         queryset = super().get_queryset()
@@ -307,6 +314,40 @@ class NoteAPIView(generics.ListCreateAPIView):
         return super().post(*args, **kwargs)
 
 
+class NoteBulkAPIView(generics.BulkAPIView):
+    """Note bulk api view"""
+
+    queryset = Note.objects.all()
+    serializer_create_class = serializers.CreateNoteSerializer
+    serializer_list_class = serializers.ListNoteSerializer
+    serializer_update_class = serializers.UpdateNoteSerializer
+    serializer_delete_class = BulkDeleteSerializer
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        return queryset.filter(user=self.request.user)
+
+    @pi_lock(name="NoteBulkAPIView.CREATE")
+    @auth_required
+    def post(self, *args, **kwargs):
+        return super().post(*args, **kwargs)
+
+    @pi_lock(name="NoteBulkAPIView.UPDATE")
+    @auth_required
+    def put(self, *args, **kwargs):
+        return super().put(*args, **kwargs)
+
+    @pi_lock(name="NoteBulkAPIView.UPDATE")
+    @auth_required
+    def patch(self, *args, **kwargs):
+        return super().patch(*args, **kwargs)
+
+    @pi_lock(name="NoteBulkAPIView.DELETE")
+    @auth_required
+    def delete(self, *args, **kwargs):
+        return super().delete(*args, **kwargs)
+
+
 class NoteDetailAPIView(generics.RetrieveUpdateDestroyAPIView):
     """Note detail api view"""
 
@@ -352,12 +393,50 @@ class CommentAPIView(generics.ListCreateAPIView):
     serializer_create_class = serializers.CreateCommentSerializer
     serializer_list_class = serializers.ListCommentSerializer
     filterset_class = filters.CommentFilter
+    pagination_class = pagination.KeysetPagination
+    ordering = ("created", "id")
 
     @pi_lock(name="CommentAPIView.CREATE")
     def post(self, *args, **kwargs):
         return super().post(*args, **kwargs)
 
 
+class CommentBulkAPIView(generics.BulkAPIView):
+    """Comment bulk api view"""
+
+    queryset = Note.objects.prefetch_related(
+        Prefetch(
+            "user", queryset=User.objects.only("pk", "email", "first_name", "last_name")
+        )
+    )
+    serializer_create_class = serializers.CreateCommentSerializer
+    serializer_list_class = serializers.ListCommentSerializer
+    serializer_update_class = serializers.UpdateCommentSerializer
+    serializer_delete_class = BulkDeleteSerializer
+
+    @transaction.atomic
+    def perform_bulk_destroy(self, queryset):
+        user_ids = list(queryset.values_list("user_id", flat=True))
+        User.objects.filter(pk__in=user_ids).delete()
+        expire_users(user_ids)
+
+    @pi_lock(name="CommentBulkAPIView.CREATE")
+    def post(self, *args, **kwargs):
+        return super().post(*args, **kwargs)
+
+    @pi_lock(name="CommentBulkAPIView.UPDATE")
+    def put(self, *args, **kwargs):
+        return super().put(*args, **kwargs)
+
+    @pi_lock(name="CommentBulkAPIView.UPDATE")
+    def patch(self, *args, **kwargs):
+        return super().patch(*args, **kwargs)
+
+    @pi_lock(name="CommentBulkAPIView.DELETE")
+    def delete(self, *args, **kwargs):
+        return super().delete(*args, **kwargs)
+
+
 class CommentDetailAPIView(generics.RetrieveUpdateDestroyAPIView):
     """Comment detail api view"""
 
@@ -35,7 +35,7 @@ def has_perm(perm):
 
     def decorator(fn):
         @wraps(fn)
-        @pass_test(lambda ctx: ctx.user.has_perm(perm), message=message)
+        @pass_test(lambda ctx: auth.has_perm(ctx.user, perm), message=message)
         def wrapper(*args, **kwargs):
             return fn(*args, **kwargs)
 
@@ -1,5 +1,6 @@
 from asgiref.sync import async_to_sync
 from channels.layers import get_channel_layer
+from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
 
 from apis.pi import mixins
@@ -16,6 +17,63 @@ class EmptySerializer(serializers.Serializer):
         return instance
 
 
+class BulkListSerializer(serializers.ListSerializer):
+    """Bulk list serializer.
+
+    Items are validated in one pass and saved at once by the child serializer
+    bulk_create(validated_data) and bulk_update(instances, validated_data)
+    methods; updated items are matched to instances by id, once each.
+    """
+
+    default_error_messages = {
+        "not_found": _("Not found."),
+        "duplicate": _("Duplicate id."),
+    }
+
+    def run_validation(self, *args, **kwargs):
+        self.instances = {
+            str(instance.pk): instance for instance in self.instance or ()
+        }
+        self.validated_instances = []
+        self.seen_ids = set()
+        return super().run_validation(*args, **kwargs)
+
+    def run_child_validation(self, data):
+        if self.instance is None:
+            return super().run_child_validation(data)
+
+        pk = str(data.get("id")) if isinstance(data, dict) else None
+        instance = self.instances.get(pk)
+        if instance is None:
+            raise serializers.ValidationError(
+                {"id": [self.error_messages["not_found"]]}, code="not_found"
+            )
+        if pk in self.seen_ids:
+            raise serializers.ValidationError(
+                {"id": [self.error_messages["duplicate"]]}, code="duplicate"
+            )
+        self.seen_ids.add(pk)
+
+        self.child.instance = instance
+        validated = super().run_child_validation(data)
+        self.validated_instances.append(instance)
+        return validated
+
+    def create(self, validated_data):
+        return self.child.bulk_create(validated_data)
+
+    def update(self, instances, validated_data):
+        return self.child.bulk_update(self.validated_instances, validated_data)
+
+
+class BulkDeleteSerializer(serializers.Serializer):
+    """Bulk delete serializer"""
+
+    ids = serializers.ListField(
+        child=serializers.CharField(max_length=22), allow_empty=False, max_length=1000
+    )
+
+
 class ListFruitSerializer(mixins.QueryFieldsMixin, serializers.Serializer):
     """List fruit serializer"""
 
@@ -1,13 +1,12 @@
 from django.conf import settings
-from django.core.cache import cache
 from django.utils import timezone
 from django.views.static import serve
 from rest_framework import status
 
+from apis import datasets
 from apis.pi import generics, pagination
 from apis.pi.common import serializers
 from apis.pi.decorators import pi_throttle
-from apps.common.utils import unique_id
 
 
 class FruitAPIView(generics.ListAPIView):
@@ -18,22 +17,7 @@ class FruitAPIView(generics.ListAPIView):
     pagination_class = pagination.PageNumberPagination
 
     def get_queryset(self):
-        search = self.request.query_params.get("search")
-        fruits = cache.get("fruits")
-        if not fruits:
-            fruits = [
-                {
-                    "id": unique_id(11),
-                    "name": f"Orange {x}",
-                    "type": "citrus",
-                    "created": timezone.now(),
-                }
-                for x in range(1, 1001)
-            ]
-            cache.set("fruits", fruits, None)
-        if search:
-            fruits = [fruit for fruit in fruits if fruit["name"].find(search) != -1]
-        return fruits
+        return datasets.fruits.search(self.request.query_params.get("search"))
 
 
 class LocaltimeAPIView(generics.RetrieveAPIView):
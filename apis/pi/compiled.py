@@ -0,0 +1,170 @@
+from datetime import datetime
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import ISO_8601, fields, relations, serializers
+from rest_framework.settings import api_settings
+from rest_framework.utils.serializer_helpers import ReturnDict, ReturnList
+
+"""
+Fast representation of list serializers.
+
+Serializers setting compiled = True are inspected by get_plan() once per
+requested field set; serialize() then reads each row's attributes and applies
+plain converters, nested serializers included. A serializer with a field that
+can't be reproduced this way, such as a method field, is serialized by DRF.
+"""
+
+# Builtins equal to the representation of these field classes.
+CONVERTERS = (
+    (fields.CharField, str),
+    (fields.IntegerField, int),
+    (fields.BooleanField, bool),
+)
+
+plans = {}
+
+
+def datetime_converter(field):
+    """Get a converter formatting aware datetimes like field does."""
+    output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+    if output_format is None or output_format.lower() != ISO_8601:
+        return field.to_representation
+
+    tz = field.timezone if hasattr(field, "timezone") else field.default_timezone()
+    if tz is None:
+        return field.to_representation
+
+    def convert(value):
+        if not isinstance(value, datetime) or value.tzinfo is None:
+            return field.to_representation(value)
+        value = value.astimezone(tz).isoformat()
+        if value.endswith("+00:00"):
+            value = value[:-6] + "Z"
+        return value
+
+    return convert
+
+
+def field_converter(field):
+    """Get the converter factory of a field, None if it can't be compiled."""
+    if isinstance(field, serializers.BaseSerializer):
+        if isinstance(field, serializers.ListSerializer):
+            return None
+        return lambda field: compile_serializer(field)
+
+    if isinstance(
+        field,
+        (
+            fields.HiddenField,
+            fields.SerializerMethodField,
+            relations.RelatedField,
+            relations.ManyRelatedField,
+        ),
+    ):
+        return None
+
+    method = type(field).to_representation
+    for field_class, converter in CONVERTERS:
+        if method is field_class.to_representation:
+            return lambda field: converter
+    if method is fields.DateTimeField.to_representation:
+        return datetime_converter
+    return lambda field: field.to_representation
+
+
+def get_plan(serializer):
+    """Get the (name, attribute, converter factory) plan of a serializer class.
+
+    Return None when a readable field isn't a plain model attribute.
+    """
+    serializer_class = type(serializer)
+    readable_fields = [
+        field for field in serializer.fields.values() if not field.write_only
+    ]
+    key = (serializer_class, tuple(field.field_name for field in readable_fields))
+    if key in plans:
+        return plans[key]
+
+    plan = []
+    if serializer_class.to_representation is serializers.Serializer.to_representation:
+        model = getattr(getattr(serializer, "Meta", None), "model", None)
+        for field in readable_fields:
+            factory = field_converter(field)
+            if (
+                factory is None
+                or model is None
+                or len(field.source_attrs) != 1
+                or not is_model_attribute(model, field.source)
+            ):
+                plan = None
+                break
+            plan.append((field.field_name, field.source, factory))
+    else:
+        plan = None
+
+    plans[key] = plan
+    return plan
+
+
+def is_model_attribute(model, name):
+    """Check that name is a model field or property, never a method."""
+    opts = model._meta
+    if name == "pk":
+        return True
+    try:
+        field = opts.get_field(name)
+    except FieldDoesNotExist:
+        return isinstance(getattr(model, name, None), property)
+    return field.concrete and not field.many_to_many
+
+
+def compile_serializer(serializer):
+    """Get a row to dict function of a serializer, None if it can't be compiled."""
+    plan = get_plan(serializer)
+    if plan is None:
+        return None
+
+    getters = [
+        (name, attribute, factory(serializer.fields[name]))
+        for name, attribute, factory in plan
+    ]
+    if any(convert is None for _, _, convert in getters):
+        return None
+
+    def to_representation(instance):
+        ret = {}
+        for name, attribute, convert in getters:
+            value = getattr(instance, attribute)
+            ret[name] = None if value is None else convert(value)
+        return ret
+
+    return to_representation
+
+
+def serialize(serializer):
+    """Get data of a serializer through its compiled plan, if it has compiled set."""
+    many = isinstance(serializer, serializers.ListSerializer)
+    child = serializer.child if many else serializer
+    if not getattr(child, "compiled", False) or serializer.instance is None:
+        return serializer.data
+
+    to_representation = compile_serializer(child)
+    if to_representation is None:
+        return serializer.data
+
+    if many:
+        return ReturnList(
+            [to_representation(instance) for instance in serializer.instance],
+            serializer=serializer,
+        )
+    return ReturnDict(to_representation(serializer.instance), serializer=serializer)
+
+
+def row_serializer(serializer):
+    """Get the row to dict function of a list serializer, compiled if possible."""
+    child = serializer.child
+    if getattr(child, "compiled", False):
+        to_representation = compile_serializer(child)
+        if to_representation is not None:
+            return to_representation
+    return child.to_representation
@@ -0,0 +1,17 @@
+from django.core.exceptions import ValidationError
+from django_filters import utils
+from django_filters.rest_framework import DjangoFilterBackend
+
+
+class FilterBackend(DjangoFilterBackend):
+    """Filter backend using the form-less path of compiled filter sets."""
+
+    def filter_queryset(self, request, queryset, view):
+        filterset_class = self.get_filterset_class(view, queryset)
+        if not hasattr(filterset_class, "filter_data"):
+            return super().filter_queryset(request, queryset, view)
+
+        try:
+            return filterset_class.filter_data(request.query_params, queryset)
+        except ValidationError as error:
+            raise utils.translate_validation(error.message_dict)
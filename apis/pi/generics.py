@@ -2,7 +2,7 @@ from rest_framework import generics, serializers, status, views
 from rest_framework.response import Response
 
 from apis.auth import TokenAuth
-from apis.pi import mixins
+from apis.pi import compiled, mixins
 
 """
 Generic views that provide commonly needed behaviour.
@@ -41,12 +41,14 @@ class GenericAPIView(APIView, generics.GenericAPIView):
     def get_response_data(self, serializer):
         """Return the response data."""
         if self.request.method == "GET":
-            return serializer.data
+            return compiled.serialize(serializer)
         if self.serializer_list_class is not None:
             serializer = self.serializer_list_class(
-                serializer.instance, context=serializer.context
+                serializer.instance,
+                many=isinstance(serializer, serializers.ListSerializer),
+                context=serializer.context,
             )
-        return serializer.data
+        return compiled.serialize(serializer)
 
     def get_serializer(self, *args, **kwargs):
         """Return the serializer instance."""
@@ -156,6 +158,27 @@ class RetrieveUpdateDestroyAPIView(
         return self.destroy(request, *args, **kwargs)
 
 
+class BulkAPIView(
+    mixins.BulkCreateModelMixin,
+    mixins.BulkUpdateModelMixin,
+    mixins.BulkDestroyModelMixin,
+    GenericAPIView,
+):
+    """Concrete view for creating, updating or deleting model instances in bulk."""
+
+    def post(self, request, *args, **kwargs):
+        return self.bulk_create(request, *args, **kwargs)
+
+    def put(self, request, *args, **kwargs):
+        return self.bulk_update(request, *args, **kwargs)
+
+    def patch(self, request, *args, **kwargs):
+        return self.partial_bulk_update(request, *args, **kwargs)
+
+    def delete(self, request, *args, **kwargs):
+        return self.bulk_destroy(request, *args, **kwargs)
+
+
 class CustomCreateAPIView(GenericAPIView):
     """Custom create api view."""
 
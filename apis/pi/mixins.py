@@ -1,5 +1,19 @@
+import json
+from functools import partial
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.query import QuerySet
+from django.http import StreamingHttpResponse
+from django.utils.translation import gettext_lazy as _
 from rest_framework import status
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils import encoders
+
+from apis.pi import compiled
+from apps.common import keyset
 
 """
 Basic building blocks for generic class based views.
@@ -21,11 +35,81 @@ class CreateModelMixin:
         serializer.save()
 
 
-class ListModelMixin:
-    """List a queryset."""
+class QuerysetFieldsMixin:
+    """Load only the model fields used by the list serializer."""
+
+    def get_serializer_fields(self):
+        serializer = self.get_serializer()
+        return serializer.fields.values(), getattr(serializer, "projection", {})
+
+    def get_queryset_fields(self, model):
+        """Get model field names to load and relations to prefetch.
+
+        Return None when a serializer field can't be mapped to model fields.
+        """
+        fields, projection = self.get_serializer_fields()
+        only, relations = {model._meta.pk.name}, set()
+
+        ordering = getattr(self, "ordering", None)
+        if ordering:
+            only.update(name for name, _ in keyset.get_ordering(model, ordering))
+
+        for field in fields:
+            if field.source in projection:
+                only.update(projection[field.source])
+                continue
+            if field.source == "*" or "." in field.source:
+                return None
+            try:
+                model_field = model._meta.get_field(field.source)
+            except FieldDoesNotExist:
+                return None
+            if not model_field.concrete or model_field.many_to_many:
+                return None
+
+            only.add(model_field.name)
+            if model_field.is_relation:
+                relations.add(model_field.name)
+        return only, relations
+
+    def project_queryset(self, queryset):
+        if not isinstance(queryset, QuerySet):
+            return queryset
+
+        queryset_fields = self.get_queryset_fields(queryset.model)
+        if queryset_fields is None:
+            return queryset
+
+        only, relations = queryset_fields
+        lookups = queryset._prefetch_related_lookups
+        prefetches = [
+            lookup
+            for lookup in lookups
+            if getattr(lookup, "prefetch_through", lookup).split(LOOKUP_SEP)[0]
+            in relations
+        ]
+        if len(prefetches) != len(lookups):
+            queryset = queryset.prefetch_related(None).prefetch_related(*prefetches)
+        return queryset.only(*only)
+
+
+class ListModelMixin(QuerysetFieldsMixin):
+    """List a queryset, paginated or streamed when streaming is enabled."""
+
+    streaming = False
+    stream_query_param = "stream"
+    stream_chunk_size = 500
+    stream_content_types = {
+        "json": "application/json",
+        "ndjson": "application/x-ndjson",
+    }
 
     def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
+        queryset = self.project_queryset(self.filter_queryset(self.get_queryset()))
+        stream_format = self.get_stream_format(request)
+        if stream_format is not None:
+            return self.stream(queryset, stream_format)
+
         page = self.paginate_queryset(queryset)
 
         if page is not None:
@@ -37,6 +121,58 @@ class ListModelMixin:
         data = self.get_response_data(serializer)
         return Response(data)
 
+    def get_stream_format(self, request):
+        """Get the requested stream format, None to paginate."""
+        if not self.streaming:
+            return None
+        stream_format = request.query_params.get(self.stream_query_param)
+        return stream_format if stream_format in self.stream_content_types else None
+
+    def stream(self, queryset, stream_format):
+        """Stream every row as a JSON array or as newline delimited JSON."""
+        if isinstance(queryset, QuerySet):
+            ordering = getattr(self, "ordering", None)
+            if ordering:
+                queryset = queryset.order_by(
+                    *keyset.get_order_by(keyset.get_ordering(queryset.model, ordering))
+                )
+            rows = queryset.iterator(chunk_size=self.stream_chunk_size)
+        else:
+            rows = queryset
+
+        serializer = self.get_serializer(queryset, many=True)
+        return StreamingHttpResponse(
+            self.stream_content(
+                rows, compiled.row_serializer(serializer), stream_format == "ndjson"
+            ),
+            content_type=self.stream_content_types[stream_format],
+        )
+
+    def stream_content(self, rows, to_representation, ndjson=False):
+        dumps = partial(
+            json.dumps,
+            cls=encoders.JSONEncoder,
+            ensure_ascii=not api_settings.UNICODE_JSON,
+            allow_nan=not api_settings.STRICT_JSON,
+            separators=(",", ":") if api_settings.COMPACT_JSON else None,
+        )
+
+        if not ndjson:
+            yield "["
+        chunk = []
+        for index, row in enumerate(rows):
+            data = dumps(to_representation(row))
+            if ndjson:
+                chunk.append(f"{data}\n")
+            else:
+                chunk.append(f",{data}" if index else data)
+            if len(chunk) >= self.stream_chunk_size:
+                yield "".join(chunk)
+                chunk = []
+        if not ndjson:
+            chunk.append("]")
+        yield "".join(chunk)
+
 
 class RetrieveModelMixin:
     """Retrieve a model instance."""
@@ -100,18 +236,7 @@ class QueryFieldsMixin:
         if not hasattr(request, "query_params"):
             return None
 
-        query_params = request.query_params
-
-        includes = query_params.getlist(self.include_arg_name)
-        include_field_names = {
-            name for names in includes for name in names.split(self.delimiter) if name
-        }
-
-        excludes = query_params.getlist(self.exclude_arg_name)
-        exclude_field_names = {
-            name for names in excludes for name in names.split(self.delimiter) if name
-        }
-
+        include_field_names, exclude_field_names = self.get_query_fields(request)
         if not include_field_names and not exclude_field_names:
             return None
 
@@ -124,6 +249,110 @@ class QueryFieldsMixin:
         for field in fields_to_drop:
             self.fields.pop(field)
 
+    @classmethod
+    def get_query_fields(cls, request):
+        """Get included and excluded field names, parsed once per request."""
+        key = (cls.include_arg_name, cls.exclude_arg_name, cls.delimiter)
+        query_fields = getattr(request, "_query_fields", None)
+        if query_fields is None:
+            query_fields = request._query_fields = {}
+
+        if key not in query_fields:
+            query_params = request.query_params
+            query_fields[key] = tuple(
+                {
+                    name
+                    for names in query_params.getlist(arg_name)
+                    for name in names.split(cls.delimiter)
+                    if name
+                }
+                for arg_name in (cls.include_arg_name, cls.exclude_arg_name)
+            )
+        return query_fields[key]
+
+
+class BulkCreateModelMixin:
+    """Create model instances in bulk."""
+
+    bulk_max_size = 1000
+
+    def bulk_create(self, request, *args, **kwargs):
+        data = self.get_request_data()
+        serializer = self.get_serializer(
+            data=data, many=True, max_length=self.bulk_max_size
+        )
+        serializer.is_valid(raise_exception=True)
+        self.perform_bulk_create(serializer)
+        data = self.get_response_data(serializer)
+        return Response(data, status=status.HTTP_201_CREATED)
+
+    def perform_bulk_create(self, serializer):
+        serializer.save()
+
+
+class BulkUpdateModelMixin:
+    """Update model instances in bulk, matched by the id of each item."""
+
+    bulk_max_size = 1000
+
+    def bulk_update(self, request, *args, **kwargs):
+        partial = kwargs.pop("partial", False)
+        data = self.get_request_data()
+        serializer = self.get_serializer(
+            self.get_bulk_objects(data),
+            data=data,
+            many=True,
+            partial=partial,
+            max_length=self.bulk_max_size,
+        )
+        serializer.is_valid(raise_exception=True)
+        self.perform_bulk_update(serializer)
+        data = self.get_response_data(serializer)
+        return Response(data)
+
+    def partial_bulk_update(self, request, *args, **kwargs):
+        kwargs["partial"] = True
+        return self.bulk_update(request, *args, **kwargs)
+
+    def get_bulk_objects(self, data):
+        """Get the instances of the items in data with a single query."""
+        if not isinstance(data, list) or len(data) > self.bulk_max_size:
+            return []
+        ids = {
+            str(item["id"]) for item in data if isinstance(item, dict) and "id" in item
+        }
+        return list(self.get_queryset().filter(pk__in=ids))
+
+    def perform_bulk_update(self, serializer):
+        serializer.save()
+
+
+class BulkDestroyModelMixin:
+    """Destroy model instances in bulk."""
+
+    bulk_not_found_message = _("Not found.")
+
+    def bulk_destroy(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=self.get_request_data())
+        serializer.is_valid(raise_exception=True)
+        ids = serializer.validated_data["ids"]
+
+        queryset = self.get_queryset().prefetch_related(None).filter(pk__in=ids)
+        found = set(queryset.values_list("pk", flat=True))
+        errors = {
+            index: [self.bulk_not_found_message]
+            for index, pk in enumerate(ids)
+            if pk not in found
+        }
+        if errors:
+            raise ValidationError({"ids": errors})
+
+        self.perform_bulk_destroy(queryset)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    def perform_bulk_destroy(self, queryset):
+        queryset.delete()
+
 
 class RequestUserMixin:
     """Return self.request.user in get_object method."""
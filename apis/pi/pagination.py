@@ -1,4 +1,11 @@
+from django.utils.translation import gettext_lazy as _
 from rest_framework import pagination
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from apps.common import keyset
+from apps.common.counts import count_queryset
 
 
 class PageNumberPagination(pagination.PageNumberPagination):
@@ -27,3 +34,109 @@ class CursorPagination(pagination.CursorPagination):
     page_size_query_param = "limit"
     cursor_query_params = "cursor"
     ordering = "id"
+
+
+class KeysetPagination(pagination.BasePagination):
+    """Keyset pagination on a composite ordering, with an opt-in total count.
+
+    Cursors hold the ordering values of the page edge row; previous page
+    cursors are prefixed with "-".
+    """
+
+    page_size = 10
+    max_page_size = 50
+    page_size_query_param = "limit"
+    cursor_query_param = "cursor"
+    count_query_param = "count"
+    count_mode = None
+    ordering = "id"
+    invalid_cursor_message = _("Invalid cursor")
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        # Links don't repeat the count, it's only needed once.
+        self.base_url = remove_query_param(
+            request.build_absolute_uri(), self.count_query_param
+        )
+        self.page_size = self.get_page_size(request)
+
+        model = queryset.model
+        self.ordering = keyset.get_ordering(
+            model, getattr(view, "ordering", None) or self.ordering
+        )
+
+        cursor = request.query_params.get(self.cursor_query_param, "")
+        self.reverse = cursor.startswith("-")
+        values = None
+        if cursor:
+            values = keyset.cursor_decode(model, self.ordering, cursor.lstrip("-"))
+            if values is None:
+                raise NotFound(self.invalid_cursor_message)
+
+        self.count = None
+        count = request.query_params.get(self.count_query_param, "")
+        if count.lower() in ("1", "true"):
+            self.count = count_queryset(queryset, self.count_mode)
+
+        queryset = queryset.order_by(*keyset.get_order_by(self.ordering, self.reverse))
+        if values:
+            queryset = queryset.filter(
+                keyset.keyset_filter(model, self.ordering, values, self.reverse)
+            )
+
+        page, has_more = keyset.fetch_page(queryset, self.page_size)
+
+        if self.reverse:
+            page.reverse()
+            self.has_next, self.has_previous = bool(values), has_more
+        else:
+            self.has_next, self.has_previous = has_more, bool(values)
+
+        self.page = page
+        return page
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        cursor = keyset.cursor_encode(self.page[-1], self.ordering)
+        return replace_query_param(self.base_url, self.cursor_query_param, cursor)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        cursor = keyset.cursor_encode(self.page[0], self.ordering)
+        return replace_query_param(self.base_url, self.cursor_query_param, f"-{cursor}")
+
+    def get_paginated_response(self, data):
+        response = {}
+        if self.count is not None:
+            response["count"] = self.count
+        response.update(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+        return Response(response)
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "count": {"type": "integer"},
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
@@ -1,6 +1,6 @@
 from apis.ws.auth import auth_required
 from apis.ws.common import consumers
-from apis.ws.common.utils import db_async, ws_data
+from apis.ws.common.utils import db_async
 
 
 class NoteConsumer(consumers.WebSocketConsumer):
@@ -21,4 +21,4 @@ class NoteConsumer(consumers.WebSocketConsumer):
             "content": note.content,
             "created": note.created.isoformat(),
         }
-        await self.send(text_data=ws_data(action="note", data=data))
+        await self.send_data(action="note", data=data)
@@ -6,8 +6,9 @@ from django.contrib.auth.models import AnonymousUser
 from django.core.handlers.wsgi import WSGIRequest
 from django.utils.translation import gettext_lazy as _
 
+from apis import auth
 from apis.auth import TokenAuth, auth_user
-from apis.ws.common.utils import db_async, ws_error
+from apis.ws.common.utils import db_async
 
 UNAUTHORIZED = 4401
 PERMISSION_DENIED = 4403
@@ -61,7 +62,7 @@ def pass_test(fn_test, field="perm", message=_("Permission denied."), close_code
             if not await db_async(fn_test)(ws):
                 if close_code is not None:
                     return await ws.close(code=close_code)
-                return await ws.send(text_data=ws_error(field=field, message=message))
+                return await ws.send_error(field=field, message=message)
             return await fn(ws, *args, **kwargs)
 
         return wrapper
@@ -77,7 +78,7 @@ def has_perm(perm):
 
     def decorator(fn):
         @wraps(fn)
-        @pass_test(lambda ws: ws.ctx.user.has_perm(perm), message=message)
+        @pass_test(lambda ws: auth.has_perm(ws.ctx.user, perm), message=message)
         async def wrapper(*args, **kwargs):
             return await fn(*args, **kwargs)
 
@@ -0,0 +1,102 @@
+import asyncio
+import logging
+from functools import partial
+
+from django.conf import settings
+
+from apis.ws.common.utils import ws_frames
+
+"""
+Room broadcasting.
+
+Messages sent to a group by the consumers of a process are coalesced for a
+short window into a batch, encoded once per frame format and sent to the group
+with a single group_send; every member then writes the frame of its format to
+its socket as is.
+
+Batches are kept per event loop, a batch whose flush failed or was cancelled
+is dropped with it.
+"""
+
+logger = logging.getLogger(__name__)
+
+
+class Batch:
+    """Pending messages of a group."""
+
+    def __init__(self, channel_layer):
+        self.channel_layer = channel_layer
+        self.messages = []
+
+
+class Broadcaster:
+    """Coalesce group messages into batched, pre-encoded group events."""
+
+    def __init__(self, action, event_type, window=None, max_size=None):
+        self.action = action
+        self.event_type = event_type
+        self.window = window
+        self.max_size = max_size
+        self.batches = {}
+        self.tasks = set()
+
+    def get_window(self):
+        if self.window is None:
+            return settings.CHANNELS_BATCH_WINDOW / 1000
+        return self.window
+
+    def get_max_size(self):
+        if self.max_size is None:
+            return settings.CHANNELS_BATCH_SIZE
+        return self.max_size
+
+    def encode(self, messages):
+        """Get the frames of a batch, a lone message keeps its own frame."""
+        if len(messages) == 1:
+            return ws_frames(action=self.action, data=messages[0])
+        return ws_frames(action=f"{self.action}.batch", data=messages)
+
+    async def send(self, channel_layer, group, message):
+        """Add message to the pending batch of group."""
+        key = (asyncio.get_running_loop(), group)
+        batch = self.batches.get(key)
+        if batch is None:
+            batch = self.batches[key] = Batch(channel_layer)
+            task = asyncio.create_task(self.flush_later(key, batch))
+            self.tasks.add(task)
+            task.add_done_callback(partial(self.flush_done, key, batch))
+
+        batch.messages.append(message)
+        if len(batch.messages) >= self.get_max_size():
+            await self.flush(key, batch)
+
+    async def flush_later(self, key, batch):
+        await asyncio.sleep(self.get_window())
+        await self.flush(key, batch)
+
+    def flush_done(self, key, batch, task):
+        """Drop the batch of a cancelled or failed flush, logging the failure."""
+        self.tasks.discard(task)
+        if self.batches.get(key) is batch:
+            del self.batches[key]
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(
+                "Failed to send a batch to %s", key[1], exc_info=task.exception()
+            )
+
+    async def flush(self, key, batch):
+        """Send batch to its group, unless it was already sent."""
+        if self.batches.get(key) is not batch:
+            return
+        del self.batches[key]
+        group = key[1]
+        await batch.channel_layer.group_send(
+            group,
+            {
+                "type": self.event_type,
+                **self.encode(batch.messages),
+            },
+        )
+
+
+rooms = Broadcaster("room", "room.batch")
@@ -1,7 +1,45 @@
-from channels.generic.websocket import AsyncWebsocketConsumer as WebSocketConsumer
+from channels.generic.websocket import AsyncWebsocketConsumer
 
 from apis.ws.auth import ctx
-from apis.ws.common.utils import ws_data
+from apis.ws.common.broadcast import rooms
+from apis.ws.common.utils import BINARY_SUBPROTOCOL, msgpack, ws_data, ws_error
+
+
+class WebSocketConsumer(AsyncWebsocketConsumer):
+    """WebSocket consumer sending msgpack binary frames to clients asking for them."""
+
+    binary = False
+
+    async def accept(self, subprotocol=None, headers=None):
+        if (
+            subprotocol is None
+            and msgpack is not None
+            and BINARY_SUBPROTOCOL in self.scope.get("subprotocols", ())
+        ):
+            subprotocol = BINARY_SUBPROTOCOL
+        self.binary = subprotocol == BINARY_SUBPROTOCOL
+        await super().accept(subprotocol, headers)
+
+    async def send_data(self, action=None, data=None):
+        """Send data in the negotiated frame format."""
+        if self.binary:
+            await self.send(bytes_data=ws_data(action, data, binary=True))
+        else:
+            await self.send(text_data=ws_data(action, data))
+
+    async def send_error(self, action=None, field=None, message=""):
+        """Send error in the negotiated frame format."""
+        if self.binary:
+            await self.send(bytes_data=ws_error(action, field, message, binary=True))
+        else:
+            await self.send(text_data=ws_error(action, field, message))
+
+    async def send_frames(self, frames):
+        """Send the pre-encoded frame of the negotiated format as is."""
+        if self.binary and "bytes_data" in frames:
+            await self.send(bytes_data=frames["bytes_data"])
+        else:
+            await self.send(text_data=frames["text_data"])
 
 
 class NotFoundConsumer(WebSocketConsumer):
@@ -27,20 +65,22 @@ class ChatConsumer(WebSocketConsumer):
         await self.channel_layer.group_discard(self.room_name, self.channel_name)
 
     async def receive(self, text_data=None, bytes_data=None):
-        await self.channel_layer.group_send(
-            self.room_name,
-            {
-                "type": "room.message",
-                "text_data": text_data,
-            },
-        )
+        data = {
+            "user": str(self.ctx.user),
+            "message": text_data,
+        }
+        await rooms.send(self.channel_layer, self.room_name, data)
+
+    async def room_batch(self, event):
+        await self.send_frames(event)
 
     async def room_message(self, event):
+        # Event of processes running the previous release, remove in the next.
         data = {
             "user": str(self.ctx.user),
             "message": event.get("text_data"),
         }
-        await self.send(text_data=ws_data(action="room", data=data))
+        await self.send_data(action="room", data=data)
 
 
 class EchoConsumer(WebSocketConsumer):
@@ -58,4 +98,4 @@ class EchoConsumer(WebSocketConsumer):
             "user": str(self.ctx.user),
             "message": text_data,
         }
-        await self.send(text_data=ws_data(action="echo", data=data))
+        await self.send_data(action="echo", data=data)
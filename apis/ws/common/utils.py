@@ -2,26 +2,44 @@ import json
 
 from channels.db import database_sync_to_async as db_async  # noqa
 
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
 
-def ws_response(action=None, data=None, error=None):
-    """Get JSON response data."""
+# Subprotocol a client requests at connect to get msgpack binary frames.
+BINARY_SUBPROTOCOL = "msgpack"
+
+
+def ws_response(action=None, data=None, error=None, binary=False):
+    """Get JSON response data, msgpack bytes if binary."""
     data = {
         "action": action,
         "data": data,
         "error": error,
     }
+    if binary:
+        return msgpack.packb(data)
     return json.dumps(data, ensure_ascii=False)
 
 
-def ws_data(action=None, data=None):
+def ws_data(action=None, data=None, binary=False):
     """Get JSON data."""
-    return ws_response(action, data=data)
+    return ws_response(action, data=data, binary=binary)
 
 
-def ws_error(action=None, field=None, message=""):
+def ws_error(action=None, field=None, message="", binary=False):
     """Get JSON error."""
     error = {
         "field": field,
         "message": str(message),
     }
-    return ws_response(action, error=error)
+    return ws_response(action, error=error, binary=binary)
+
+
+def ws_frames(action=None, data=None):
+    """Get the text and, if msgpack is installed, binary frames of data."""
+    frames = {"text_data": ws_data(action, data)}
+    if msgpack is not None:
+        frames["bytes_data"] = ws_data(action, data, binary=True)
+    return frames
@@ -0,0 +1,113 @@
+from functools import partial
+
+from django.conf import settings
+from django.contrib.auth.models import Permission
+from django.db import router, transaction
+from django.db.models import Q
+
+from apps.common.cache import TieredCache
+from apps.common.utils import get_object
+
+# Fields left out of the snapshot, loaded from the database on access.
+snapshot_exclude = ("password",)
+
+# Local records are revalidated on every hit, with a single cache get, so a
+# user expired by another process is never authenticated from a stale copy.
+user_cache = TieredCache(
+    "accounts:user",
+    settings.AUTH_CACHE_SIZE,
+    0,
+    settings.AUTH_SHARED_CACHE_TIMEOUT,
+)
+
+
+def user_snapshot(user):
+    """Get user snapshot as field names and values."""
+    deferred = user.get_deferred_fields()
+    fields = [
+        f
+        for f in user._meta.concrete_fields
+        if f.attname not in deferred and f.attname not in snapshot_exclude
+    ]
+    return (
+        tuple(f.attname for f in fields),
+        tuple(f.get_prep_value(getattr(user, f.attname)) for f in fields),
+    )
+
+
+def user_perms(user):
+    """Get user effective permissions in a single query."""
+    if not user.is_active:
+        return frozenset()
+
+    queryset = Permission.objects.all()
+    if not user.is_superuser:
+        queryset = queryset.filter(Q(user=user) | Q(group__user=user))
+    perms = queryset.values_list("content_type__app_label", "codename").distinct()
+    return frozenset("%s.%s" % perm for perm in perms)
+
+
+def user_record(model, pk):
+    """Get user record from the database."""
+    user = get_object(model._default_manager.defer(*snapshot_exclude), pk=pk)
+    if not user:
+        return None
+    return {
+        "snapshot": user_snapshot(user),
+        "perms": user_perms(user),
+    }
+
+
+def user_from_record(model, record):
+    """Get user instance from record."""
+    names, values = record["snapshot"]
+    user = model.from_db(router.db_for_read(model), names, values)
+    user._perm_cache = set(record["perms"])
+    return user
+
+
+def get_record(model, pk):
+    """Get user record from the local cache, the shared cache or the database."""
+    if not settings.AUTH_SHARED_CACHE:
+        return user_record(model, pk)
+    return user_cache.get_or_set(pk, partial(user_record, model, pk))
+
+
+def get_user(model, pk):
+    """Get user from cache or the database."""
+    if pk is None:
+        return None
+
+    record = get_record(model, pk)
+    if record is None:
+        return None
+    return user_from_record(model, record)
+
+
+def get_user_perms(user):
+    """Get user permissions from its precomputed permission set."""
+    perms = getattr(user, "_perm_cache", None)
+    if perms is None:
+        record = get_record(type(user), user.pk)
+        perms = user._perm_cache = set(record["perms"] if record else ())
+    return perms
+
+
+def expire_user(pk, using=None):
+    """Expire cached user once the current transaction commits."""
+    expire_users((pk,), using)
+
+
+def expire_users(pks, using=None):
+    """Expire cached users once the current transaction commits.
+
+    Expiring them earlier would let other processes cache the rows they read
+    before the commit again.
+    """
+    transaction.on_commit(partial(delete_users, list(pks)), using=using)
+
+
+def delete_users(pks):
+    """Delete cached users."""
+    for pk in pks:
+        user_cache.delete(pk)
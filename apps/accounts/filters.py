@@ -0,0 +1,56 @@
+import django_filters as filters
+from django.contrib.auth import get_user_model
+from django.db.models import Q
+
+from apps.accounts.models import Note
+from apps.accounts.search import note_search_q, user_search_q
+from apps.common.filters import FilterSet
+
+
+class UserFilter(FilterSet):
+    """User filter."""
+
+    search = filters.CharFilter(method="filter_search")
+
+    @classmethod
+    def filter_search(cls, queryset, name, value):
+        if len(value) < 3:
+            return Q()
+        return user_search_q(queryset, value)
+
+    class Meta:
+        model = get_user_model()
+        fields = []
+
+
+class NoteFilter(FilterSet):
+    """Note filter."""
+
+    search = filters.CharFilter(method="filter_search")
+
+    @classmethod
+    def filter_search(cls, queryset, name, value):
+        return note_search_q(value)
+
+    class Meta:
+        model = Note
+        fields = []
+
+
+class CommentFilter(FilterSet):
+    """Comment filter."""
+
+    search = filters.CharFilter(method="filter_search")
+
+    @classmethod
+    def filter_search(cls, queryset, name, value):
+        return (
+            note_search_q(value)
+            | Q(user__email__icontains=value)
+            | Q(user__first_name__icontains=value)
+            | Q(user__last_name__icontains=value)
+        )
+
+    class Meta:
+        model = Note
+        fields = []
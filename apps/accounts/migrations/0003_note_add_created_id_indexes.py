@@ -0,0 +1,25 @@
+# Generated by Django 5.0.6 on 2026-10-18 16:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0002_user_add_tfa_secret_and_tfa_last_code"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="note",
+            index=models.Index(
+                fields=["created", "id"], name="accounts_note_created_id"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="note",
+            index=models.Index(
+                fields=["user", "created", "id"], name="accounts_note_user_created_id"
+            ),
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.0.6 on 2026-10-18 17:18
+
+from django.db import migrations, models
+
+
+def search_document(*values):
+    return " ".join(value for value in values if value).lower()
+
+
+def fill_search(apps, schema_editor):
+    Note = apps.get_model("accounts", "Note")
+    manager = Note.objects.using(schema_editor.connection.alias)
+    notes = []
+    for note in manager.only("id", "content").iterator(chunk_size=1000):
+        note.search = search_document(note.content)
+        notes.append(note)
+        if len(notes) == 1000:
+            manager.bulk_update(notes, ["search"])
+            notes = []
+    manager.bulk_update(notes, ["search"])
+
+
+def create_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS accounts_note_search_trgm "
+        "ON accounts_note USING gin (search gin_trgm_ops)"
+    )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS accounts_note_search_trgm")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0003_note_add_created_id_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="note",
+            name="search",
+            field=models.TextField(default="", editable=False, verbose_name="search"),
+        ),
+        migrations.RunPython(fill_search, migrations.RunPython.noop),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
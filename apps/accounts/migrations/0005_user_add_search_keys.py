@@ -0,0 +1,87 @@
+# Generated by Django 5.0.6 on 2026-10-18 17:19
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+import apps.common.defaults
+
+USER_SEARCH_FIELDS = (
+    "username",
+    "email",
+    "phone",
+    "first_name",
+    "middle_name",
+    "last_name",
+)
+
+
+def search_document(*values):
+    return " ".join(value for value in values if value).lower()
+
+
+def user_search_keys(user):
+    return {search_document(getattr(user, name)) for name in USER_SEARCH_FIELDS} - {""}
+
+
+def fill_search_keys(apps, schema_editor):
+    User = apps.get_model("accounts", "User")
+    UserSearchKey = apps.get_model("accounts", "UserSearchKey")
+    alias = schema_editor.connection.alias
+    users = User.objects.using(alias).only("id", *USER_SEARCH_FIELDS)
+    keys = []
+    for user in users.iterator(chunk_size=1000):
+        keys.extend(UserSearchKey(user=user, key=key) for key in user_search_keys(user))
+        if len(keys) >= 1000:
+            UserSearchKey.objects.using(alias).bulk_create(keys)
+            keys = []
+    UserSearchKey.objects.using(alias).bulk_create(keys)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0004_note_add_search"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UserSearchKey",
+            fields=[
+                (
+                    "id",
+                    models.CharField(
+                        default=apps.common.defaults.b64_id,
+                        editable=False,
+                        max_length=22,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("key", models.CharField(max_length=254, verbose_name="key")),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="user",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "user search key",
+                "verbose_name_plural": "user search keys",
+                "db_table": "accounts_user_search_keys",
+                "indexes": [
+                    models.Index(
+                        fields=["key"],
+                        name="accounts_user_search_key",
+                        opclasses=["varchar_pattern_ops"],
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(fill_search_keys, migrations.RunPython.noop),
+    ]
@@ -10,6 +10,12 @@ from django.db import models
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+from apps.accounts.cache import expire_user
+from apps.accounts.search import (
+    USER_SEARCH_FIELDS,
+    search_document,
+    user_search_keys,
+)
 from apps.accounts.utils import auth_refresh_token, auth_token, passwd_token
 from apps.common.models import Model
 from apps.common.validators import FileSizeValidator
@@ -65,6 +71,75 @@ class UserPermission(Model):
         unique_together = (("user", "permission"),)
 
 
+class UserSearchKey(Model):
+    """User search key model, a normalized value of a user searched by prefix"""
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        related_name="+",
+        on_delete=models.CASCADE,
+        verbose_name=_("user"),
+    )
+    key = models.CharField(max_length=254, verbose_name=_("key"))
+
+    @classmethod
+    def update_users(cls, users, using=None, adding=False):
+        """Replace the search keys of users written in bulk."""
+        cls.load_search_fields(users, using)
+        manager = cls._default_manager.db_manager(using)
+        if not adding:
+            manager.filter(user__in=[user.pk for user in users]).delete()
+        keys = []
+        for user in users:
+            user._search_keys = user_search_keys(user)
+            keys.extend(cls(user=user, key=key) for key in user._search_keys)
+        manager.bulk_create(keys)
+
+    @staticmethod
+    def load_search_fields(users, using=None):
+        """Load the deferred search fields of users with a single query."""
+        deferred = [
+            user for user in users if USER_SEARCH_FIELDS & user.get_deferred_fields()
+        ]
+        if not deferred:
+            return
+        model = type(deferred[0])
+        rows = model._default_manager.db_manager(using).filter(
+            pk__in=[user.pk for user in deferred]
+        )
+        rows = {row.pk: row for row in rows.only(*USER_SEARCH_FIELDS)}
+        for user in deferred:
+            row = rows.get(user.pk)
+            for name in USER_SEARCH_FIELDS & user.get_deferred_fields():
+                setattr(user, name, getattr(row, name, ""))
+
+    @classmethod
+    def update_user(cls, user, loaded=None, using=None):
+        """Write the search keys of a user changed since loaded, None if unknown."""
+        keys = user_search_keys(user)
+        manager = cls._default_manager.db_manager(using)
+        if loaded is None:
+            manager.filter(user=user.pk).delete()
+            loaded = set()
+        elif loaded - keys:
+            manager.filter(user=user.pk, key__in=loaded - keys).delete()
+        if keys - loaded:
+            manager.bulk_create([cls(user=user, key=key) for key in keys - loaded])
+        return keys
+
+    class Meta:
+        db_table = "accounts_user_search_keys"
+        verbose_name = _("user search key")
+        verbose_name_plural = _("user search keys")
+        indexes = [
+            models.Index(
+                fields=["key"],
+                name="accounts_user_search_key",
+                opclasses=["varchar_pattern_ops"],
+            ),
+        ]
+
+
 class User(Model, AbstractUser):
     """User model"""
 
@@ -141,6 +216,9 @@ class User(Model, AbstractUser):
         max_length=6, blank=True, verbose_name=_("TFA last code")
     )
 
+    # Search keys as stored, None when unknown.
+    _search_keys = None
+
     USERNAME_FIELD = "username"
     EMAIL_FIELD = "email"
     REQUIRED_FIELDS = ["email"]
@@ -219,6 +297,28 @@ class User(Model, AbstractUser):
         if commit:
             self.save(update_fields=["last_login"])
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        user = super().from_db(db, field_names, values)
+        if USER_SEARCH_FIELDS.issubset(field_names):
+            user._search_keys = user_search_keys(user)
+        return user
+
+    def save(self, *args, **kwargs):
+        loaded = set() if self._state.adding else self._search_keys
+        super().save(*args, **kwargs)
+        using = kwargs.get("using") or self._state.db
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or USER_SEARCH_FIELDS.intersection(update_fields):
+            self._search_keys = UserSearchKey.update_user(self, loaded, using=using)
+        expire_user(self.pk, using)
+
+    def delete(self, *args, **kwargs):
+        pk, using = self.pk, kwargs.get("using") or self._state.db
+        result = super().delete(*args, **kwargs)
+        expire_user(pk, using)
+        return result
+
     @property
     def rnd(self):
         return int(self.renewed.timestamp())
@@ -233,6 +333,25 @@ class User(Model, AbstractUser):
         ordering = ("pk",)
 
 
+class NoteQuerySet(models.QuerySet):
+    """Note queryset keeping the search column of bulk writes."""
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = list(objs)
+        for obj in objs:
+            obj.search = search_document(obj.content)
+        return super().bulk_create(objs, *args, **kwargs)
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        if "content" not in fields:
+            return super().bulk_update(objs, fields, *args, **kwargs)
+
+        objs = list(objs)
+        for obj in objs:
+            obj.search = search_document(obj.content)
+        return super().bulk_update(objs, [*fields, "search"], *args, **kwargs)
+
+
 class Note(Model):
     """Note model"""
 
@@ -244,10 +363,21 @@ class Note(Model):
     )
 
     content = models.TextField(max_length=500, verbose_name=_("content"))
+    search = models.TextField(default="", editable=False, verbose_name=_("search"))
 
     created = models.DateTimeField(auto_now_add=True, verbose_name=_("created"))
     modified = models.DateTimeField(auto_now=True, verbose_name=_("modified"))
 
+    objects = NoteQuerySet.as_manager()
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "content" in update_fields:
+            self.search = search_document(self.content)
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "search"}
+        super().save(*args, **kwargs)
+
     @property
     def short_content(self):
         if len(self.content) > 30:
@@ -259,3 +389,9 @@ class Note(Model):
         verbose_name = _("note")
         verbose_name_plural = _("notes")
         ordering = ("pk",)
+        indexes = [
+            models.Index(fields=["created", "id"], name="accounts_note_created_id"),
+            models.Index(
+                fields=["user", "created", "id"], name="accounts_note_user_created_id"
+            ),
+        ]
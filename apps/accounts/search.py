@@ -0,0 +1,52 @@
+from django.db.models import Q
+
+"""
+Note and user search.
+
+Notes keep a normalized copy of their content in the search column, matched
+with LIKE; on PostgreSQL a pg_trgm GIN index (see migration 0004) serves it.
+
+Users keep a row per normalized search field value in UserSearchKey, indexed
+for prefix lookups, so a search is a single index range scan.
+"""
+
+USER_SEARCH_FIELDS = frozenset(
+    ("username", "email", "phone", "first_name", "middle_name", "last_name")
+)
+
+
+def search_document(*values):
+    """Get the normalized search text of values."""
+    return " ".join(value for value in values if value).lower()
+
+
+def user_search_keys(user):
+    """Get the normalized search keys of a user."""
+    return {
+        search_document(getattr(user, name)) for name in sorted(USER_SEARCH_FIELDS)
+    } - {""}
+
+
+def user_search_q(queryset, value):
+    """Get the Q object matching users with a search field starting with value."""
+    from apps.accounts.models import UserSearchKey
+
+    keys = UserSearchKey.objects.using(queryset.db).filter(
+        key__startswith=search_document(value)
+    )
+    return Q(pk__in=keys.values("user"))
+
+
+def search_users(queryset, value):
+    """Filter users with a search field starting with value."""
+    return queryset.filter(user_search_q(queryset, value))
+
+
+def note_search_q(value):
+    """Get the Q object matching notes whose search column contains value."""
+    return Q(search__contains=search_document(value))
+
+
+def search_notes(queryset, value):
+    """Filter notes containing value."""
+    return queryset.filter(note_search_q(value))
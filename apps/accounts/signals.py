@@ -0,0 +1,67 @@
+from django.contrib.auth.models import Group
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from apps.accounts.cache import expire_user, expire_users
+from apps.accounts.models import UserGroup, UserPermission
+
+
+@receiver(post_save, sender=UserGroup)
+@receiver(post_delete, sender=UserGroup)
+@receiver(post_save, sender=UserPermission)
+@receiver(post_delete, sender=UserPermission)
+def user_membership_saved(sender, instance, using, **kwargs):
+    """Expire the cached user when a group or permission membership changes."""
+    expire_user(instance.user_id, using)
+
+
+@receiver(m2m_changed, sender=UserGroup)
+@receiver(m2m_changed, sender=UserPermission)
+def user_membership_changed(sender, instance, action, reverse, pk_set, using, **kwargs):
+    """Expire the cached users when groups or permissions are (un)assigned."""
+    if not reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            expire_user(instance.pk, using)
+        return
+
+    if action == "pre_clear":
+        field = "group" if sender is UserGroup else "permission"
+        instance._cleared_user_ids = list(
+            sender.objects.filter(**{field: instance}).values_list("user_id", flat=True)
+        )
+    elif action == "post_clear":
+        expire_users(getattr(instance, "_cleared_user_ids", ()), using)
+    elif action in ("post_add", "post_remove"):
+        expire_users(pk_set or (), using)
+
+
+@receiver(m2m_changed, sender=Group.permissions.through)
+def group_permissions_changed(
+    sender, instance, action, reverse, pk_set, using, **kwargs
+):
+    """Expire the cached users of the groups whose permissions changed."""
+    if reverse and action == "pre_clear":
+        instance._cleared_group_ids = list(
+            sender.objects.filter(permission=instance).values_list(
+                "group_id", flat=True
+            )
+        )
+        return
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+
+    if not reverse:
+        groups = (instance.pk,)
+    elif action == "post_clear":
+        groups = getattr(instance, "_cleared_group_ids", ())
+    else:
+        groups = pk_set
+    if not groups:
+        return
+    expire_users(
+        UserGroup.objects.using(using)
+        .filter(group__in=groups)
+        .values_list("user_id", flat=True)
+        .distinct(),
+        using,
+    )
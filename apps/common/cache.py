@@ -0,0 +1,175 @@
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+
+from django.core.cache import cache
+
+DEFAULT_TIMEOUT = object()
+
+
+class LRUCache:
+    """Process-local LRU cache with per-entry timeout."""
+
+    def __init__(self, maxsize=1024, timeout=None):
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self._data = OrderedDict()
+        self._lock = Lock()
+
+    def get_expiry(self, timeout=DEFAULT_TIMEOUT):
+        if timeout is DEFAULT_TIMEOUT:
+            timeout = self.timeout
+        if timeout is None:
+            return None
+        return monotonic() + timeout
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+
+            value, expiry = entry
+            if expiry is not None and expiry <= monotonic():
+                del self._data[key]
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT):
+        if self.maxsize <= 0:
+            return
+        expiry = self.get_expiry(timeout)
+
+        with self._lock:
+            self._data[key] = (value, expiry)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            return self._data.pop(key, None) is not None
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key):
+        return self.get(key, DEFAULT_TIMEOUT) is not DEFAULT_TIMEOUT
+
+    def __len__(self):
+        return len(self._data)
+
+
+class TieredCache:
+    """Process-local LRU cache in front of the shared django cache.
+
+    Local entries are trusted for local_timeout seconds, then revalidated
+    against the key generation kept in the shared cache, which delete() bumps
+    so every process drops its stale copy; a local_timeout of 0 revalidates
+    on every hit. Values are only fetched and
+    deserialized again when their generation changed.
+    """
+
+    def __init__(
+        self, prefix, maxsize=1024, local_timeout=60, timeout=None, prepare=None
+    ):
+        self.prefix = prefix
+        self.local = LRUCache(maxsize)
+        self.local_timeout = local_timeout
+        self.timeout = timeout
+        self.prepare = prepare
+
+    def make_key(self, key):
+        return f"{self.prefix}:{key}"
+
+    def make_generation_key(self, key):
+        return f"{self.prefix}:{key}:generation"
+
+    def get_generation(self, key):
+        return cache.get(self.make_generation_key(key), 0)
+
+    def set_local(self, key, value, generation):
+        if self.prepare is not None:
+            value = self.prepare(value)
+        self.local.set(key, (value, generation, monotonic() + self.local_timeout))
+        return value
+
+    def get_local(self, key):
+        """Get local value, revalidating it once its local timeout is over."""
+        entry = self.local.get(key)
+        if entry is None:
+            return None
+
+        value, generation, expiry = entry
+        if expiry <= monotonic():
+            if self.get_generation(key) != generation:
+                self.local.delete(key)
+                return None
+            self.local.set(key, (value, generation, monotonic() + self.local_timeout))
+        return entry
+
+    def get_shared(self, key):
+        """Get shared value and the current key generation."""
+        data_key, generation_key = self.make_key(key), self.make_generation_key(key)
+        values = cache.get_many([data_key, generation_key])
+        data = values.get(data_key)
+        generation = values.get(generation_key, 0)
+
+        if data is None or data[0] != generation:
+            return None, generation
+        return data, generation
+
+    def get(self, key, default=None):
+        entry = self.get_local(key)
+        if entry is not None:
+            return entry[0]
+
+        data, generation = self.get_shared(key)
+        if data is None:
+            return default
+        return self.set_local(key, data[1], generation)
+
+    def get_or_set(self, key, default, timeout=DEFAULT_TIMEOUT):
+        """Get value, setting it from the default callable on a miss."""
+        entry = self.get_local(key)
+        if entry is not None:
+            return entry[0]
+
+        data, generation = self.get_shared(key)
+        if data is not None:
+            return self.set_local(key, data[1], generation)
+
+        value = default()
+        if value is None:
+            return None
+        return self.set_shared(key, value, generation, timeout)
+
+    def set_shared(self, key, value, generation, timeout=DEFAULT_TIMEOUT):
+        if timeout is DEFAULT_TIMEOUT:
+            timeout = self.timeout
+        cache.set(self.make_key(key), (generation, value), timeout)
+        return self.set_local(key, value, generation)
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT):
+        self.set_shared(key, value, self.get_generation(key), timeout)
+
+    def delete(self, key):
+        """Delete value and bump its generation to expire other local copies."""
+        self.local.delete(key)
+        cache.delete(self.make_key(key))
+
+        generation_key = self.make_generation_key(key)
+        cache.add(generation_key, 0, None)
+        try:
+            cache.incr(generation_key)
+        except ValueError:
+            pass
+
+    def clear_local(self):
+        self.local.clear()
+
+    def __contains__(self, key):
+        return key in self.local
@@ -0,0 +1,73 @@
+from hashlib import sha256
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.db import connections
+
+COUNT_MODES = (
+    "exact",
+    "cached",
+    "estimated",
+)
+
+# Estimates below this may be stale, they fall back to the cached count.
+ESTIMATE_THRESHOLD = 10000
+
+
+def count_cache_key(queryset):
+    sql, params = queryset.query.sql_with_params()
+    digest = sha256(f"{queryset.db}:{sql}:{params!r}".encode()).hexdigest()
+    return f"count:{digest}"
+
+
+def estimate_count(queryset):
+    """Get the planner row estimate of an unfiltered PostgreSQL table."""
+    query = queryset.query
+    connection = connections[queryset.db]
+    if (
+        connection.vendor != "postgresql"
+        or query.where
+        or query.distinct
+        or query.is_sliced
+        or query.combinator
+    ):
+        return None
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+            [queryset.model._meta.db_table],
+        )
+        row = cursor.fetchone()
+    if not row or row[0] < ESTIMATE_THRESHOLD:
+        return None
+    return row[0]
+
+
+def cached_count(queryset, timeout=None):
+    """Get queryset count from cache, counting it on a miss."""
+    if timeout is None:
+        timeout = settings.DB_COUNT_TIMEOUT
+
+    try:
+        key = count_cache_key(queryset)
+    except EmptyResultSet:
+        return 0
+    count = cache.get(key)
+    if count is None:
+        count = queryset.count()
+        cache.set(key, count, timeout)
+    return count
+
+
+def count_queryset(queryset, mode=None, timeout=None):
+    """Count queryset rows exactly, from cache or with a planner estimate."""
+    mode = mode or settings.DB_COUNT_MODE
+    if mode == "estimated":
+        count = estimate_count(queryset)
+        if count is not None:
+            return count
+    if mode in ("cached", "estimated"):
+        return cached_count(queryset, timeout)
+    return queryset.count()
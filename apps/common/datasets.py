@@ -0,0 +1,164 @@
+from collections.abc import Sequence
+
+from apps.common.cache import TieredCache
+
+
+def get_value(item, field):
+    if isinstance(item, dict):
+        return item.get(field)
+    return getattr(item, field, None)
+
+
+class IndexedList(Sequence):
+    """Immutable list with a hash index of item positions by a key field."""
+
+    def __init__(self, items, key="id"):
+        self.items = tuple(items)
+        self.key = key
+        self.positions = {
+            str(get_value(item, key)): position
+            for position, item in enumerate(self.items)
+        }
+        self._reversed = None
+
+    def __len__(self):
+        return len(self.items)
+
+    def __getitem__(self, index):
+        return self.items[index]
+
+    def position(self, value):
+        """Get the position of the item with the given key value."""
+        return self.positions.get(str(value))
+
+    def reversed(self):
+        """Get a reversed view of the list, sharing its items and index."""
+        if self._reversed is None:
+            self._reversed = ReversedList(self)
+        return self._reversed
+
+
+class ReversedList(Sequence):
+    """Reversed view of an indexed list."""
+
+    def __init__(self, items):
+        self.items = items
+        self.key = items.key
+
+    def __len__(self):
+        return len(self.items)
+
+    def __getitem__(self, index):
+        size = len(self.items)
+        if isinstance(index, slice):
+            return [self.items[size - 1 - i] for i in range(*index.indices(size))]
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("list index out of range")
+        return self.items[size - 1 - index]
+
+    def position(self, value):
+        position = self.items.position(value)
+        if position is None:
+            return None
+        return len(self.items) - 1 - position
+
+    def reversed(self):
+        return self.items
+
+
+class NgramIndex:
+    """Substring search index of item fields, by n-grams up to size n."""
+
+    def __init__(self, items, fields, n=3):
+        self.n = n
+        self.fields = fields
+        self.grams = {}
+
+        for position, item in enumerate(items):
+            for field in fields:
+                value = get_value(item, field)
+                if not isinstance(value, str):
+                    continue
+                for gram in self.get_grams(value):
+                    positions = self.grams.setdefault(gram, [])
+                    if not positions or positions[-1] != position:
+                        positions.append(position)
+
+    def get_grams(self, value):
+        grams = set()
+        for size in range(1, self.n + 1):
+            for start in range(len(value) - size + 1):
+                grams.add(value[start : start + size])
+        return grams
+
+    def candidates(self, value):
+        """Get sorted positions of items that may contain value."""
+        if len(value) <= self.n:
+            return self.grams.get(value, [])
+
+        grams = sorted(
+            (value[i : i + self.n] for i in range(len(value) - self.n + 1)),
+            key=lambda gram: len(self.grams.get(gram, ())),
+        )
+        positions = set(self.grams.get(grams[0], ()))
+        for gram in grams[1:]:
+            if not positions:
+                break
+            positions.intersection_update(self.grams.get(gram, ()))
+        return sorted(positions)
+
+
+class Dataset:
+    """Read-mostly list stored in the cache, indexed once per process."""
+
+    def __init__(
+        self, name, loader, key="id", search_fields=(), timeout=None, local_timeout=60
+    ):
+        self.name = name
+        self.loader = loader
+        self.key = key
+        self.search_fields = search_fields
+        self.cache = TieredCache(
+            "datasets", 1, local_timeout, timeout, prepare=self.build_indexes
+        )
+
+    def build_indexes(self, items):
+        items = IndexedList(items, self.key)
+        return items, NgramIndex(items, self.search_fields)
+
+    def get_indexes(self):
+        return self.cache.get_or_set(self.name, self.loader)
+
+    def all(self):
+        """Get all items."""
+        return self.get_indexes()[0]
+
+    def get(self, key):
+        """Get item by key, None if missing."""
+        items = self.all()
+        position = items.position(key)
+        return None if position is None else items[position]
+
+    def search(self, value):
+        """Get items whose search fields contain value."""
+        items, index = self.get_indexes()
+        if not value:
+            return items
+
+        return IndexedList(
+            (
+                items[position]
+                for position in index.candidates(value)
+                if any(
+                    value in (get_value(items[position], field) or "")
+                    for field in self.search_fields
+                )
+            ),
+            self.key,
+        )
+
+    def expire(self):
+        """Expire the dataset in every process."""
+        self.cache.delete(self.name)
@@ -1,5 +1,6 @@
 from functools import wraps
 
+from asgiref.sync import iscoroutinefunction
 from django.contrib.auth.models import AnonymousUser
 
 from apps.common.utils import fn_lock, fn_throttle
@@ -8,14 +9,24 @@ from apps.common.utils import fn_lock, fn_throttle
 def session_user_exempt(view_func):
     """Cleans the user assigned by the session middleware."""
 
-    @wraps(view_func)
-    def wrapped_view(request, *args, **kwargs):
+    def clean_user(request):
         user = AnonymousUser()
         request.user = user
         request._cached_user = user
-        return view_func(request, *args, **kwargs)
 
-    return wrapped_view
+    if iscoroutinefunction(view_func):
+
+        async def wrapped_view(request, *args, **kwargs):
+            clean_user(request)
+            return await view_func(request, *args, **kwargs)
+
+    else:
+
+        def wrapped_view(request, *args, **kwargs):
+            clean_user(request)
+            return view_func(request, *args, **kwargs)
+
+    return wraps(view_func)(wrapped_view)
 
 
 def task_lock(name="Lock", attr="id", timeout=600, hold=False):
@@ -0,0 +1,145 @@
+import json
+from base64 import b64decode, b64encode
+
+from django.db.models import BooleanField, F, Func, Q, Value
+
+
+class RowValueCompare(Func):
+    """Row value comparison, e.g. (created, id) > (%s, %s)."""
+
+    conditional = True
+    output_field = BooleanField()
+
+    def __init__(self, lhs, rhs, operator):
+        super().__init__(*lhs, *rhs)
+        self.size = len(lhs)
+        self.operator = operator
+
+    def as_sql(self, compiler, connection, **extra_context):
+        sql_parts, params = [], []
+        for expression in self.source_expressions:
+            sql, sql_params = compiler.compile(expression)
+            sql_parts.append(sql)
+            params.extend(sql_params)
+
+        lhs = ", ".join(sql_parts[: self.size])
+        rhs = ", ".join(sql_parts[self.size :])
+        return f"({lhs}) {self.operator} ({rhs})", params
+
+
+def base64(value):
+    return b64encode(value.encode()).decode()
+
+
+def unbase64(value):
+    try:
+        return b64decode(value.encode(), validate=True).decode()
+    except ValueError:
+        return None
+
+
+def get_ordering(model, cursor_field):
+    """Get keyset ordering as (field, descending) pairs ending in a unique field.
+
+    cursor_field is a field name, a comma separated string or a sequence of
+    names, each optionally prefixed with "-" for descending order.
+    """
+    if isinstance(cursor_field, str):
+        cursor_field = cursor_field.split(",")
+
+    ordering = []
+    for name in cursor_field:
+        name = name.strip()
+        desc = name.startswith("-")
+        ordering.append((name.lstrip("-"), desc))
+
+    pk = model._meta.pk
+    unique = {pk.name, pk.attname, "pk"}
+    if not any(
+        name in unique or model._meta.get_field(name).unique for name, _ in ordering
+    ):
+        ordering.append((pk.name, ordering[-1][1]))
+    return ordering
+
+
+def get_order_by(ordering, reverse=False):
+    return [f"-{name}" if desc != reverse else name for name, desc in ordering]
+
+
+def get_field(model, name):
+    return model._meta.pk if name == "pk" else model._meta.get_field(name)
+
+
+def cursor_encode(obj, ordering):
+    """Encode the ordering values of an object into an opaque cursor."""
+    values = [get_field(type(obj), name).value_to_string(obj) for name, _ in ordering]
+    if len(values) == 1:
+        return base64(values[0])
+    return base64(json.dumps(values, separators=(",", ":")))
+
+
+def cursor_decode(model, ordering, cursor):
+    """Decode an opaque cursor into the ordering values, None if invalid."""
+    if not isinstance(cursor, str) or not cursor:
+        return None
+
+    value = unbase64(cursor)
+    if value is None:
+        return None
+    if len(ordering) == 1:
+        values = [value]
+    else:
+        try:
+            values = json.loads(value)
+        except ValueError:
+            return None
+        if not isinstance(values, list) or len(values) != len(ordering):
+            return None
+
+    try:
+        return [
+            get_field(model, name).to_python(value)
+            for (name, _), value in zip(ordering, values)
+        ]
+    except Exception:
+        return None
+
+
+def keyset_filter(model, ordering, values, reverse=False):
+    """Get the condition selecting rows after the given values in ordering.
+
+    Uniform directions compile to a single row value comparison, which can use
+    a composite index; mixed directions expand into an OR of prefix equalities.
+    """
+    descending = {desc != reverse for _, desc in ordering}
+
+    if len(ordering) == 1:
+        (name, desc), value = ordering[0], values[0]
+        lookup = "lt" if desc != reverse else "gt"
+        return Q(**{f"{name}__{lookup}": value})
+
+    if len(descending) == 1:
+        return RowValueCompare(
+            [F(name) for name, _ in ordering],
+            [
+                Value(value, output_field=get_field(model, name))
+                for (name, _), value in zip(ordering, values)
+            ],
+            "<" if descending.pop() else ">",
+        )
+
+    condition = Q()
+    for index, ((name, desc), value) in enumerate(zip(ordering, values)):
+        lookup = "lt" if desc != reverse else "gt"
+        prefix = {n: v for (n, _), v in zip(ordering[:index], values[:index])}
+        condition |= Q(**prefix, **{f"{name}__{lookup}": value})
+    return condition
+
+
+def fetch_page(queryset, limit):
+    """Get the first limit rows and whether more rows follow them.
+
+    One extra row is fetched to know whether there is a page beyond this one.
+    """
+    rows = list(queryset[: limit + 1])
+    return rows[:limit], len(rows) > limit
@@ -1,11 +1,21 @@
 from graphql_relay import Connection, Edge, PageInfo
 from graphql_relay.utils.base64 import base64, unbase64
 
+from apps.common import keyset
 
-def get_connection(objects, cursor_field, connection_type, edge_type, page_info_type):
-    edges = [
-        edge_type(node=obj, cursor=get_cursor(obj, cursor_field)) for obj in objects
-    ]
+
+def get_connection(
+    objects,
+    cursor_field,
+    connection_type,
+    edge_type,
+    page_info_type,
+    has_previous_page=True,
+    has_next_page=True,
+    cursor_encoder=None,
+):
+    encode = cursor_encoder or get_cursor
+    edges = [edge_type(node=obj, cursor=encode(obj, cursor_field)) for obj in objects]
     if edges:
         start_cursor, end_cursor = edges[0].cursor, edges[-1].cursor
     else:
@@ -15,8 +25,8 @@ def get_connection(objects, cursor_field, connection_type, edge_type, page_info_
         pageInfo=page_info_type(
             startCursor=start_cursor,
             endCursor=end_cursor,
-            hasPreviousPage=True,
-            hasNextPage=True,
+            hasPreviousPage=has_previous_page,
+            hasNextPage=has_next_page,
         ),
     )
 
@@ -30,30 +40,37 @@ def connection_from_queryset(
     edge_type=Edge,
     page_info_type=PageInfo,
 ):
-    after = cursor_decode(args.get("after"))
-    before = cursor_decode(args.get("before"))
-    queryset = queryset.order_by(cursor_field)
-    asc = True
-
-    if cursor_field.startswith("-"):
-        cursor_field = cursor_field[1:]
-        asc = False
+    model = queryset.model
+    ordering = keyset.get_ordering(model, cursor_field)
+    after = keyset.cursor_decode(model, ordering, args.get("after"))
+    before = keyset.cursor_decode(model, ordering, args.get("before"))
+    queryset = queryset.order_by(*keyset.get_order_by(ordering))
 
     if after:
-        lookup = "gt" if asc else "lt"
-        queryset = queryset.filter(**{f"{cursor_field}__{lookup}": after})
+        queryset = queryset.filter(keyset.keyset_filter(model, ordering, after))
         before = None
     elif before:
-        lookup = "lt" if asc else "gt"
-        queryset = queryset.filter(**{f"{cursor_field}__{lookup}": before})
+        queryset = queryset.filter(
+            keyset.keyset_filter(model, ordering, before, reverse=True)
+        )
 
     if before or (args.get("last") and not after and not before):
-        objects = reversed(queryset.reverse()[:limit])
+        objects, has_previous_page = keyset.fetch_page(queryset.reverse(), limit)
+        has_next_page = bool(before)
+        objects.reverse()
     else:
-        objects = queryset[:limit]
+        objects, has_next_page = keyset.fetch_page(queryset, limit)
+        has_previous_page = bool(after)
 
     return get_connection(
-        objects, cursor_field, connection_type, edge_type, page_info_type
+        objects,
+        ordering,
+        connection_type,
+        edge_type,
+        page_info_type,
+        has_previous_page,
+        has_next_page,
+        cursor_encoder=keyset.cursor_encode,
     )
 
 
@@ -71,25 +88,32 @@ def connection_from_objects(
 
     if cursor_field.startswith("-"):
         cursor_field = cursor_field[1:]
-        objects = objects[::-1]
+        objects = objects.reversed() if hasattr(objects, "reversed") else objects[::-1]
 
+    start, end = 0, len(objects)
     if after:
-        index = object_index(objects, cursor_field, after)
+        index = find_index(objects, cursor_field, after)
         if index is not None:
-            objects = objects[index + 1 :]
+            start = index + 1
         before = None
     elif before:
-        index = object_index(objects, cursor_field, before)
+        index = find_index(objects, cursor_field, before)
         if index is not None:
-            objects = objects[:index]
+            end = index
 
     if before or (args.get("last") and not after and not before):
-        objects = objects[-limit:]
+        start = max(start, end - limit)
     else:
-        objects = objects[:limit]
+        end = min(end, start + limit)
 
     return get_connection(
-        objects, cursor_field, connection_type, edge_type, page_info_type
+        objects[start:end],
+        cursor_field,
+        connection_type,
+        edge_type,
+        page_info_type,
+        start > 0,
+        end < len(objects),
     )
 
 
@@ -113,6 +137,12 @@ def cursor_decode(value):
     return unbase64(value)
 
 
+def find_index(objects, field, value):
+    if getattr(objects, "key", None) == field:
+        return objects.position(value)
+    return object_index(objects, field, value)
+
+
 def object_index(objects, field, value):
     for index, obj in enumerate(objects):
         if isinstance(obj, dict) and obj.get(field) == value:
@@ -1,4 +1,7 @@
 import graphene
+from django.db.models.query import QuerySet
+
+from apps.common.counts import count_queryset
 
 
 class Connection(graphene.relay.Connection):
@@ -8,11 +11,13 @@ class Connection(graphene.relay.Connection):
         required=True, description="The total count of items in the collection."
     )
 
+    count_mode = None
+
     class Meta:
         abstract = True
 
     @classmethod
     def resolve_total_count(cls, root, info, **kwargs):
-        if not hasattr(root, "length"):
-            return len(root.iterable)
-        return root.length
+        if isinstance(root.iterable, QuerySet):
+            return count_queryset(root.iterable, cls.count_mode)
+        return len(root.iterable)
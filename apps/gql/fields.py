@@ -23,6 +23,7 @@ from graphene_django.utils import maybe_queryset
 from promise import Promise
 
 from apps.gql.array_connection import connection_from_objects, connection_from_queryset
+from apps.gql.projection import project_queryset
 from apps.gql.types import ModelObjectType
 from apps.gql.utils import to_snake_case
 
@@ -173,9 +174,15 @@ class DjangoCursorConnectionField(RelayConnectionField):
             page_info_type=page_info_adapter,
         )
         connection.iterable = iterable
-        connection.length = limit
         return connection
 
+    @classmethod
+    def prime_loaders(cls, connection, info, resolved):
+        prime_loaders = getattr(connection._meta.node, "prime_loaders", None)
+        if prime_loaders:
+            prime_loaders(info, [edge.node for edge in resolved.edges])
+        return resolved
+
     @classmethod
     def connection_resolver(
         cls,
@@ -197,6 +204,7 @@ class DjangoCursorConnectionField(RelayConnectionField):
             iterable = default_manager
 
         iterable = queryset_resolver(connection, iterable, info, kwargs)
+        iterable = project_queryset(iterable, connection._meta.node, info, cursor_field)
         on_resolve = partial(
             cls.resolve_connection,
             connection,
@@ -205,10 +213,11 @@ class DjangoCursorConnectionField(RelayConnectionField):
             max_limit,
             cursor_field,
         )
+        on_prime = partial(cls.prime_loaders, connection, info)
 
         if Promise.is_thenable(iterable):
-            return Promise.resolve().then(on_resolve)
-        return on_resolve()
+            return Promise.resolve().then(on_resolve).then(on_prime)
+        return on_prime(on_resolve())
 
     def wrap_resolve(self, parent_resolver):
         return partial(
@@ -294,6 +303,9 @@ class DjangoFilterCursorConnectionField(DjangoCursorConnectionField):
             connection, iterable, info, args
         )
 
+        if hasattr(filterset_class, "filter_data"):
+            return filterset_class.filter_data(filter_kwargs(), qs)
+
         filterset = filterset_class(
             data=filter_kwargs(), queryset=qs, request=info.context
         )
@@ -416,7 +428,6 @@ class CursorConnectionField(ConnectionField):
             page_info_type=page_info_adapter,
         )
         connection.iterable = iterable
-        connection.length = limit
         return connection
 
 
@@ -0,0 +1,273 @@
+from asyncio import gather
+from functools import partial
+
+from asgiref.sync import sync_to_async
+from graphql import ExecutionContext, is_non_null_type, located_error
+
+
+class Pending:
+    """Value computed on first use, after its loader collected the level keys."""
+
+    def __init__(self, get_value):
+        self.get_value = get_value
+
+    def get(self):
+        return self.get_value()
+
+    def then(self, callback):
+        """Get a pending value of callback applied to this value."""
+        return Pending(lambda: callback(self.get()))
+
+
+class DataLoader:
+    """Request-scoped loader that batches keys into a single load.
+
+    Resolvers return defer(key) so the keys of a whole level of fields are
+    collected before the loader dispatches, see LoaderExecutionContext.
+    """
+
+    def __init__(self, batch_load_fn=None):
+        if batch_load_fn is not None:
+            self.batch_load = batch_load_fn
+        self.cache = {}
+        self.queue = []
+
+    def batch_load(self, keys):
+        """Get a key to value mapping for the given keys."""
+        raise NotImplementedError
+
+    def get_cache_key(self, key):
+        return key
+
+    def enqueue(self, key):
+        """Schedule key to be loaded with the next batch."""
+        key = self.get_cache_key(key)
+        if key is not None and key not in self.cache:
+            self.cache[key] = None
+            self.queue.append(key)
+
+    def enqueue_many(self, keys):
+        for key in keys:
+            self.enqueue(key)
+
+    def dispatch(self):
+        """Load all scheduled keys at once."""
+        if not self.queue:
+            return
+        keys, self.queue = self.queue, []
+        self.cache.update(self.batch_load(keys))
+
+    def load(self, key):
+        self.enqueue(key)
+        self.dispatch()
+        return self.cache.get(self.get_cache_key(key))
+
+    def defer(self, key):
+        """Get a pending value of key, loaded with the next batch."""
+        self.enqueue(key)
+        return Pending(partial(self.load, key))
+
+    def load_many(self, keys):
+        keys = [self.get_cache_key(key) for key in keys]
+        self.enqueue_many(keys)
+        self.dispatch()
+        return [self.cache.get(key) for key in keys]
+
+    def prime(self, key, value):
+        self.cache[self.get_cache_key(key)] = value
+
+    def clear(self, key):
+        self.cache.pop(self.get_cache_key(key), None)
+
+
+class ModelLoader(DataLoader):
+    """Loader of model instances by a unique field."""
+
+    def __init__(self, model, field="pk", queryset=None):
+        super().__init__()
+        self.model = model
+        self.field = field
+        self.key_field = (
+            model._meta.pk if field == "pk" else model._meta.get_field(field)
+        )
+        self.queryset = model._default_manager.all() if queryset is None else queryset
+
+    def get_cache_key(self, key):
+        try:
+            return self.key_field.to_python(key)
+        except Exception:
+            return None
+
+    def batch_load(self, keys):
+        result = dict.fromkeys(keys)
+        for obj in self.queryset.filter(**{f"{self.field}__in": keys}):
+            result[getattr(obj, self.field)] = obj
+        return result
+
+
+class Completion:
+    """Field completion waiting for the value of a pending resolver result."""
+
+    def __init__(self, pending, complete):
+        self.pending = pending
+        self.complete = complete
+
+
+def load_outcome(pending):
+    """Get a function returning the value of pending or raising its error."""
+    try:
+        value = pending.get()
+    except Exception as exc:
+        error = exc
+
+        def fail():
+            raise error
+
+        return fail
+    return lambda: value
+
+
+class LoaderExecutionContext(ExecutionContext):
+    """Execution context completing pending values level by level.
+
+    Fields resolving to a pending value are left incomplete until the whole
+    operation ran; then every pending value of a level, across sibling fields,
+    list items and objects, is loaded before any of them is completed, so each
+    loader dispatches its keys once per level. Completing them runs the next
+    level of resolvers, which are settled the same way. Async execution loads
+    in the sync thread and completes in the event loop.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.completions = []
+
+    def complete_value(self, return_type, field_nodes, info, path, result):
+        if isinstance(result, Pending):
+            return Completion(
+                result,
+                partial(self.complete_loaded, return_type, field_nodes, info, path),
+            )
+        return super().complete_value(return_type, field_nodes, info, path, result)
+
+    def complete_loaded(self, return_type, field_nodes, info, path, load):
+        try:
+            completed = super().complete_value(
+                return_type, field_nodes, info, path, load()
+            )
+        except Exception as raw_error:
+            return self.field_error(raw_error, return_type, field_nodes, path)
+        if not self.is_awaitable(completed):
+            return completed
+
+        async def await_completed():
+            try:
+                return await completed
+            except Exception as raw_error:
+                return self.field_error(raw_error, return_type, field_nodes, path)
+
+        return await_completed()
+
+    def field_error(self, raw_error, return_type, field_nodes, path):
+        # The parent of a late field is already complete, a non null field
+        # error is reported without nulling it.
+        error = located_error(raw_error, field_nodes, path.as_list())
+        if is_non_null_type(return_type):
+            self.errors.append(error)
+        else:
+            self.handle_field_error(error, return_type, path)
+        return None
+
+    def complete_list_value(self, return_type, field_nodes, info, path, result):
+        return self.register(
+            super().complete_list_value(return_type, field_nodes, info, path, result),
+            enumerate,
+        )
+
+    def execute_fields(self, parent_type, source_value, path, fields):
+        return self.register(
+            super().execute_fields(parent_type, source_value, path, fields),
+            dict.items,
+        )
+
+    def execute_fields_serially(self, parent_type, source_value, path, fields):
+        return self.register(
+            super().execute_fields_serially(parent_type, source_value, path, fields),
+            dict.items,
+        )
+
+    def register(self, results, items):
+        """Collect the completions of results, once they are available."""
+        if self.is_awaitable(results):
+
+            async def await_results():
+                return self.register(await results, items)
+
+            return await_results()
+
+        if results is not None:
+            self.completions.extend(
+                (results, key, value)
+                for key, value in items(results)
+                if isinstance(value, Completion)
+            )
+        return results
+
+    def execute_operation(self, operation, root_value):
+        result = super().execute_operation(operation, root_value)
+        if self.is_awaitable(result):
+
+            async def await_result():
+                data = await result
+                await self.settle_async()
+                return data
+
+            return await_result()
+
+        self.settle()
+        return result
+
+    def settle(self):
+        """Load and complete the pending values, level by level."""
+        while self.completions:
+            completions, self.completions = self.completions, []
+            loads = [load_outcome(c.pending) for _, _, c in completions]
+            for (results, key, completion), load in zip(completions, loads):
+                results[key] = completion.complete(load)
+
+    async def settle_async(self):
+        while self.completions:
+            completions, self.completions = self.completions, []
+            loads = await sync_to_async(
+                lambda: [load_outcome(c.pending) for _, _, c in completions]
+            )()
+            awaiting = []
+            for (results, key, completion), load in zip(completions, loads):
+                results[key] = completion.complete(load)
+                if self.is_awaitable(results[key]):
+                    awaiting.append((results, key))
+            values = await gather(*(results[key] for results, key in awaiting))
+            for (results, key), value in zip(awaiting, values):
+                results[key] = value
+
+
+def get_loader(info, key, loader_class, *args, **kwargs):
+    """Get the loader stored on the request, creating it when missing."""
+    loaders = getattr(info.context, "loaders", None)
+    if loaders is None:
+        loaders = info.context.loaders = {}
+    if key not in loaders:
+        loaders[key] = loader_class(*args, **kwargs)
+    return loaders[key]
+
+
+def get_node_loader(info, graphene_type):
+    """Get the model loader of a node type."""
+    model = graphene_type._meta.model
+    return get_loader(
+        info,
+        graphene_type,
+        ModelLoader,
+        model,
+        queryset=graphene_type.get_queryset(model._default_manager.all(), info),
+    )
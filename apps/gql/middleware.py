@@ -0,0 +1,53 @@
+from functools import partial
+from inspect import unwrap
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from graphene.relay.node import GlobalID
+from graphene.types.resolver import attr_resolver, dict_or_attr_resolver, dict_resolver
+
+# Resolvers reading attributes of the parent value, they don't hit the database.
+inline_resolvers = (
+    attr_resolver,
+    dict_or_attr_resolver,
+    dict_resolver,
+    GlobalID.id_resolver,
+)
+
+
+def get_resolver_function(resolver):
+    """Get the function behind partials and decorators of a resolver."""
+    while isinstance(resolver, partial):
+        resolver = resolver.func
+    return unwrap(getattr(resolver, "__func__", resolver))
+
+
+class SyncResolverMiddleware:
+    """Run sync resolvers outside the event loop when executing async.
+
+    Async resolvers and attribute lookups stay in the event loop; any other
+    resolver may use the ORM, so it runs in the sync thread like a sync view.
+    Pending values they return are settled by LoaderExecutionContext.
+    """
+
+    def __init__(self):
+        self.inline = {}
+
+    def is_inline(self, info):
+        parent_type = info.parent_type
+        key = (parent_type.name, info.field_name)
+        if key not in self.inline:
+            field = parent_type.fields.get(info.field_name)
+            resolver = field and field.resolve
+            function = resolver and get_resolver_function(resolver)
+            self.inline[key] = (
+                function is None
+                or parent_type.name.startswith("__")
+                or function in inline_resolvers
+                or iscoroutinefunction(function)
+            )
+        return self.inline[key]
+
+    def resolve(self, next, root, info, **kwargs):
+        if self.is_inline(info):
+            return next(root, info, **kwargs)
+        return sync_to_async(next, thread_sensitive=True)(root, info, **kwargs)
@@ -1,11 +1,12 @@
 import graphene
 from django.core.exceptions import ImproperlyConfigured, ValidationError
-from django.db import models
+from django.db import models, transaction
 from django.utils.translation import gettext_lazy as _
 from graphene.types.mutation import MutationOptions
 
 from apps.gql.fields import File
-from apps.gql.utils import node_from_global_id
+from apps.gql.loaders import get_node_loader
+from apps.gql.utils import is_model_node, node_from_global_id, nodes_from_global_ids
 
 
 class Mutation(graphene.Mutation):
@@ -171,4 +172,149 @@ class ModelDeleteMutation(ModelMutation):
         id = instance.id
         instance.delete()
         instance.id = id
+        if is_model_node(cls._meta.field_type):
+            get_node_loader(info, cls._meta.field_type).clear(id)
         return instance
+
+
+def prefix_errors(prefix, error):
+    """Get the message dict of a ValidationError with prefixed field names."""
+    return {
+        f"{prefix}.{field}": messages for field, messages in error.message_dict.items()
+    }
+
+
+class ModelBulkMutation(ModelMutation):
+    """Model bulk mutation.
+
+    Every item is cleaned before any is saved, errors are reported by item
+    index, nodes are resolved with a query per type and all items are written
+    at once in a single transaction.
+    """
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def __init_subclass_with_meta__(cls, max_size=1000, _meta=None, **options):
+        _meta = _meta or MutationOptions(cls)
+        _meta.max_size = max_size
+        super().__init_subclass_with_meta__(_meta=_meta, **options)
+        cls._meta.fields[cls._meta.field_name] = graphene.Field(
+            graphene.List(graphene.NonNull(cls._meta.field_type))
+        )
+
+    @classmethod
+    def check_size(cls, field, items):
+        if len(items) > cls._meta.max_size:
+            message = _("Ensure this field has no more than %(max)d elements.")
+            raise ValidationError({field: message % {"max": cls._meta.max_size}})
+
+    @classmethod
+    def check_instance(cls, info, instance):
+        """Raise ValidationError when the instance can't be mutated."""
+
+    @classmethod
+    def get_instances(cls, info, ids, prefixes):
+        """Get the nodes of global ids and the errors of unresolved ones."""
+        message = _('Could not resolve node "%(node)s".')
+        nodes = nodes_from_global_ids(info, ids, only_type=cls._meta.field_type)
+        errors = {}
+        for id, node, prefix in zip(ids, nodes, prefixes):
+            if node is None:
+                errors[prefix] = [message % {"node": id}]
+                continue
+            try:
+                cls.check_instance(info, node)
+            except ValidationError as error:
+                errors.update(prefix_errors(prefix, error))
+        return nodes, errors
+
+    @classmethod
+    def get_input_cls(cls):
+        return cls.Arguments.input.of_type.of_type
+
+    @classmethod
+    def clean_item(cls, info, instance, input, input_cls):
+        cleaned_input = cls.clean_input(info, input, input_cls)
+        instance = cls.construct_instance(instance, cleaned_input)
+        cls.clean_instance(instance)
+        return cleaned_input
+
+    @classmethod
+    def bulk_save(cls, info, instances, cleaned_inputs):
+        manager = cls._meta.model._default_manager
+        if all(instance._state.adding for instance in instances):
+            manager.bulk_create(instances)
+            return
+
+        names = {
+            field.name
+            for field in cls._meta.model._meta.concrete_fields
+            if not field.primary_key
+        }
+        fields = set()
+        for cleaned_input in cleaned_inputs:
+            fields.update(names.intersection(cleaned_input))
+        if fields:
+            manager.bulk_update(instances, fields)
+
+    @classmethod
+    @transaction.atomic
+    def perform_mutation(cls, root, info, **kwargs):
+        input = kwargs["input"]
+        cls.check_size("input", input)
+        input_cls = cls.get_input_cls()
+        prefixes = [f"input.{index}" for index in range(len(input))]
+
+        if "id" in input_cls._meta.fields:
+            instances, errors = cls.get_instances(
+                info, [item["id"] for item in input], [f"{p}.id" for p in prefixes]
+            )
+        else:
+            instances, errors = [cls._meta.model() for _ in input], {}
+
+        cleaned_inputs = []
+        for instance, item, prefix in zip(instances, input, prefixes):
+            if instance is None:
+                continue
+            try:
+                cleaned_inputs.append(cls.clean_item(info, instance, item, input_cls))
+            except ValidationError as error:
+                errors.update(prefix_errors(prefix, error))
+        if errors:
+            raise ValidationError(errors)
+
+        cls.bulk_save(info, instances, cleaned_inputs)
+        return instances
+
+
+class ModelBulkDeleteMutation(ModelBulkMutation):
+    """Model bulk delete mutation."""
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def bulk_delete(cls, info, instances):
+        cls._meta.model._default_manager.filter(
+            pk__in=[instance.pk for instance in instances]
+        ).delete()
+
+    @classmethod
+    @transaction.atomic
+    def perform_mutation(cls, root, info, **kwargs):
+        ids = kwargs["ids"]
+        cls.check_size("ids", ids)
+        instances, errors = cls.get_instances(
+            info, ids, [f"ids.{index}" for index in range(len(ids))]
+        )
+        if errors:
+            raise ValidationError(errors)
+
+        cls.bulk_delete(info, instances)
+        if is_model_node(cls._meta.field_type):
+            loader = get_node_loader(info, cls._meta.field_type)
+            for instance in instances:
+                loader.clear(instance.pk)
+        return instances
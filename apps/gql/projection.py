@@ -0,0 +1,99 @@
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models.query import QuerySet
+from graphql.language import FieldNode, FragmentSpreadNode, InlineFragmentNode
+
+from apps.common.keyset import get_ordering
+from apps.gql.utils import to_camel_case
+
+
+def get_selections(info, selection_set):
+    """Get field nodes of a selection set, flattening fragments."""
+    for selection in selection_set.selections:
+        if isinstance(selection, FieldNode):
+            yield selection
+        elif isinstance(selection, InlineFragmentNode):
+            yield from get_selections(info, selection.selection_set)
+        elif isinstance(selection, FragmentSpreadNode):
+            fragment = info.fragments.get(selection.name.value)
+            if fragment:
+                yield from get_selections(info, fragment.selection_set)
+
+
+def get_node_field_names(info):
+    """Get field names selected on the nodes of a connection field."""
+    names = set()
+    for field_node in info.field_nodes:
+        if not field_node.selection_set:
+            continue
+        for edges in get_selections(info, field_node.selection_set):
+            if edges.name.value != "edges" or not edges.selection_set:
+                continue
+            for node in get_selections(info, edges.selection_set):
+                if node.name.value != "node" or not node.selection_set:
+                    continue
+                for field in get_selections(info, node.selection_set):
+                    names.add(field.name.value)
+    return names
+
+
+def get_projection(node_type, names):
+    """Get only, select_related and prefetch_related lookups of node fields.
+
+    Return None when a selected field can't be mapped to model fields.
+    """
+    model = node_type._meta.model
+    type_fields = {
+        getattr(field, "name", None) or to_camel_case(name): name
+        for name, field in node_type._meta.fields.items()
+    }
+    projection = getattr(node_type, "projection", {})
+    only, select, prefetch = set(), set(), set()
+
+    for name in names:
+        if name.startswith("__"):
+            continue
+        name = type_fields.get(name)
+        if name is None:
+            return None
+        if name in projection:
+            only.update(projection[name])
+            continue
+
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return None
+
+        if (
+            field.many_to_many
+            or field.one_to_many
+            or (field.one_to_one and not field.concrete)
+        ):
+            prefetch.add(name)
+        elif field.is_relation:
+            only.add(name)
+            select.add(name)
+        else:
+            only.add(name)
+    return only, select, prefetch
+
+
+def project_queryset(queryset, node_type, info, cursor_field=None):
+    """Load only the model fields selected on the connection nodes."""
+    if not isinstance(queryset, QuerySet):
+        return queryset
+
+    projection = get_projection(node_type, get_node_field_names(info))
+    if projection is None:
+        return queryset
+
+    only, select, prefetch = projection
+    only.add(queryset.model._meta.pk.name)
+    if cursor_field:
+        only.update(name for name, _ in get_ordering(queryset.model, cursor_field))
+
+    if select:
+        queryset = queryset.select_related(*select)
+    if prefetch:
+        queryset = queryset.prefetch_related(*prefetch)
+    return queryset.only(*only)
@@ -1,18 +1,81 @@
+from functools import partial
+
 from django.core.exceptions import NON_FIELD_ERRORS
 from graphene import Node
 from graphene.utils.str_converters import to_camel_case, to_snake_case  # noqa
 from graphql_relay import from_global_id, to_global_id  # noqa
 
+from apps.gql.loaders import Pending, get_node_loader
+from apps.gql.types import ModelObjectType
+
 
 def node_from_global_id(info, id, only_type=None):
     """Get node from global ID."""
     try:
-        node = Node.get_node_from_global_id(info, id, only_type)
+        graphene_type, pk = type_from_global_id(info, id, only_type)
+        get_node = getattr(graphene_type, "get_node", None)
+        if is_model_node(graphene_type):
+            node = get_node_loader(info, graphene_type).load(pk)
+        else:
+            node = get_node(info, pk) if get_node else None
     except Exception:
         return None
     return node
 
 
+def defer_node_from_global_id(info, id, only_type=None):
+    """Get pending node from global ID, loaded with the nodes of sibling fields."""
+    try:
+        graphene_type, pk = type_from_global_id(info, id, only_type)
+        if is_model_node(graphene_type):
+            return get_node_loader(info, graphene_type).defer(pk)
+    except Exception:
+        pass
+    return Pending(partial(node_from_global_id, info, id, only_type))
+
+
+def nodes_from_global_ids(info, ids, only_type=None):
+    """Get nodes from global IDs, loading model nodes with a query per type."""
+    loaders = set()
+    for id in ids:
+        try:
+            graphene_type, pk = type_from_global_id(info, id, only_type)
+        except Exception:
+            continue
+        if is_model_node(graphene_type):
+            loader = get_node_loader(info, graphene_type)
+            loader.enqueue(pk)
+            loaders.add(loader)
+
+    for loader in loaders:
+        loader.dispatch()
+    return [node_from_global_id(info, id, only_type) for id in ids]
+
+
+def is_model_node(graphene_type):
+    """Check if the node type is loaded with the default model lookup."""
+    return (
+        issubclass(graphene_type, ModelObjectType)
+        and graphene_type.get_node.__func__ is ModelObjectType.get_node.__func__
+    )
+
+
+def type_from_global_id(info, id, only_type=None):
+    """Get node type and id from global ID."""
+    name, pk = from_global_id(id)
+
+    graphene_type = info.schema.get_type(name)
+    if graphene_type is None:
+        raise Exception(f'Relay Node "{name}" not found in schema')
+
+    graphene_type = graphene_type.graphene_type
+    if only_type and graphene_type != only_type:
+        raise Exception(f"Must receive a {only_type._meta.name} id.")
+    if Node not in graphene_type._meta.interfaces:
+        raise Exception(f'ObjectType "{name}" does not implement the Node interface.')
+    return graphene_type, pk
+
+
 def id_from_global_id(id):
     """Get id from global ID."""
     try:
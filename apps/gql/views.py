@@ -1,7 +1,10 @@
 import json
+from hashlib import sha256
+from inspect import isawaitable
 from traceback import print_exception
 
 from django.conf import settings
+from django.core.cache import caches
 from django.core.exceptions import ValidationError
 from django.http import HttpResponse, HttpResponseNotAllowed
 from django.http.response import HttpResponseBadRequest
@@ -9,10 +12,20 @@ from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import ensure_csrf_cookie
 from graphene_django.settings import graphene_settings
 from graphene_django.views import GraphQLView, HttpError
-from graphql import get_introspection_query, parse, validate
+from graphql import execute, get_introspection_query, parse, print_ast, validate
 from graphql.error import GraphQLError
 from graphql.execution import ExecutionResult
+from graphql.language import (
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    InlineFragmentNode,
+    IntValueNode,
+)
 
+from apps.common.cache import LRUCache
+from apps.gql.loaders import LoaderExecutionContext
+from apps.gql.middleware import SyncResolverMiddleware
 from apps.gql.utils import validation_error_to_error_list
 
 capture_exception = lambda *args, **kwargs: None  # noqa
@@ -34,61 +47,136 @@ MAX_SIZE = user_settings.get("GQL_MAX_SIZE", 2048)
 MAX_DEFINITIONS = user_settings.get("GQL_MAX_DEFINITIONS", 10)
 MAX_DEPTH = user_settings.get("GQL_MAX_DEPTH", 10)
 MAX_FIELDS = user_settings.get("GQL_MAX_FIELDS", 2)
+MAX_COST = user_settings.get("GQL_MAX_COST", 10000)
+MAX_LIMIT = graphene_settings.RELAY_CONNECTION_MAX_LIMIT
 INTROSPECTION = user_settings.get("GQL_INTROSPECTION", True)
+DOCUMENT_CACHE_SIZE = user_settings.get("GQL_DOCUMENT_CACHE_SIZE", 256)
+PERSISTED_QUERIES = user_settings.get("GQL_PERSISTED_QUERIES", True)
+PERSISTED_QUERY_TIMEOUT = user_settings.get("GQL_PERSISTED_QUERY_TIMEOUT", 86400)
 
 cache = {}
+documents = LRUCache(DOCUMENT_CACHE_SIZE)
 
 
-def get_fields_names(fields):
-    return [field.name.value for field in fields]
-
-
-def measure_depth(selection_set, depth=1):
-    max_depth = depth
-    for field in selection_set.selections:
-        if not getattr(field, "selection_set", None):
-            continue
-        new_depth = measure_depth(field.selection_set, depth=depth + 1)
-        if new_depth > max_depth:
-            max_depth = new_depth
-    return max_depth
+def persisted_query_key(query_hash):
+    return f"gql:query:{query_hash}"
 
 
-def measure_alias(selection_set, alias=1):
-    max_alias = alias
-    fields = get_fields_names(selection_set.selections)
+class QueryAnalyzer:
+    """Measure query depth, alias, root fields and cost in a single pass."""
 
-    for field in selection_set.selections:
-        if getattr(field, "selection_set", None):
-            new_alias = measure_alias(
-                field.selection_set, alias=fields.count(field.name.value)
-            )
-        else:
-            new_alias = fields.count(field.name.value)
-        if new_alias > max_alias:
-            max_alias = new_alias
-    return max_alias
-
-
-def measure_query_fields(definition):
-    types = (
+    root_types = (
         "Query",
         "Mutation",
         "Subscription",
     )
-    type_condition = getattr(definition, "type_condition", None)
+    limit_arguments = (
+        "first",
+        "last",
+    )
 
-    if type_condition and type_condition.name.value not in types:
-        return 0
+    def __init__(self, document):
+        self.fragments = {
+            definition.name.value: definition
+            for definition in document.definitions
+            if isinstance(definition, FragmentDefinitionNode)
+        }
+        self.measured = {}
+
+    def get_multiplier(self, field):
+        """Estimate how many times the field children are resolved."""
+        for argument in field.arguments or ():
+            if argument.name.value not in self.limit_arguments:
+                continue
+            if isinstance(argument.value, IntValueNode):
+                return max(min(int(argument.value.value), MAX_LIMIT), 0)
+            return MAX_LIMIT
+        for selection in self.flatten(field.selection_set):
+            if selection.name.value == "edges":
+                return MAX_LIMIT
+        return 1
+
+    def flatten(self, selection_set, spread=()):
+        """Get the fields of a selection set, including those of its fragments."""
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                yield selection
+            elif isinstance(selection, InlineFragmentNode):
+                yield from self.flatten(selection.selection_set, spread)
+            elif isinstance(selection, FragmentSpreadNode):
+                name = selection.name.value
+                definition = self.fragments.get(name)
+                if definition and name not in spread:
+                    yield from self.flatten(definition.selection_set, spread + (name,))
+
+    def get_signature(self, field):
+        """Get the response key and arguments a field is merged by."""
+        return (
+            field.alias.value if field.alias else field.name.value,
+            tuple(
+                (argument.name.value, print_ast(argument.value))
+                for argument in field.arguments or ()
+            ),
+        )
 
-    fields = get_fields_names(definition.selection_set.selections)
+    def measure(self, selection_set, level=1):
+        """Get depth and cost of a selection set nested at the given level."""
+        key = id(selection_set)
+        if key in self.measured:
+            depth, cost = self.measured[key]
+            if level + depth - 1 > MAX_DEPTH:
+                raise GraphQLError("Query depth allowed is %d." % MAX_DEPTH)
+            return depth, cost
+
+        depth = 1
+        cost = 0
+        signatures = {}
+
+        for field in self.flatten(selection_set):
+            # Fields with the same response key and arguments are merged, any
+            # other occurrence of a field name is an alias of it.
+            signature = self.get_signature(field)
+            seen = signatures.setdefault(field.name.value, signature)
+            if seen != signature:
+                raise GraphQLError("Only 1 alias is allowed per field.")
+
+            cost += 1
+            if field.selection_set:
+                if level >= MAX_DEPTH:
+                    raise GraphQLError("Query depth allowed is %d." % MAX_DEPTH)
+                child_depth, child_cost = self.measure(field.selection_set, level + 1)
+                depth = max(depth, child_depth + 1)
+                cost += self.get_multiplier(field) * child_cost
+
+        self.measured[key] = depth, cost
+        return depth, cost
+
+    def measure_query_fields(self, definition):
+        type_condition = getattr(definition, "type_condition", None)
+
+        if type_condition and type_condition.name.value not in self.root_types:
+            return 0
+
+        fields = list(self.flatten(definition.selection_set))
+        if not INTROSPECTION:
+            for field in fields:
+                if field.name.value == "__schema":
+                    raise GraphQLError("__schema introspection is not allowed.")
+                if field.name.value == "__type":
+                    raise GraphQLError("__type introspection is not allowed.")
+        return len({self.get_signature(field) for field in fields})
+
+    def analyze(self, definition):
+        fields = self.measure_query_fields(definition)
+        if fields > MAX_FIELDS:
+            raise GraphQLError(
+                "Only %d fields are allowed at query level." % MAX_FIELDS
+            )
 
-    if not INTROSPECTION:
-        if "__schema" in fields:
-            raise GraphQLError("__schema introspection is not allowed.")
-        if "__type" in fields:
-            raise GraphQLError("__type introspection is not allowed.")
-    return len(fields)
+        depth, cost = self.measure(definition.selection_set)
+        if cost > MAX_COST:
+            raise GraphQLError("Query cost allowed is %d." % MAX_COST)
+        return depth, cost
 
 
 def validate_document(document):
@@ -99,23 +187,11 @@ def validate_document(document):
             "Only %d definitions are allowed per query." % MAX_DEFINITIONS
         )
 
+    analyzer = QueryAnalyzer(ast)
     for definition in ast.definitions:
         if not getattr(definition, "selection_set", None):
             continue
-
-        depth = measure_depth(definition.selection_set)
-        if depth > MAX_DEPTH:
-            raise GraphQLError("Query depth allowed is %d." % MAX_DEPTH)
-
-        alias = measure_alias(definition.selection_set)
-        if alias > 1:
-            raise GraphQLError("Only 1 alias is allowed per field.")
-
-        fields = measure_query_fields(definition)
-        if fields > MAX_FIELDS:
-            raise GraphQLError(
-                "Only %d fields are allowed at query level." % MAX_FIELDS
-            )
+        analyzer.analyze(definition)
     return document
 
 
@@ -152,24 +228,27 @@ class GQLView(GraphQLView):
             return response
 
     def get_response(self, request, data):
-        query, variables, operation_name = self.get_graphql_params(request, data)
-        response = {}
-        result = None
-        status_code = 200
+        query, variables, operation_name, query_hash = self.get_graphql_params(
+            request, data
+        )
 
         if INTROSPECTION and "__schema" in query:
             if "__schema" in cache:
-                response["data"] = cache["__schema"]
-                result = self.json_encode(request, response)
-                return result, status_code
+                response = {"data": cache["__schema"]}
+                return self.json_encode(request, response), 200
             query = get_introspection_query()
 
         execution_result = self.execute_graphql_request(
-            request, data, query, variables, operation_name
+            request, data, query, variables, operation_name, query_hash
         )
+        return self.get_result(request, execution_result), 200
+
+    def get_result(self, request, execution_result):
+        """Encode the execution result as the response content."""
         if not execution_result:
-            return result, status_code
+            return None
 
+        response = {}
         result_errors = execution_result.errors
         if result_errors:
             errors = []
@@ -182,16 +261,16 @@ class GQLView(GraphQLView):
             cache["__schema"] = result_data
 
         response["data"] = result_data
-        result = self.json_encode(request, response)
+        return self.json_encode(request, response)
 
-        return result, status_code
-
-    def execute_graphql_request(self, request, data, query, variables, operation_name):
+    def execute_graphql_request(
+        self, request, data, query, variables, operation_name, query_hash=None
+    ):
         if request.method != "POST":
             raise HttpError(
                 HttpResponseNotAllowed(["POST"], "Only POST requests are allowed.")
             )
-        if not query:
+        if not query and not query_hash:
             raise HttpError(HttpResponseBadRequest("Query string is required."))
         query_size = len(query)
         if query_size > MAX_SIZE:
@@ -206,24 +285,63 @@ class GQLView(GraphQLView):
             )
 
         try:
-            document = parse(query)
+            document, validation_errors = self.get_document(query, query_hash)
         except Exception as e:
             return ExecutionResult(errors=[e])
-        try:
-            validate_document(document)
-        except Exception as e:
-            return ExecutionResult(errors=[e])
-
-        validation_errors = validate(self.schema.graphql_schema, document, max_errors=1)
         if validation_errors:
             return ExecutionResult(errors=validation_errors)
 
-        return self.schema.execute(
-            source=query,
+        return self.execute(request, document, variables, operation_name)
+
+    def execute(self, request, document, variables, operation_name, **kwargs):
+        return execute(
+            self.schema.graphql_schema,
+            document,
             root_value=self.get_root_value(request),
             variable_values=variables,
             operation_name=operation_name,
             context_value=self.get_context(request),
+            execution_context_class=LoaderExecutionContext,
+            **kwargs,
+        )
+
+    def get_document(self, query, query_hash=None):
+        """Get the parsed and validated document, from cache when possible."""
+        if query:
+            digest = sha256(query.encode()).hexdigest()
+            if query_hash and query_hash != digest:
+                raise GraphQLError("Provided sha does not match query.")
+        elif PERSISTED_QUERIES:
+            digest = query_hash
+        else:
+            raise GraphQLError("PersistedQueryNotSupported")
+
+        document = documents.get(digest)
+        if document is not None:
+            return document, None
+
+        if not query:
+            query = self.get_persisted_query(digest)
+            if not query:
+                raise GraphQLError("PersistedQueryNotFound")
+
+        document = parse(query)
+        validate_document(document)
+        validation_errors = validate(self.schema.graphql_schema, document, max_errors=1)
+        if validation_errors:
+            return None, validation_errors
+
+        documents.set(digest, document)
+        if PERSISTED_QUERIES and query_hash:
+            self.set_persisted_query(digest, query)
+        return document, None
+
+    def get_persisted_query(self, query_hash):
+        return caches["default"].get(persisted_query_key(query_hash))
+
+    def set_persisted_query(self, query_hash, query):
+        caches["default"].set(
+            persisted_query_key(query_hash), query, PERSISTED_QUERY_TIMEOUT
         )
 
     @staticmethod
@@ -241,6 +359,7 @@ class GQLView(GraphQLView):
         query = data.get("query")
         variables = data.get("variables")
         operation_name = data.get("operationName")
+        extensions = data.get("extensions")
 
         if not isinstance(query, str):
             query = ""
@@ -249,7 +368,15 @@ class GQLView(GraphQLView):
         if not isinstance(operation_name, str):
             operation_name = None
 
-        return query, variables, operation_name
+        query_hash = None
+        if isinstance(extensions, dict):
+            persisted_query = extensions.get("persistedQuery")
+            if isinstance(persisted_query, dict):
+                query_hash = persisted_query.get("sha256Hash")
+        if not isinstance(query_hash, str):
+            query_hash = None
+
+        return query, variables, operation_name, query_hash
 
     @staticmethod
     def format_error(error):
@@ -272,3 +399,90 @@ class GQLView(GraphQLView):
                 "message": str(error),
             }
         ]
+
+
+class AsyncGQLView(GQLView):
+    """GQLView executing operations in the event loop.
+
+    Only the I/O around execution and async resolvers run in the event loop;
+    sync resolvers run one at a time in the sync thread, like in GQLView.
+    Persisted queries are read before and written after the document is
+    checked, with the async cache API.
+    """
+
+    view_is_async = True
+    persisted_query = None
+    new_persisted_query = None
+
+    @method_decorator(ensure_csrf_cookie)
+    async def dispatch(self, request, *args, **kwargs):
+        try:
+            if request.method not in (
+                "GET",
+                "POST",
+            ):
+                raise HttpError(
+                    HttpResponseNotAllowed(
+                        ["GET", "POST"], "Only GET and POST requests are allowed."
+                    )
+                )
+            if self.graphiql and GraphQLView.request_wants_html(request):
+                return self.render_graphiql(request)
+
+            data = self.parse_body(request)
+            result, status_code = await self.get_response(request, data)
+            return HttpResponse(
+                status=status_code, content=result, content_type="application/json"
+            )
+        except HttpError as e:
+            response = e.response
+            response["Content-Type"] = "application/json"
+            data = {"errors": self.format_error(e)}
+            response.content = self.json_encode(request, data)
+            return response
+
+    async def get_response(self, request, data):
+        query, variables, operation_name, query_hash = self.get_graphql_params(
+            request, data
+        )
+
+        if INTROSPECTION and "__schema" in query:
+            if "__schema" in cache:
+                response = {"data": cache["__schema"]}
+                return self.json_encode(request, response), 200
+            query = get_introspection_query()
+
+        if PERSISTED_QUERIES and query_hash and not query:
+            if query_hash not in documents:
+                self.persisted_query = await caches["default"].aget(
+                    persisted_query_key(query_hash)
+                )
+
+        execution_result = self.execute_graphql_request(
+            request, data, query, variables, operation_name, query_hash
+        )
+        if self.new_persisted_query:
+            await caches["default"].aset(
+                persisted_query_key(query_hash),
+                self.new_persisted_query,
+                PERSISTED_QUERY_TIMEOUT,
+            )
+        if isawaitable(execution_result):
+            execution_result = await execution_result
+        return self.get_result(request, execution_result), 200
+
+    def get_persisted_query(self, query_hash):
+        return self.persisted_query
+
+    def set_persisted_query(self, query_hash, query):
+        self.new_persisted_query = query
+
+    def execute(self, request, document, variables, operation_name, **kwargs):
+        return super().execute(
+            request,
+            document,
+            variables,
+            operation_name,
+            middleware=[SyncResolverMiddleware()],
+            **kwargs,
+        )
@@ -165,6 +165,9 @@ CHANNELS_LAYERS_BACKENDS = {
 
 CHANNEL_LAYERS = CHANNELS_LAYERS_BACKENDS.get(props.CHANNELS_LAYERS_BACKEND)
 
+CHANNELS_BATCH_WINDOW = props.CHANNELS_BATCH_WINDOW
+CHANNELS_BATCH_SIZE = props.CHANNELS_BATCH_SIZE
+
 
 def _get_caches_url(name, conf):
     urls = {
@@ -322,6 +325,8 @@ DB_BACKENDS = {
 }
 
 DATABASES = DB_BACKENDS.get(props.DB_BACKEND)
+DB_COUNT_MODE = props.DB_COUNT_MODE
+DB_COUNT_TIMEOUT = props.DB_COUNT_TIMEOUT
 
 SQL_DEBUG = props.SQL_DEBUG
 
@@ -337,10 +342,15 @@ GRAPHENE = {
     "GQL_MAX_DEFINITIONS": props.GQL_MAX_DEFINITIONS,
     "GQL_MAX_DEPTH": props.GQL_MAX_DEPTH,
     "GQL_MAX_FIELDS": props.GQL_MAX_FIELDS,
+    "GQL_MAX_COST": props.GQL_MAX_COST,
+    "GQL_DOCUMENT_CACHE_SIZE": props.GQL_DOCUMENT_CACHE_SIZE,
+    "GQL_PERSISTED_QUERIES": props.GQL_PERSISTED_QUERIES,
+    "GQL_PERSISTED_QUERY_TIMEOUT": props.GQL_PERSISTED_QUERY_TIMEOUT,
     "GQL_INTROSPECTION": props.GQL_INTROSPECTION,
 }
 
 GRAPHIQL = props.GQL_GRAPHIQL
+GQL_ASYNC = props.GQL_ASYNC
 
 # Celery: Distributed task queue. Celery is an
 # asynchronous task queue/job queue based on distributed message passing.
@@ -501,6 +511,11 @@ DRF_SWAGGER = props.DRF_SWAGGER
 
 AUTH_TOKEN_TYPE = props.AUTH_TOKEN_TYPE
 AUTH_TOKEN_AGE = props.AUTH_TOKEN_AGE
+AUTH_CACHE_SIZE = props.AUTH_CACHE_SIZE
+AUTH_CACHE_TIMEOUT = props.AUTH_CACHE_TIMEOUT
+AUTH_SHARED_CACHE_TIMEOUT = props.AUTH_SHARED_CACHE_TIMEOUT
+# Process-local caches can't tell the other workers that a user expired.
+AUTH_SHARED_CACHE = props.CACHES_BACKEND not in ("dummy", "locmem")
 AUTH_REFRESH_TOKEN_TYPE = props.AUTH_REFRESH_TOKEN_TYPE
 AUTH_REFRESH_TOKEN_AGE = props.AUTH_REFRESH_TOKEN_AGE
 SIGNUP_TOKEN_TYPE = props.SIGNUP_TOKEN_TYPE
@@ -256,6 +256,14 @@ class Props:
     def CHANNELS_LAYERS_PASSWORD(self):
         return to_str(os.environ.get("CHANNELS_LAYERS_PASSWORD", ""))
 
+    @property
+    def CHANNELS_BATCH_WINDOW(self):
+        return to_int(os.environ.get("CHANNELS_BATCH_WINDOW", "20"))
+
+    @property
+    def CHANNELS_BATCH_SIZE(self):
+        return to_int(os.environ.get("CHANNELS_BATCH_SIZE", "100"))
+
     @property
     def CACHES_BACKEND(self):
         return to_str(os.environ.get("CACHES_BACKEND", "locmem"))
@@ -317,6 +325,14 @@ class Props:
     def DB_PASSWORD(self):
         return to_str(os.environ.get("DB_PASSWORD", ""))
 
+    @property
+    def DB_COUNT_MODE(self):
+        return to_str(os.environ.get("DB_COUNT_MODE", "exact"))
+
+    @property
+    def DB_COUNT_TIMEOUT(self):
+        return to_int(os.environ.get("DB_COUNT_TIMEOUT", "60"))
+
     @property
     def SQL_DEBUG(self):
         return to_bool(os.environ.get("SQL_DEBUG", "False"))
@@ -423,6 +439,18 @@ class Props:
     def AUTH_TOKEN_AGE(self):
         return to_int(os.environ.get("AUTH_TOKEN_AGE", "316224000"))  # noqa 10 years
 
+    @property
+    def AUTH_CACHE_SIZE(self):
+        return to_int(os.environ.get("AUTH_CACHE_SIZE", "1024"))
+
+    @property
+    def AUTH_CACHE_TIMEOUT(self):
+        return to_int(os.environ.get("AUTH_CACHE_TIMEOUT", "60"))  # 1 minute
+
+    @property
+    def AUTH_SHARED_CACHE_TIMEOUT(self):
+        return to_int(os.environ.get("AUTH_SHARED_CACHE_TIMEOUT", "3600"))  # 1 hour
+
     @property
     def AUTH_REFRESH_TOKEN_TYPE(self):
         return to_str(os.environ.get("AUTH_REFRESH_TOKEN_TYPE", "auth_refresh"))
@@ -487,6 +515,22 @@ class Props:
     def GQL_MAX_FIELDS(self):
         return to_int(os.environ.get("GQL_MAX_FIELDS", "2"))
 
+    @property
+    def GQL_MAX_COST(self):
+        return to_int(os.environ.get("GQL_MAX_COST", "10000"))
+
+    @property
+    def GQL_DOCUMENT_CACHE_SIZE(self):
+        return to_int(os.environ.get("GQL_DOCUMENT_CACHE_SIZE", "256"))
+
+    @property
+    def GQL_PERSISTED_QUERIES(self):
+        return to_bool(os.environ.get("GQL_PERSISTED_QUERIES", "True"))
+
+    @property
+    def GQL_PERSISTED_QUERY_TIMEOUT(self):
+        return to_int(os.environ.get("GQL_PERSISTED_QUERY_TIMEOUT", "86400"))  # 1 day
+
     @property
     def GQL_INTROSPECTION(self):
         return to_bool(os.environ.get("GQL_INTROSPECTION", "True"))
@@ -495,6 +539,10 @@ class Props:
     def GQL_GRAPHIQL(self):
         return to_bool(os.environ.get("GQL_GRAPHIQL", "True"))
 
+    @property
+    def GQL_ASYNC(self):
+        return to_bool(os.environ.get("GQL_ASYNC", "False"))
+
     @property
     def USE_ADMIN_SITE(self):
         return to_bool(os.environ.get("USE_ADMIN_SITE", "False"))
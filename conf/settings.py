@@ -171,7 +171,7 @@ REST_FRAMEWORK = {
     "DEFAULT_PAGINATION_CLASS": "apis.pi.pagination.CursorPagination",
     # "DEFAULT_VERSIONING_CLASS": "rest_framework.versioning.NamespaceVersioning",
     "DEFAULT_FILTER_BACKENDS": (
-        "django_filters.rest_framework.DjangoFilterBackend",
+        "apis.pi.filters.FilterBackend",
         #     "rest_framework.filters.OrderingFilter",
         #     "rest_framework.filters.SearchFilter",
     ),
@@ -189,6 +189,11 @@ USE_CHANNELS = env.USE_CHANNELS
 ASGI_APPLICATION = env.ASGI_APPLICATION
 CHANNEL_LAYERS = env.CHANNEL_LAYERS
 
+# Room messages are coalesced for a window (milliseconds) into batches of up
+# to a size, sent to the group once.
+CHANNELS_BATCH_WINDOW = env.CHANNELS_BATCH_WINDOW
+CHANNELS_BATCH_SIZE = env.CHANNELS_BATCH_SIZE
+
 ROOT_URLCONF = env.ROOT_URLCONF
 
 TEMPLATES = [
@@ -222,6 +227,10 @@ CACHES = env.CACHES
 
 DATABASES = env.DATABASES
 
+# Count mode of paginated collections: exact, cached or estimated.
+DB_COUNT_MODE = env.DB_COUNT_MODE
+DB_COUNT_TIMEOUT = env.DB_COUNT_TIMEOUT
+
 # Password validation
 # https://docs.djangoproject.com/en/3.0/ref/settings/#auth-password-validators
 
@@ -323,6 +332,7 @@ props.set_mail_props(sys.modules[__name__], backends=env.EMAIL_BACKENDS)
 USE_GRAPHQL = env.USE_GRAPHQL
 GRAPHENE = env.GRAPHENE
 GRAPHIQL = env.GRAPHIQL
+GQL_ASYNC = env.GQL_ASYNC
 
 # Celery: Distributed task queue. Celery is an
 # asynchronous task queue/job queue based on distributed message passing.
@@ -356,6 +366,10 @@ USE_ADMIN_SITE = env.USE_ADMIN_SITE
 
 AUTH_TOKEN_TYPE = env.AUTH_TOKEN_TYPE
 AUTH_TOKEN_AGE = env.AUTH_TOKEN_AGE
+AUTH_CACHE_SIZE = env.AUTH_CACHE_SIZE
+AUTH_CACHE_TIMEOUT = env.AUTH_CACHE_TIMEOUT
+AUTH_SHARED_CACHE_TIMEOUT = env.AUTH_SHARED_CACHE_TIMEOUT
+AUTH_SHARED_CACHE = env.AUTH_SHARED_CACHE
 AUTH_REFRESH_TOKEN_TYPE = env.AUTH_REFRESH_TOKEN_TYPE
 AUTH_REFRESH_TOKEN_AGE = env.AUTH_REFRESH_TOKEN_AGE
 SIGNUP_TOKEN_TYPE = env.SIGNUP_TOKEN_TYPE
@@ -37,13 +37,14 @@ if settings.USE_GRAPHQL:
     from django.views.decorators.csrf import csrf_exempt
 
     from apps.common.decorators import session_user_exempt
-    from apps.gql.views import GQLView
+    from apps.gql.views import AsyncGQLView, GQLView
 
+    view_class = AsyncGQLView if settings.GQL_ASYNC else GQLView
     urlpatterns.append(
         path(
             "gql",
             csrf_exempt(
-                session_user_exempt(GQLView.as_view(graphiql=settings.GRAPHIQL))
+                session_user_exempt(view_class.as_view(graphiql=settings.GRAPHIQL))
             ),
             name="gql",
         )
@@ -76,7 +76,8 @@ echo $ENV | grep -q "test" && \
         python manage.py test --settings tests.settings --keepdb -v2 \
             tests.apps \
             tests.apis.gql \
-            tests.apis.pi
+            tests.apis.pi \
+            tests.apis.ws
     "
 
 exit 0
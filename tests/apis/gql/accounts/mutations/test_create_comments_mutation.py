@@ -0,0 +1,67 @@
+import json
+
+from django.test import TestCase
+from django.urls import reverse
+
+from apps.accounts.models import Note
+
+
+class CreateCommentsMutationTestCase(TestCase):
+    """Create comments mutation test case"""
+
+    def setUp(self):
+        self.path = reverse("gql")
+        self.query = """
+          mutation CreateComments($input: [CreateCommentInput!]!) {
+            createComments(input: $input) {
+              comments {
+                id
+                content
+                user {
+                  email
+                }
+              }
+            }
+          }
+        """
+
+    def request(self, input):
+        return self.client.post(
+            self.path,
+            json.dumps(
+                {
+                    "operationName": "CreateComments",
+                    "query": self.query,
+                    "variables": {"input": input},
+                }
+            ),
+            content_type="application/json",
+        )
+
+    def test_create_comments(self):
+        response = self.request(
+            [
+                {"content": f"{x}", "user": {"email": f"user{x}@mail.com"}}
+                for x in range(3)
+            ]
+        )
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()["data"]
+        comments = data["createComments"]["comments"]
+        self.assertEqual([comment["content"] for comment in comments], ["0", "1", "2"])
+        self.assertEqual(comments[2]["user"]["email"], "user2@mail.com")
+        self.assertEqual(Note.objects.count(), 3)
+
+    def test_create_comments_errors(self):
+        response = self.request(
+            [
+                {"content": "...", "user": {"email": "user@mail.com"}},
+                {"content": "...", "user": {"email": "invalid"}},
+            ]
+        )
+
+        self.assertEqual(response.status_code, 200)
+        errors = response.json()["errors"]
+        self.assertEqual([error["field"] for error in errors], ["input.1.user.email"])
+        self.assertEqual(Note.objects.count(), 0)
@@ -0,0 +1,60 @@
+import json
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from apis.auth import TokenAuth
+
+User = get_user_model()
+
+
+class CreateNotesMutationTestCase(TestCase):
+    """Create notes mutation test case"""
+
+    def setUp(self):
+        self.user = User.objects.create(
+            username="user", email="user@mail.com", password="..."
+        )
+
+        self.path = reverse("gql")
+        self.query = """
+          mutation CreateNotes($input: [CreateNoteInput!]!) {
+            createNotes(input: $input) {
+              notes {
+                id
+                content
+              }
+            }
+          }
+        """
+
+    def request(self, input):
+        return self.client.post(
+            self.path,
+            json.dumps(
+                {
+                    "operationName": "CreateNotes",
+                    "query": self.query,
+                    "variables": {"input": input},
+                }
+            ),
+            content_type="application/json",
+            HTTP_AUTHORIZATION="%s %s" % (TokenAuth.keyword, self.user.get_token()),
+        )
+
+    def test_create_notes(self):
+        response = self.request([{"content": f"{x}"} for x in range(3)])
+
+        self.assertEqual(response.status_code, 200)
+        notes = response.json()["data"]["createNotes"]["notes"]
+        self.assertEqual([note["content"] for note in notes], ["0", "1", "2"])
+        self.assertEqual(self.user.notes.count(), 3)
+
+    def test_create_notes_errors(self):
+        response = self.request([{"content": "..."}, {"content": ""}])
+
+        self.assertEqual(response.status_code, 200)
+        errors = response.json()["errors"]
+        self.assertEqual([error["field"] for error in errors], ["input.1.content"])
+        self.assertEqual(self.user.notes.count(), 0)
@@ -0,0 +1,70 @@
+import json
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from apis.auth import TokenAuth
+from apps.accounts.models import Note
+from apps.gql.utils import to_global_id
+
+User = get_user_model()
+
+
+class DeleteNotesMutationTestCase(TestCase):
+    """Delete notes mutation test case"""
+
+    def setUp(self):
+        self.user = User.objects.create(
+            username="user", email="user@mail.com", password="..."
+        )
+        self.other = User.objects.create(username="other", password="...")
+        self.notes = [self.user.notes.create(content="...") for _ in range(3)]
+        self.other_note = self.other.notes.create(content="...")
+
+        self.path = reverse("gql")
+        self.query = """
+          mutation DeleteNotes($ids: [ID!]!) {
+            deleteNotes(ids: $ids) {
+              notes {
+                id
+              }
+            }
+          }
+        """
+
+    def request(self, ids):
+        return self.client.post(
+            self.path,
+            json.dumps(
+                {
+                    "operationName": "DeleteNotes",
+                    "query": self.query,
+                    "variables": {"ids": ids},
+                }
+            ),
+            content_type="application/json",
+            HTTP_AUTHORIZATION="%s %s" % (TokenAuth.keyword, self.user.get_token()),
+        )
+
+    def test_delete_notes(self):
+        ids = [to_global_id("Note", note.pk) for note in self.notes[:2]]
+        response = self.request(ids)
+
+        self.assertEqual(response.status_code, 200)
+        notes = response.json()["data"]["deleteNotes"]["notes"]
+        self.assertEqual([note["id"] for note in notes], ids)
+        self.assertEqual(list(self.user.notes.all()), self.notes[2:])
+
+    def test_delete_notes_errors(self):
+        response = self.request(
+            [
+                to_global_id("Note", self.notes[0].pk),
+                to_global_id("Note", self.other_note.pk),
+            ]
+        )
+
+        self.assertEqual(response.status_code, 200)
+        errors = response.json()["errors"]
+        self.assertEqual([error["field"] for error in errors], ["ids.1.perm"])
+        self.assertEqual(Note.objects.count(), 4)
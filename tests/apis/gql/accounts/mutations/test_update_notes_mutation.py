@@ -0,0 +1,83 @@
+import json
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from apis.auth import TokenAuth
+from apps.gql.utils import to_global_id
+
+User = get_user_model()
+
+
+class UpdateNotesMutationTestCase(TestCase):
+    """Update notes mutation test case"""
+
+    def setUp(self):
+        self.user = User.objects.create(
+            username="user", email="user@mail.com", password="..."
+        )
+        self.other = User.objects.create(username="other", password="...")
+        self.notes = [self.user.notes.create(content="...") for _ in range(3)]
+        self.other_note = self.other.notes.create(content="...")
+
+        self.path = reverse("gql")
+        self.query = """
+          mutation UpdateNotes($input: [BulkUpdateNoteInput!]!) {
+            updateNotes(input: $input) {
+              notes {
+                id
+                content
+              }
+            }
+          }
+        """
+
+    def request(self, input):
+        return self.client.post(
+            self.path,
+            json.dumps(
+                {
+                    "operationName": "UpdateNotes",
+                    "query": self.query,
+                    "variables": {"input": input},
+                }
+            ),
+            content_type="application/json",
+            HTTP_AUTHORIZATION="%s %s" % (TokenAuth.keyword, self.user.get_token()),
+        )
+
+    def test_update_notes(self):
+        input = [
+            {"id": to_global_id("Note", note.pk), "content": f"{x}"}
+            for x, note in enumerate(self.notes)
+        ]
+        self.request(input)
+
+        # One lookup and one update of every note, inside a savepoint.
+        with self.assertNumQueries(4):
+            response = self.request(input)
+
+        self.assertEqual(response.status_code, 200)
+        notes = response.json()["data"]["updateNotes"]["notes"]
+        self.assertEqual([note["content"] for note in notes], ["0", "1", "2"])
+        for x, note in enumerate(self.notes):
+            note.refresh_from_db()
+            self.assertEqual(note.content, f"{x}")
+
+    def test_update_notes_errors(self):
+        response = self.request(
+            [
+                {"id": to_global_id("Note", self.notes[0].pk), "content": "new"},
+                {"id": to_global_id("Note", self.other_note.pk), "content": "new"},
+                {"id": to_global_id("Note", "missing"), "content": "new"},
+            ]
+        )
+
+        self.assertEqual(response.status_code, 200)
+        errors = response.json()["errors"]
+        self.assertEqual(
+            [error["field"] for error in errors], ["input.1.id.perm", "input.2.id"]
+        )
+        self.notes[0].refresh_from_db()
+        self.assertEqual(self.notes[0].content, "...")
@@ -65,3 +65,30 @@ class CommentsQueryTestCase(TestCase):
         self.assertEqual(response.status_code, 200)
         data = response.json()["data"]
         self.assertEqual(len(data["comments"]["edges"]), 5)
+
+    def test_comments_users(self):
+        users = User.objects.bulk_create(
+            [User(username=f"user{i}", email=f"user{i}@mail.com") for i in range(5)]
+        )
+        Note.objects.bulk_create([Note(user=user, content="...") for user in users])
+
+        with self.assertNumQueries(2):
+            response = self.client.post(
+                self.path,
+                json.dumps(
+                    {
+                        "operationName": "Comments",
+                        "query": self.query,
+                        "variables": {
+                            "first": 10,
+                        },
+                    }
+                ),
+                content_type="application/json",
+            )
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()["data"]
+        self.assertEqual(len(data["comments"]["edges"]), 10)
+        emails = {edge["node"]["user"]["email"] for edge in data["comments"]["edges"]}
+        self.assertEqual(len(emails), 6)
@@ -62,3 +62,35 @@ class NotesQueryTestCase(TestCase):
         self.assertEqual(response.status_code, 200)
         data = response.json()["data"]
         self.assertEqual(len(data["notes"]["edges"]), 5)
+
+    def test_notes_total_count(self):
+        response = self.client.post(
+            self.path,
+            json.dumps(
+                {
+                    "operationName": "Notes",
+                    "query": """
+                      query Notes($first: Int!) {
+                        notes(first: $first) {
+                          totalCount
+                          edges {
+                            node {
+                              id
+                            }
+                          }
+                        }
+                      }
+                    """,
+                    "variables": {
+                        "first": 2,
+                    },
+                }
+            ),
+            content_type="application/json",
+            HTTP_AUTHORIZATION="%s %s" % (TokenAuth.keyword, self.user.get_token()),
+        )
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()["data"]
+        self.assertEqual(len(data["notes"]["edges"]), 2)
+        self.assertEqual(data["notes"]["totalCount"], 5)
@@ -1,10 +1,13 @@
 import json
 
 from django.contrib.auth import get_user_model
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from apis.auth import TokenAuth
+from apps.accounts.models import UserSearchKey
 
 User = get_user_model()
 
@@ -23,6 +26,7 @@ class UsersQueryTestCase(TestCase):
         self.users = User.objects.bulk_create(
             [User(username=f"user.{x}", password="...") for x in range(5)]
         )
+        UserSearchKey.update_users(self.users, adding=True)
 
         self.path = reverse("gql")
         self.query = """
@@ -67,3 +71,27 @@ class UsersQueryTestCase(TestCase):
         self.assertEqual(response.status_code, 200)
         data = response.json()["data"]
         self.assertEqual(len(data["users"]["edges"]), 5)
+
+    def test_users_projection(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                self.path,
+                json.dumps(
+                    {
+                        "operationName": "Users",
+                        "query": self.query,
+                        "variables": {
+                            "first": 5,
+                            "search": "user.",
+                        },
+                    }
+                ),
+                content_type="application/json",
+                HTTP_AUTHORIZATION="%s %s"
+                % (TokenAuth.keyword, self.superuser.get_token()),
+            )
+
+        self.assertEqual(response.status_code, 200)
+        sql = queries[-1]["sql"]
+        self.assertIn('"accounts_user"."username"', sql)
+        self.assertNotIn('"accounts_user"."tfa_secret"', sql)
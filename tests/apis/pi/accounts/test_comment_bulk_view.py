@@ -0,0 +1,114 @@
+import json
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from apps.accounts.models import Note
+
+User = get_user_model()
+
+
+class CommentBulkViewTestCase(TestCase):
+    """Comment bulk view test case"""
+
+    def setUp(self):
+        self.comments = [
+            Note(content="...", user=User(username=f"user.{x}", password="..."))
+            for x in range(3)
+        ]
+        User.objects.bulk_create([comment.user for comment in self.comments])
+        Note.objects.bulk_create(self.comments)
+
+        self.path = reverse("pi:v1:accounts:comment_bulk")
+
+    def request(self, method, data):
+        return getattr(self.client, method)(
+            self.path, json.dumps(data), content_type="application/json"
+        )
+
+    def test_create(self):
+        with self.assertNumQueries(5):
+            response = self.request(
+                "post",
+                [
+                    {"content": f"{x}", "user": {"email": f"user{x}@mail.com"}}
+                    for x in range(3)
+                ],
+            )
+
+        self.assertEqual(response.status_code, 201)
+        data = response.json()
+        self.assertEqual(
+            [comment["user"]["email"] for comment in data],
+            [f"user{x}@mail.com" for x in range(3)],
+        )
+        self.assertEqual(Note.objects.count(), 6)
+        self.assertFalse(User.objects.get(email="user0@mail.com").is_active)
+
+    def test_create_errors(self):
+        response = self.request(
+            "post",
+            [
+                {"content": "...", "user": {"email": "user@mail.com"}},
+                {"content": "...", "user": {"email": "invalid"}},
+            ],
+        )
+
+        self.assertEqual(response.status_code, 400)
+        errors = response.json()["errors"]
+        self.assertEqual([error["field"] for error in errors], ["1.user.email"])
+        self.assertEqual(Note.objects.count(), 3)
+
+    def test_update(self):
+        response = self.request(
+            "patch",
+            [
+                {"id": comment.id, "user": {"first_name": f"{x}"}}
+                for x, comment in enumerate(self.comments)
+            ],
+        )
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(
+            [comment["user"]["first_name"] for comment in data], ["0", "1", "2"]
+        )
+        for x, comment in enumerate(self.comments):
+            comment.user.refresh_from_db()
+            self.assertEqual(comment.user.first_name, f"{x}")
+
+    def test_update_queries(self):
+        def update(count):
+            comments = Note.objects.bulk_create(
+                [
+                    Note(
+                        content="...",
+                        user=User.objects.create(username=f"u{count}.{x}"),
+                    )
+                    for x in range(count)
+                ]
+            )
+            with self.assertNumQueries(8):
+                response = self.request(
+                    "patch",
+                    [
+                        {"id": comment.id, "user": {"last_name": f"{x}"}}
+                        for x, comment in enumerate(comments)
+                    ],
+                )
+            self.assertEqual(response.status_code, 200)
+
+        update(3)
+        update(30)
+
+    def test_delete(self):
+        response = self.request(
+            "delete", {"ids": [comment.id for comment in self.comments[:2]]}
+        )
+
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(list(Note.objects.all()), self.comments[2:])
+        self.assertEqual(
+            list(User.objects.values_list("pk", flat=True)), [self.comments[2].user_id]
+        )
@@ -1,7 +1,9 @@
 import json
 
 from django.contrib.auth import get_user_model
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from apps.accounts.models import Note
@@ -34,6 +36,25 @@ class CommentViewTestCase(TestCase):
         data = response.json()
         self.assertEqual(len(data["results"]), 5)
 
+    def test_list_fields(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.path, {"fields": "id,content"})
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(set(data["results"][0]), {"id", "content"})
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('"accounts_note"."user_id"', queries[0]["sql"])
+        self.assertNotIn('"accounts_note"."modified"', queries[0]["sql"])
+
+    def test_list_user_fields(self):
+        with self.assertNumQueries(2):
+            response = self.client.get(self.path, {"fields": "id,user"})
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(set(data["results"][0]), {"id", "user"})
+
     def test_create(self):
         response = self.client.post(
             self.path,
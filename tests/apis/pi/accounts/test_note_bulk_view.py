@@ -0,0 +1,127 @@
+import json
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from apis.auth import TokenAuth
+from apps.accounts.models import Note
+
+User = get_user_model()
+
+
+class NoteBulkViewTestCase(TestCase):
+    """Note bulk view test case"""
+
+    def setUp(self):
+        self.user = User.objects.create(
+            username="user", email="user@mail.com", password="..."
+        )
+        self.other = User.objects.create(username="other", password="...")
+        self.notes = Note.objects.bulk_create(
+            [Note(user=self.user, content="...") for _ in range(3)]
+        )
+        self.other_note = Note.objects.create(user=self.other, content="...")
+
+        self.path = reverse("pi:v1:accounts:note_bulk")
+        self.auth = "%s %s" % (TokenAuth.keyword, self.user.get_token())
+
+    def request(self, method, data):
+        return getattr(self.client, method)(
+            self.path,
+            json.dumps(data),
+            content_type="application/json",
+            HTTP_AUTHORIZATION=self.auth,
+        )
+
+    def test_create(self):
+        response = self.request("post", [{"content": "1"}, {"content": "2"}])
+
+        self.assertEqual(response.status_code, 201)
+        data = response.json()
+        self.assertEqual([note["content"] for note in data], ["1", "2"])
+        self.assertEqual(self.user.notes.count(), 5)
+
+    def test_create_errors(self):
+        response = self.request("post", [{"content": "1"}, {}])
+
+        self.assertEqual(response.status_code, 400)
+        errors = response.json()["errors"]
+        self.assertEqual([error["field"] for error in errors], ["1.content"])
+        self.assertEqual(self.user.notes.count(), 3)
+
+    def test_update(self):
+        with self.assertNumQueries(4):
+            response = self.request(
+                "patch",
+                [
+                    {"id": note.id, "content": f"{x}"}
+                    for x, note in enumerate(self.notes)
+                ],
+            )
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual([note["id"] for note in data], [n.id for n in self.notes])
+        self.assertEqual([note["content"] for note in data], ["0", "1", "2"])
+        for x, note in enumerate(self.notes):
+            note.refresh_from_db()
+            self.assertEqual(note.content, f"{x}")
+
+    def test_update_errors(self):
+        response = self.request(
+            "patch",
+            [
+                {"id": self.notes[0].id, "content": "1"},
+                {"id": self.notes[1].id, "content": "x" * 1001},
+                {"id": self.notes[0].id, "content": "2"},
+            ],
+        )
+
+        self.assertEqual(response.status_code, 400)
+        errors = response.json()["errors"]
+        self.assertEqual([error["field"] for error in errors], ["1.content", "2.id"])
+        for note in self.notes:
+            note.refresh_from_db()
+            self.assertEqual(note.content, "...")
+
+    def test_update_not_found(self):
+        response = self.request(
+            "put",
+            [
+                {"id": self.notes[0].id, "content": "1"},
+                {"id": self.other_note.id, "content": "2"},
+            ],
+        )
+
+        self.assertEqual(response.status_code, 400)
+        errors = response.json()["errors"]
+        self.assertEqual([error["field"] for error in errors], ["1.id"])
+        self.notes[0].refresh_from_db()
+        self.assertEqual(self.notes[0].content, "...")
+
+    def test_delete(self):
+        with self.assertNumQueries(4):
+            response = self.request(
+                "delete", {"ids": [note.id for note in self.notes[:2]]}
+            )
+
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(list(self.user.notes.all()), self.notes[2:])
+
+    def test_delete_not_found(self):
+        response = self.request(
+            "delete", {"ids": [self.notes[0].id, self.other_note.id]}
+        )
+
+        self.assertEqual(response.status_code, 400)
+        errors = response.json()["errors"]
+        self.assertEqual([error["field"] for error in errors], ["ids.1"])
+        self.assertEqual(Note.objects.count(), 4)
+
+    def test_unauthenticated(self):
+        response = self.client.post(
+            self.path, json.dumps([{"content": "..."}]), content_type="application/json"
+        )
+
+        self.assertEqual(response.status_code, 401)
@@ -39,6 +39,94 @@ class NoteViewTestCase(TestCase):
         data = response.json()
         self.assertEqual(len(data["results"]), 5)
 
+    def test_list_pages(self):
+        auth = "%s %s" % (TokenAuth.keyword, self.user.get_token())
+        response = self.client.get(
+            self.path, {"limit": 2, "count": "true"}, HTTP_AUTHORIZATION=auth
+        )
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["count"], 5)
+        self.assertIsNone(data["previous"])
+        ids = [note["id"] for note in data["results"]]
+
+        while data["next"]:
+            response = self.client.get(data["next"], HTTP_AUTHORIZATION=auth)
+            data = response.json()
+            self.assertNotIn("count", data)
+            ids.extend(note["id"] for note in data["results"])
+
+        self.assertEqual(len(ids), 5)
+        self.assertEqual(len(set(ids)), 5)
+
+        response = self.client.get(data["previous"], HTTP_AUTHORIZATION=auth)
+        data = response.json()
+        self.assertEqual([note["id"] for note in data["results"]], ids[2:4])
+        self.assertIsNotNone(data["next"])
+
+    def test_list_invalid_cursor(self):
+        response = self.client.get(
+            self.path,
+            {"cursor": "invalid"},
+            HTTP_AUTHORIZATION="%s %s" % (TokenAuth.keyword, self.user.get_token()),
+        )
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_list_search(self):
+        note = self.user.notes.create(content="Blood Orange")
+        self.notes.append(note)
+
+        response = self.client.get(
+            self.path,
+            {"search": "orange"},
+            HTTP_AUTHORIZATION="%s %s" % (TokenAuth.keyword, self.user.get_token()),
+        )
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual([note["id"] for note in data["results"]], [note.id])
+
+    def test_list_stream(self):
+        auth = "%s %s" % (TokenAuth.keyword, self.user.get_token())
+        paginated = self.client.get(self.path, HTTP_AUTHORIZATION=auth).json()
+
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                self.path, {"stream": "json"}, HTTP_AUTHORIZATION=auth
+            )
+            content = b"".join(response.streaming_content)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertEqual(json.loads(content), paginated["results"])
+
+    def test_list_stream_ndjson(self):
+        response = self.client.get(
+            self.path,
+            {"stream": "ndjson", "fields": "id"},
+            HTTP_AUTHORIZATION="%s %s" % (TokenAuth.keyword, self.user.get_token()),
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(
+            sorted(json.loads(line)["id"] for line in lines),
+            sorted(note.id for note in self.notes),
+        )
+
+    def test_list_stream_empty(self):
+        self.user.notes.all().delete()
+        response = self.client.get(
+            self.path,
+            {"stream": "json"},
+            HTTP_AUTHORIZATION="%s %s" % (TokenAuth.keyword, self.user.get_token()),
+        )
+
+        self.assertEqual(b"".join(response.streaming_content), b"[]")
+
     def test_create(self):
         response = self.client.post(
             self.path,
@@ -0,0 +1,121 @@
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import RequestFactory, TestCase
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.request import Request
+
+from apis.pi import compiled
+from apis.pi.accounts.serializers import (
+    ListCommentSerializer,
+    ListNoteSerializer,
+    ListUserSerializer,
+)
+from apps.accounts.models import Note
+
+User = get_user_model()
+
+
+class MethodSerializer(serializers.ModelSerializer):
+    """Method serializer"""
+
+    compiled = True
+    name = serializers.SerializerMethodField()
+
+    def get_name(self, obj):
+        return obj.username.upper()
+
+    class Meta:
+        model = User
+        fields = ("id", "name")
+
+
+def all_subclasses(cls):
+    for subclass in cls.__subclasses__():
+        yield subclass
+        yield from all_subclasses(subclass)
+
+
+class CompiledTestCase(TestCase):
+    """Compiled test case"""
+
+    def setUp(self):
+        self.user = User.objects.create(
+            username="user",
+            password="...",
+            email="user@mail.com",
+            birthday=date(2000, 1, 1),
+            last_login=timezone.now(),
+            tfa_secret="secret",
+            avatar=SimpleUploadedFile("avatar.png", b"..."),
+        )
+        self.other = User.objects.create(username="other", password="...")
+        self.notes = [
+            Note.objects.create(user=user, content=f"{x}")
+            for x in range(3)
+            for user in (self.user, self.other)
+        ]
+
+    def tearDown(self):
+        self.user.avatar.delete(save=False)
+
+    def get_serializer(self, serializer_class, instance, **params):
+        request = Request(RequestFactory().get("/", params))
+        return serializer_class(instance, many=True, context={"request": request})
+
+    def assertCompiled(self, serializer_class, instance, **params):
+        serializer = self.get_serializer(serializer_class, instance, **params)
+        self.assertIsNotNone(compiled.compile_serializer(serializer.child))
+        data = compiled.serialize(serializer)
+        self.assertEqual(
+            data, self.get_serializer(serializer_class, instance, **params).data
+        )
+        return data
+
+    def test_notes(self):
+        data = self.assertCompiled(ListNoteSerializer, self.notes)
+        self.assertTrue(data[0]["created"].endswith("Z"))
+
+    def test_comments(self):
+        data = self.assertCompiled(ListCommentSerializer, self.notes)
+        self.assertEqual(data[0]["user"]["email"], "user@mail.com")
+
+    def test_users(self):
+        data = self.assertCompiled(
+            ListUserSerializer, User.objects.order_by("username")
+        )
+        self.assertIsNone(data[0]["last_login"])
+        self.assertIsNone(data[0]["birthday"])
+        self.assertEqual(data[1]["birthday"], "2000-01-01")
+        self.assertTrue(data[1]["avatar"].startswith("http://testserver/"))
+        self.assertTrue(data[1]["tfa_active"])
+
+    def test_timezone(self):
+        with timezone.override("America/Bogota"):
+            data = self.assertCompiled(ListNoteSerializer, self.notes)
+        self.assertTrue(data[0]["created"].endswith("-05:00"))
+
+    def test_fields(self):
+        data = self.assertCompiled(ListCommentSerializer, self.notes, fields="id,user")
+        self.assertEqual(set(data[0]), {"id", "user"})
+
+    def test_all_compiled(self):
+        classes = [
+            serializer_class
+            for serializer_class in all_subclasses(serializers.ModelSerializer)
+            if getattr(serializer_class, "compiled", False)
+            and serializer_class.__module__.startswith("apis.")
+        ]
+        self.assertGreaterEqual(len(classes), 3)
+
+        for serializer_class in classes:
+            model = serializer_class.Meta.model
+            with self.subTest(serializer_class.__name__):
+                self.assertCompiled(serializer_class, model.objects.order_by("pk"))
+
+    def test_method_field(self):
+        serializer = self.get_serializer(MethodSerializer, [self.user])
+        self.assertIsNone(compiled.compile_serializer(serializer.child))
+        self.assertEqual(compiled.serialize(serializer), serializer.data)
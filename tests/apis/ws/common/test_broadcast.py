@@ -0,0 +1,228 @@
+import asyncio
+import json
+
+import msgpack
+from asgiref.testing import ApplicationCommunicator
+from channels.layers import InMemoryChannelLayer, get_channel_layer
+from channels.routing import URLRouter
+from django.test import SimpleTestCase, override_settings
+
+from apis.ws.common.broadcast import Broadcaster, rooms
+from apis.ws.common.urls import urlpatterns
+
+
+class CountingChannelLayer(InMemoryChannelLayer):
+    """Channel layer counting group sends"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.group_sends = 0
+
+    async def group_send(self, group, message):
+        self.group_sends += 1
+        await super().group_send(group, message)
+
+
+class Communicator(ApplicationCommunicator):
+    """WebSocket communicator"""
+
+    def __init__(self, application, path, subprotocols=()):
+        super().__init__(
+            application,
+            {
+                "type": "websocket",
+                "path": path,
+                "query_string": b"",
+                "headers": [],
+                "subprotocols": list(subprotocols),
+            },
+        )
+
+    async def connect(self):
+        await self.send_input({"type": "websocket.connect"})
+        message = await self.receive_output(1)
+        self.subprotocol = message.get("subprotocol")
+        return message["type"] == "websocket.accept"
+
+    async def send_text(self, text_data):
+        await self.send_input({"type": "websocket.receive", "text": text_data})
+
+    async def receive_json(self):
+        return json.loads((await self.receive_output(1))["text"])
+
+    async def receive_msgpack(self):
+        return msgpack.unpackb((await self.receive_output(1))["bytes"])
+
+    async def disconnect(self):
+        await self.send_input({"type": "websocket.disconnect", "code": 1000})
+        await self.wait(1)
+
+
+class BroadcasterTestCase(SimpleTestCase):
+    """Broadcaster test case"""
+
+    def setUp(self):
+        self.layer = CountingChannelLayer()
+        self.broadcaster = Broadcaster("room", "room.batch", window=0.01, max_size=3)
+
+    async def receive_all(self, channel):
+        frames = []
+        while True:
+            try:
+                event = await asyncio.wait_for(self.layer.receive(channel), 0.05)
+            except asyncio.TimeoutError:
+                return frames
+            self.assertEqual(event["type"], "room.batch")
+            frame = json.loads(event["text_data"])
+            self.assertEqual(msgpack.unpackb(event["bytes_data"]), frame)
+            frames.append(frame)
+
+    def run_sends(self, messages):
+        async def run():
+            channel = await self.layer.new_channel()
+            await self.layer.group_add("room", channel)
+            for message in messages:
+                await self.broadcaster.send(self.layer, "room", message)
+            return await self.receive_all(channel)
+
+        return asyncio.run(run())
+
+    def test_single(self):
+        frames = self.run_sends(["a"])
+
+        self.assertEqual(frames, [{"action": "room", "data": "a", "error": None}])
+        self.assertEqual(self.layer.group_sends, 1)
+
+    def test_batch(self):
+        frames = self.run_sends(["a", "b"])
+
+        self.assertEqual(
+            frames, [{"action": "room.batch", "data": ["a", "b"], "error": None}]
+        )
+        self.assertEqual(self.layer.group_sends, 1)
+
+    def test_failure(self):
+        async def group_send(group, message):
+            raise ConnectionError("layer down")
+
+        async def run():
+            self.layer.group_send = group_send
+            await self.broadcaster.send(self.layer, "room", "a")
+            await asyncio.wait(list(self.broadcaster.tasks))
+
+        with self.assertLogs("apis.ws.common.broadcast", "ERROR") as logs:
+            asyncio.run(run())
+
+        self.assertIn("room", logs.output[0])
+        self.assertEqual(self.broadcaster.batches, {})
+        self.assertEqual(self.broadcaster.tasks, set())
+
+    def test_cancel(self):
+        async def run():
+            await self.broadcaster.send(self.layer, "room", "a")
+
+        asyncio.run(run())
+
+        self.assertEqual(self.layer.group_sends, 0)
+        self.assertEqual(self.broadcaster.batches, {})
+        self.assertEqual(self.run_sends(["b"])[0]["data"], "b")
+
+    def test_max_size(self):
+        frames = self.run_sends(["a", "b", "c", "d"])
+
+        self.assertEqual([frame["data"] for frame in frames], [["a", "b", "c"], "d"])
+        self.assertEqual(self.layer.group_sends, 2)
+        self.assertEqual(self.broadcaster.batches, {})
+
+
+@override_settings(
+    CHANNEL_LAYERS={"default": {"BACKEND": "channels.layers.InMemoryChannelLayer"}}
+)
+class ChatConsumerTestCase(SimpleTestCase):
+    """Chat consumer test case"""
+
+    def test_room(self):
+        async def run():
+            application = URLRouter(urlpatterns)
+            first = Communicator(application, "/rooms/room")
+            second = Communicator(application, "/rooms/room")
+            for communicator in (first, second):
+                self.assertTrue(await communicator.connect())
+
+            await first.send_text("hello")
+            await second.send_text("bye")
+            frames = [await first.receive_json(), await second.receive_json()]
+            for communicator in (first, second):
+                self.assertTrue(await communicator.receive_nothing(0.05))
+                await communicator.disconnect()
+            return frames
+
+        frames = asyncio.run(run())
+
+        self.assertEqual(frames[0], frames[1])
+        self.assertEqual(frames[0]["action"], "room.batch")
+        self.assertEqual(
+            sorted(message["message"] for message in frames[0]["data"]),
+            ["bye", "hello"],
+        )
+        self.assertEqual(rooms.batches, {})
+
+    def test_room_message(self):
+        async def run():
+            application = URLRouter(urlpatterns)
+            communicator = Communicator(application, "/rooms/room")
+            self.assertTrue(await communicator.connect())
+            await get_channel_layer().group_send(
+                "room_room", {"type": "room.message", "text_data": "hello"}
+            )
+            frame = await communicator.receive_json()
+            await communicator.disconnect()
+            return frame
+
+        frame = asyncio.run(run())
+
+        self.assertEqual(frame["action"], "room")
+        self.assertEqual(frame["data"]["message"], "hello")
+
+    def test_binary_room(self):
+        async def run():
+            application = URLRouter(urlpatterns)
+            text = Communicator(application, "/rooms/room")
+            binary = Communicator(application, "/rooms/room", ["msgpack"])
+            for communicator in (text, binary):
+                self.assertTrue(await communicator.connect())
+            self.assertIsNone(text.subprotocol)
+            self.assertEqual(binary.subprotocol, "msgpack")
+
+            await text.send_text("hello")
+            frames = [await text.receive_json(), await binary.receive_msgpack()]
+            for communicator in (text, binary):
+                await communicator.disconnect()
+            return frames
+
+        frames = asyncio.run(run())
+
+        self.assertEqual(frames[0], frames[1])
+        self.assertEqual(
+            frames[0],
+            {
+                "action": "room",
+                "data": {"user": "AnonymousUser", "message": "hello"},
+                "error": None,
+            },
+        )
+
+    def test_binary_echo(self):
+        async def run():
+            application = URLRouter(urlpatterns)
+            communicator = Communicator(application, "/echo", ["msgpack"])
+            self.assertTrue(await communicator.connect())
+            await communicator.send_text("hello")
+            frame = await communicator.receive_msgpack()
+            await communicator.disconnect()
+            return frame
+
+        frame = asyncio.run(run())
+
+        self.assertEqual(frame["action"], "echo")
+        self.assertEqual(frame["data"]["message"], "hello")
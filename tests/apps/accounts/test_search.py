@@ -0,0 +1,124 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from apps.accounts.models import Note, UserSearchKey
+from apps.accounts.search import search_notes, search_users
+
+User = get_user_model()
+
+
+class SearchTestCase(TestCase):
+    """Search test case"""
+
+    def setUp(self):
+        self.user = User.objects.create(
+            username="user", email="user@mail.com", password="..."
+        )
+        self.notes = Note.objects.bulk_create(
+            [
+                Note(user=self.user, content=content)
+                for content in ("Blood Orange", "Orange", "Lemon")
+            ]
+        )
+
+    def search(self, value):
+        return sorted(note.content for note in search_notes(Note.objects.all(), value))
+
+    def test_search_column(self):
+        self.assertEqual(
+            sorted(Note.objects.values_list("search", flat=True)),
+            ["blood orange", "lemon", "orange"],
+        )
+
+        note = self.notes[2]
+        note.content = "Lime"
+        note.save(update_fields=["content"])
+        note.refresh_from_db()
+        self.assertEqual(note.search, "lime")
+
+        note.content = "Lime juice"
+        Note.objects.bulk_update([note], ["content"])
+        note.refresh_from_db()
+        self.assertEqual(note.search, "lime juice")
+
+    def test_search(self):
+        self.assertEqual(self.search("ORANGE"), ["Blood Orange", "Orange"])
+        self.assertEqual(self.search("range b"), [])
+        self.assertEqual(self.search("lem"), ["Lemon"])
+
+    def test_search_after_write(self):
+        Note.objects.create(user=self.user, content="Lime")
+        self.notes[0].content = "Lime juice"
+        self.notes[0].save()
+
+        self.assertEqual(self.search("lime"), ["Lime", "Lime juice"])
+        self.assertEqual(self.search("blood"), [])
+
+
+class UserSearchTestCase(TestCase):
+    """User search test case"""
+
+    def setUp(self):
+        self.user = User.objects.create(
+            username="jdoe", email="John@mail.com", password="...", last_name="Doe"
+        )
+        self.others = User.objects.bulk_create(
+            [
+                User(username=f"user{x}", email=f"user{x}@mail.com", phone=f"555{x}")
+                for x in range(3)
+            ]
+        )
+        UserSearchKey.update_users(self.others, adding=True)
+
+    def search(self, value):
+        return sorted(user.username for user in search_users(User.objects.all(), value))
+
+    def keys(self, user):
+        return set(
+            UserSearchKey.objects.filter(user=user).values_list("key", flat=True)
+        )
+
+    def test_keys(self):
+        self.assertEqual(self.keys(self.user), {"jdoe", "john@mail.com", "doe"})
+        self.assertEqual(self.keys(self.others[1]), {"user1", "user1@mail.com", "5551"})
+
+    def test_keys_update(self):
+        self.user.first_name = "John"
+        self.user.save(update_fields=["first_name"])
+        self.assertIn("john", self.keys(self.user))
+
+        with self.assertNumQueries(1):
+            self.user.update_last_login()
+
+        self.others[0].last_name = "Roe"
+        User.objects.bulk_update([self.others[0]], ["last_name"])
+        UserSearchKey.update_users([self.others[0]])
+        self.assertIn("roe", self.keys(self.others[0]))
+
+    def test_keys_full_save(self):
+        user = User.objects.get(pk=self.user.pk)
+        with self.assertNumQueries(1):
+            user.save()
+
+        user.last_name = "Roe"
+        with self.assertNumQueries(3):
+            user.save()
+        self.assertEqual(self.keys(user), {"jdoe", "john@mail.com", "roe"})
+
+        user = User.objects.only("id", "username").get(pk=self.user.pk)
+        user.username = "jroe"
+        user.save(update_fields=["username"])
+        self.assertEqual(self.keys(user), {"jroe", "john@mail.com", "roe"})
+
+    def test_search(self):
+        self.assertEqual(self.search("JOH"), ["jdoe"])
+        self.assertEqual(self.search("doe"), ["jdoe"])
+        self.assertEqual(self.search("user"), ["user0", "user1", "user2"])
+        self.assertEqual(self.search("5552"), ["user2"])
+        self.assertEqual(self.search("mail"), [])
+
+    def test_delete(self):
+        pk = self.user.pk
+        self.user.delete()
+        self.assertFalse(UserSearchKey.objects.filter(user=pk).exists())
+        self.assertEqual(self.search("doe"), [])
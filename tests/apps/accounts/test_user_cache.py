@@ -0,0 +1,196 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group, Permission
+from django.test import RequestFactory, TestCase, override_settings
+from django.utils import timezone
+
+from apis.auth import AuthError, TokenAuth, has_perm
+from apps.accounts.cache import get_user, user_cache, user_perms
+from apps.common.cache import TieredCache
+
+User = get_user_model()
+
+
+class UserCacheTestCase(TestCase):
+    """User cache test case"""
+
+    def setUp(self):
+        self.user = User.objects.create(
+            username="user",
+            email="user@mail.com",
+            password="...",
+            renewed=timezone.now() - timedelta(hours=1),
+        )
+        self.factory = RequestFactory()
+
+    def tearDown(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.delete()
+
+    def authenticate(self, token):
+        request = self.factory.get(
+            "/", HTTP_AUTHORIZATION="%s %s" % (TokenAuth.keyword, token)
+        )
+        return TokenAuth.authenticate(request)
+
+    def test_cached(self):
+        token = self.user.get_token()
+        self.authenticate(token)
+
+        with self.assertNumQueries(0):
+            user = self.authenticate(token)
+
+        self.assertEqual(user.pk, self.user.pk)
+        self.assertEqual(user.username, self.user.username)
+        self.assertIn("password", user.get_deferred_fields())
+
+    def test_expire_keys(self):
+        token = self.user.get_token()
+        self.authenticate(token)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.expire_keys()
+            self.assertIn(self.user.pk, user_cache)
+        self.assertNotIn(self.user.pk, user_cache)
+
+        with self.assertRaises(AuthError):
+            self.authenticate(token)
+
+    def test_inactive(self):
+        token = self.user.get_token()
+        self.authenticate(token)
+
+        self.user.is_active = False
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.save(update_fields=["is_active"])
+
+        with self.assertRaises(AuthError):
+            self.authenticate(token)
+
+    def test_perms(self):
+        permission = Permission.objects.get(codename="view_note")
+        get_user(User, self.user.pk)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.user_permissions.add(permission)
+        self.assertNotIn(self.user.pk, user_cache)
+
+        user = get_user(User, self.user.pk)
+        with self.assertNumQueries(0):
+            self.assertTrue(user.has_perm("accounts.view_note"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.user_permissions.remove(permission)
+        user = get_user(User, self.user.pk)
+        self.assertFalse(user.has_perm("accounts.view_note"))
+
+    @override_settings(AUTH_SHARED_CACHE=False)
+    def test_local_cache(self):
+        get_user(User, self.user.pk)
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+
+        with self.assertNumQueries(1):
+            user = get_user(User, self.user.pk)
+        self.assertFalse(user.is_active)
+
+    def test_user_perms(self):
+        group = Group.objects.create(name="group")
+        group.permissions.add(Permission.objects.get(codename="view_user"))
+        self.user.groups.add(group)
+        self.user.user_permissions.add(Permission.objects.get(codename="view_note"))
+
+        with self.assertNumQueries(1):
+            perms = user_perms(self.user)
+
+        self.assertEqual(perms, {"accounts.view_user", "accounts.view_note"})
+
+    def test_group_perms(self):
+        group = Group.objects.create(name="group")
+        self.user.groups.add(group)
+
+        user = get_user(User, self.user.pk)
+        self.assertFalse(has_perm(user, "accounts.view_user"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            group.permissions.add(Permission.objects.get(codename="view_user"))
+        self.assertNotIn(self.user.pk, user_cache)
+
+        user = get_user(User, self.user.pk)
+        with self.assertNumQueries(0):
+            self.assertTrue(has_perm(user, "accounts.view_user"))
+
+    def test_permission_clear(self):
+        permission = Permission.objects.get(codename="view_user")
+        group = Group.objects.create(name="group")
+        group.permissions.add(permission)
+        self.user.groups.add(group)
+        self.assertTrue(has_perm(get_user(User, self.user.pk), "accounts.view_user"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            permission.group_set.clear()
+        self.assertNotIn(self.user.pk, user_cache)
+        self.assertFalse(has_perm(get_user(User, self.user.pk), "accounts.view_user"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.user_permissions.add(permission)
+        self.assertTrue(has_perm(get_user(User, self.user.pk), "accounts.view_user"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            permission.user_set.clear()
+        self.assertNotIn(self.user.pk, user_cache)
+        self.assertFalse(has_perm(get_user(User, self.user.pk), "accounts.view_user"))
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "test_user_cache",
+        },
+    }
+)
+class SharedUserCacheTestCase(TestCase):
+    """Shared user cache test case"""
+
+    def setUp(self):
+        self.user = User.objects.create(
+            username="user", email="user@mail.com", password="..."
+        )
+
+    def tearDown(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.delete()
+
+    def test_shared(self):
+        get_user(User, self.user.pk)
+        user_cache.clear_local()
+
+        with self.assertNumQueries(0):
+            user = get_user(User, self.user.pk)
+
+        self.assertEqual(user.username, self.user.username)
+
+    def test_generation(self):
+        get_user(User, self.user.pk)
+        data, generation = user_cache.get_shared(self.user.pk)
+        self.assertIsNotNone(data)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.expire_keys()
+        data, new_generation = user_cache.get_shared(self.user.pk)
+        self.assertIsNone(data)
+        self.assertEqual(new_generation, generation + 1)
+
+    def test_revalidate(self):
+        get_user(User, self.user.pk)
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+
+        with self.assertNumQueries(0):
+            self.assertTrue(get_user(User, self.user.pk).is_active)
+
+        # Expired by another process, the local copy is dropped on the next hit.
+        TieredCache(user_cache.prefix).delete(self.user.pk)
+        self.assertIn(self.user.pk, user_cache)
+
+        self.assertFalse(get_user(User, self.user.pk).is_active)
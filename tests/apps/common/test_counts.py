@@ -0,0 +1,46 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+
+from apps.common.counts import count_queryset, estimate_count
+
+User = get_user_model()
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "counts",
+        }
+    }
+)
+class CountQuerysetTestCase(TestCase):
+    """Count queryset test case"""
+
+    def setUp(self):
+        User.objects.bulk_create(
+            [User(username=f"user{i}", email=f"user{i}@mail.com") for i in range(3)]
+        )
+        self.queryset = User.objects.filter(username__startswith="user")
+
+    def test_exact(self):
+        self.assertEqual(count_queryset(self.queryset, "exact"), 3)
+
+    def test_cached(self):
+        self.assertEqual(count_queryset(self.queryset, "cached"), 3)
+        User.objects.create(username="user3", email="user3@mail.com")
+
+        with self.assertNumQueries(0):
+            self.assertEqual(count_queryset(self.queryset, "cached"), 3)
+        self.assertEqual(count_queryset(self.queryset.filter(is_active=True)), 4)
+
+    def test_estimated(self):
+        self.assertIsNone(estimate_count(User.objects.all()))
+        self.assertEqual(count_queryset(self.queryset, "estimated"), 3)
+
+    def test_empty(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(count_queryset(self.queryset.none(), "cached"), 0)
+            self.assertEqual(
+                count_queryset(User.objects.filter(pk__in=[]), "estimated"), 0
+            )
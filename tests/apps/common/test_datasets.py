@@ -0,0 +1,77 @@
+from django.test import TestCase
+
+from apps.common.datasets import Dataset, IndexedList, NgramIndex
+
+
+class IndexedListTestCase(TestCase):
+    """Indexed list test case"""
+
+    def setUp(self):
+        self.items = IndexedList([{"id": str(i)} for i in range(5)], "id")
+
+    def test_position(self):
+        self.assertEqual(len(self.items), 5)
+        self.assertEqual(self.items.position("3"), 3)
+        self.assertIsNone(self.items.position("9"))
+        self.assertEqual(self.items[1:3], ({"id": "1"}, {"id": "2"}))
+
+    def test_reversed(self):
+        items = self.items.reversed()
+
+        self.assertIs(items, self.items.reversed())
+        self.assertIs(items.reversed(), self.items)
+        self.assertEqual(items[0], {"id": "4"})
+        self.assertEqual(items[-1], {"id": "0"})
+        self.assertEqual(items[1:3], [{"id": "3"}, {"id": "2"}])
+        self.assertEqual(items.position("3"), 1)
+        self.assertEqual([item["id"] for item in items], ["4", "3", "2", "1", "0"])
+
+
+class NgramIndexTestCase(TestCase):
+    """N-gram index test case"""
+
+    def setUp(self):
+        self.index = NgramIndex(
+            [{"name": "Orange"}, {"name": "Lemon"}, {"name": "Blood orange"}],
+            ("name",),
+        )
+
+    def test_candidates(self):
+        self.assertEqual(self.index.candidates("o"), [1, 2])
+        self.assertEqual(self.index.candidates("ran"), [0, 2])
+        self.assertEqual(self.index.candidates("range"), [0, 2])
+        self.assertEqual(self.index.candidates("Oran"), [0])
+        self.assertEqual(self.index.candidates("xyz"), [])
+
+
+class DatasetTestCase(TestCase):
+    """Dataset test case"""
+
+    def setUp(self):
+        self.loads = 0
+
+        def load():
+            self.loads += 1
+            return [{"id": str(i), "name": f"Orange {i}"} for i in range(1, 21)]
+
+        self.dataset = Dataset("test-dataset", load, search_fields=("name",))
+
+    def tearDown(self):
+        self.dataset.expire()
+
+    def test_get(self):
+        self.assertEqual(self.dataset.get("3"), {"id": "3", "name": "Orange 3"})
+        self.assertIsNone(self.dataset.get("0"))
+        self.assertEqual(len(self.dataset.all()), 20)
+        self.assertEqual(self.loads, 1)
+
+    def test_search(self):
+        self.assertEqual(len(self.dataset.search("")), 20)
+        self.assertEqual(len(self.dataset.search("Orange")), 20)
+        self.assertEqual(
+            [fruit["id"] for fruit in self.dataset.search("nge 1")],
+            ["1"] + [str(i) for i in range(10, 20)],
+        )
+        self.assertEqual(self.dataset.search("nge 2").position("20"), 1)
+        self.assertEqual(len(self.dataset.search("Apple")), 0)
+        self.assertEqual(self.loads, 1)
@@ -0,0 +1,81 @@
+from unittest import mock
+
+import django_filters as filters
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from django.http import QueryDict
+from django.test import TestCase
+
+from apps.common.filters import FilterSet
+
+User = get_user_model()
+
+
+class UserFilter(FilterSet):
+    """User filter"""
+
+    username = filters.CharFilter(lookup_expr="startswith")
+    email = filters.CharFilter(lookup_expr="endswith", exclude=True)
+    active = filters.BooleanFilter(field_name="is_active")
+    name = filters.CharFilter(method="filter_name")
+    joined = filters.NumberFilter(field_name="date_joined__year")
+
+    @classmethod
+    def filter_name(cls, queryset, name, value):
+        return Q(first_name=value) | Q(last_name=value)
+
+    class Meta:
+        model = User
+        fields = []
+
+
+class Unsupported(FilterSet):
+    """Unsupported filter"""
+
+    order_by = filters.OrderingFilter(fields=("username",))
+
+    class Meta:
+        model = User
+        fields = []
+
+
+class FilterSetTestCase(TestCase):
+    """Filter set test case"""
+
+    def setUp(self):
+        User.objects.bulk_create(
+            [
+                User(username="ann", email="ann@mail.com", first_name="Ann"),
+                User(username="anna", email="anna@test.com", last_name="Lee"),
+                User(username="bob", email="bob@test.com", is_active=False),
+            ]
+        )
+
+    def filter(self, query):
+        data = QueryDict(query)
+        users = UserFilter.filter_data(data, User.objects.all())
+        expected = UserFilter(data, User.objects.all()).qs
+        self.assertEqual(str(users.query), str(expected.query))
+        return sorted(user.username for user in users)
+
+    def test_filter(self):
+        self.assertEqual(self.filter(""), ["ann", "anna", "bob"])
+        self.assertEqual(self.filter("username=an"), ["ann", "anna"])
+        self.assertEqual(self.filter("username=an&email=mail.com"), ["anna"])
+        self.assertEqual(self.filter("active=false"), ["bob"])
+        self.assertEqual(self.filter("name=Lee"), ["anna"])
+
+    def test_no_form(self):
+        with mock.patch.object(UserFilter, "__init__") as init:
+            UserFilter.filter_data({"username": "an"}, User.objects.all())
+        init.assert_not_called()
+
+    def test_errors(self):
+        with self.assertRaises(ValidationError) as context:
+            UserFilter.filter_data({"joined": "now"}, User.objects.all())
+        self.assertEqual(list(context.exception.message_dict), ["joined"])
+
+    def test_unsupported(self):
+        with self.assertRaises(TypeError):
+            Unsupported.filter_data({}, User.objects.all())
@@ -0,0 +1,89 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.accounts.models import Note
+from apps.common import keyset
+
+User = get_user_model()
+
+
+class KeysetTestCase(TestCase):
+    """Keyset test case"""
+
+    def setUp(self):
+        self.user = User.objects.create(username="user", email="user@mail.com")
+        Note.objects.bulk_create(
+            [Note(user=self.user, content=str(i)) for i in range(7)]
+        )
+        now = timezone.now()
+        pks = list(Note.objects.values_list("pk", flat=True))
+        Note.objects.filter(pk__in=pks[:4]).update(created=now)
+        Note.objects.filter(pk__in=pks[4:]).update(
+            created=now - timezone.timedelta(seconds=1)
+        )
+
+    def paginate(self, cursor_field, reverse=False):
+        ordering = keyset.get_ordering(Note, cursor_field)
+        queryset = Note.objects.order_by(*keyset.get_order_by(ordering, reverse))
+        pks, values = [], None
+
+        while True:
+            page = queryset
+            if values:
+                condition = keyset.keyset_filter(Note, ordering, values, reverse)
+                page = page.filter(condition)
+            page = list(page[:3])
+            if not page:
+                return pks
+            pks.extend(note.pk for note in page)
+            cursor = keyset.cursor_encode(page[-1], ordering)
+            values = keyset.cursor_decode(Note, ordering, cursor)
+
+    def expected(self, *order_by):
+        return list(Note.objects.order_by(*order_by).values_list("pk", flat=True))
+
+    def test_ordering(self):
+        self.assertEqual(
+            keyset.get_ordering(Note, "-created"), [("created", True), ("id", True)]
+        )
+        self.assertEqual(
+            keyset.get_ordering(Note, ("created", "-id")),
+            [("created", False), ("id", True)],
+        )
+
+    def test_uniform(self):
+        self.assertEqual(self.paginate("created,id"), self.expected("created", "id"))
+        self.assertEqual(
+            self.paginate("-created,-id"), self.expected("-created", "-id")
+        )
+        self.assertEqual(
+            self.paginate("created,id", reverse=True),
+            self.expected("-created", "-id"),
+        )
+
+    def test_mixed(self):
+        self.assertEqual(self.paginate("-created,id"), self.expected("-created", "id"))
+        self.assertEqual(
+            self.paginate("-created,id", reverse=True),
+            self.expected("created", "-id"),
+        )
+
+    def test_invalid_cursor(self):
+        ordering = keyset.get_ordering(Note, "created,id")
+
+        self.assertIsNone(keyset.cursor_decode(Note, ordering, "invalid"))
+        self.assertIsNone(keyset.cursor_decode(Note, ordering, keyset.base64("[1]")))
+
+    def test_fetch_page(self):
+        queryset = Note.objects.order_by("pk")
+        pks = self.expected("pk")
+
+        with self.assertNumQueries(1):
+            page, has_more = keyset.fetch_page(queryset, 3)
+        self.assertEqual([note.pk for note in page], pks[:3])
+        self.assertTrue(has_more)
+
+        page, has_more = keyset.fetch_page(queryset, 7)
+        self.assertEqual(len(page), 7)
+        self.assertFalse(has_more)
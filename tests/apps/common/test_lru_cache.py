@@ -0,0 +1,49 @@
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from apps.common import cache
+from apps.common.cache import LRUCache
+
+
+class LRUCacheTestCase(SimpleTestCase):
+    """LRU cache test case"""
+
+    def test_get_set(self):
+        lru = LRUCache(maxsize=2)
+        lru.set("a", 1)
+        self.assertEqual(lru.get("a"), 1)
+        self.assertIsNone(lru.get("b"))
+        self.assertEqual(lru.get("b", 2), 2)
+
+    def test_maxsize(self):
+        lru = LRUCache(maxsize=2)
+        lru.set("a", 1)
+        lru.set("b", 2)
+        lru.get("a")
+        lru.set("c", 3)
+        self.assertIn("a", lru)
+        self.assertNotIn("b", lru)
+        self.assertIn("c", lru)
+        self.assertEqual(len(lru), 2)
+
+    def test_timeout(self):
+        lru = LRUCache(maxsize=2, timeout=10)
+        with mock.patch.object(cache, "monotonic", return_value=100):
+            lru.set("a", 1)
+            lru.set("b", 2, timeout=None)
+        with mock.patch.object(cache, "monotonic", return_value=111):
+            self.assertIsNone(lru.get("a"))
+            self.assertEqual(lru.get("b"), 2)
+
+    def test_delete(self):
+        lru = LRUCache()
+        lru.set("a", 1)
+        self.assertTrue(lru.delete("a"))
+        self.assertFalse(lru.delete("a"))
+        self.assertIsNone(lru.get("a"))
+
+    def test_disabled(self):
+        lru = LRUCache(maxsize=0)
+        lru.set("a", 1)
+        self.assertIsNone(lru.get("a"))
@@ -0,0 +1,60 @@
+from django.test import SimpleTestCase, override_settings
+
+from apps.common.cache import TieredCache
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "tiered-cache",
+        }
+    }
+)
+class TieredCacheTestCase(SimpleTestCase):
+    """Tiered cache test case"""
+
+    def setUp(self):
+        # Two caches with the same prefix behave like two worker processes.
+        self.cache = TieredCache("test", local_timeout=0)
+        self.other = TieredCache("test", local_timeout=0)
+
+    def tearDown(self):
+        self.cache.delete("a")
+
+    def test_get_set(self):
+        self.assertIsNone(self.cache.get("a"))
+        self.cache.set("a", [1])
+
+        self.assertEqual(self.cache.get("a"), [1])
+        self.assertEqual(self.other.get("a"), [1])
+
+    def test_revalidate(self):
+        self.cache.set("a", [1])
+        value = self.other.get("a")
+
+        self.assertIs(self.other.get("a"), value)
+
+        self.cache.delete("a")
+        self.assertIsNone(self.other.get("a"))
+
+        self.cache.set("a", [2])
+        self.assertEqual(self.other.get("a"), [2])
+
+    def test_get_or_set(self):
+        calls = []
+
+        def default():
+            calls.append(1)
+            return {"a": 1}
+
+        self.assertEqual(self.cache.get_or_set("a", default), {"a": 1})
+        self.assertEqual(self.other.get_or_set("a", default), {"a": 1})
+        self.assertEqual(len(calls), 1)
+
+    def test_prepare(self):
+        cache = TieredCache("test", prepare=tuple)
+        cache.set("a", [1, 2])
+
+        self.assertEqual(cache.get("a"), (1, 2))
+        self.assertIn("a", cache)
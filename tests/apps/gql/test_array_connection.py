@@ -0,0 +1,92 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from apps.common.datasets import IndexedList
+from apps.gql.array_connection import (
+    connection_from_objects,
+    connection_from_queryset,
+    cursor_encode,
+)
+
+User = get_user_model()
+
+
+class ConnectionFromQuerysetTestCase(TestCase):
+    """Connection from queryset test case"""
+
+    def setUp(self):
+        self.users = User.objects.bulk_create(
+            [User(username=f"user{i}", email=f"user{i}@mail.com") for i in range(5)]
+        )
+        self.queryset = User.objects.all()
+
+    def get_page(self, **args):
+        connection = connection_from_queryset(self.queryset, 2, args, "id")
+        return (
+            [edge.node.pk for edge in connection.edges],
+            connection.pageInfo.hasPreviousPage,
+            connection.pageInfo.hasNextPage,
+        )
+
+    def test_first(self):
+        pks = sorted(user.pk for user in self.users)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(self.get_page(first=2), (pks[:2], False, True))
+
+        after = cursor_encode(str(pks[2]))
+        self.assertEqual(self.get_page(first=2, after=after), (pks[3:], True, False))
+
+    def test_last(self):
+        pks = sorted(user.pk for user in self.users)
+
+        self.assertEqual(self.get_page(last=2), (pks[3:], True, False))
+
+        before = cursor_encode(str(pks[2]))
+        self.assertEqual(self.get_page(last=2, before=before), (pks[:2], False, True))
+
+
+class ConnectionFromObjectsTestCase(TestCase):
+    """Connection from objects test case"""
+
+    def setUp(self):
+        self.objects = [{"id": str(i)} for i in range(5)]
+
+    def get_page(self, **args):
+        connection = connection_from_objects(self.objects, 2, args, "id")
+        return (
+            [edge.node["id"] for edge in connection.edges],
+            connection.pageInfo.hasPreviousPage,
+            connection.pageInfo.hasNextPage,
+        )
+
+    def test_first(self):
+        self.assertEqual(self.get_page(first=2), (["0", "1"], False, True))
+        self.assertEqual(
+            self.get_page(first=2, after=cursor_encode("1")), (["2", "3"], True, True)
+        )
+        self.assertEqual(
+            self.get_page(first=2, after=cursor_encode("3")), (["4"], True, False)
+        )
+
+    def test_last(self):
+        self.assertEqual(self.get_page(last=2), (["3", "4"], True, False))
+        self.assertEqual(
+            self.get_page(last=2, before=cursor_encode("1")), (["0"], False, True)
+        )
+
+
+class ConnectionFromIndexedListTestCase(ConnectionFromObjectsTestCase):
+    """Connection from indexed list test case"""
+
+    def setUp(self):
+        self.objects = IndexedList([{"id": str(i)} for i in range(5)], "id")
+
+    def test_descending(self):
+        connection = connection_from_objects(
+            self.objects, 2, {"first": 2, "after": cursor_encode("3")}, "-id"
+        )
+
+        self.assertEqual([edge.node["id"] for edge in connection.edges], ["2", "1"])
+        self.assertTrue(connection.pageInfo.hasPreviousPage)
+        self.assertTrue(connection.pageInfo.hasNextPage)
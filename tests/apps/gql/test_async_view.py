@@ -0,0 +1,182 @@
+import asyncio
+import json
+from hashlib import sha256
+from unittest import mock
+
+import graphene
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.test import (
+    AsyncRequestFactory,
+    RequestFactory,
+    TransactionTestCase,
+    override_settings,
+)
+from graphql import execute, parse
+
+from apis.gql import schema
+from apps.accounts.models import Note
+from apps.gql.loaders import LoaderExecutionContext, ModelLoader
+from apps.gql.middleware import SyncResolverMiddleware
+from apps.gql.utils import to_global_id
+from apps.gql.views import AsyncGQLView, GQLView, documents, persisted_query_key
+
+User = get_user_model()
+
+
+class ConcurrentQuery(graphene.ObjectType):
+    """Concurrent query type"""
+
+    first = graphene.String()
+    second = graphene.String()
+
+    async def resolve_first(root, info):
+        info.context.started.set()
+        await asyncio.wait_for(info.context.finished.wait(), 1)
+        return "first"
+
+    async def resolve_second(root, info):
+        await asyncio.wait_for(info.context.started.wait(), 1)
+        info.context.finished.set()
+        return "second"
+
+
+class AsyncViewTestCase(TransactionTestCase):
+    """Async view test case"""
+
+    def setUp(self):
+        self.user = User.objects.create(
+            username="user", email="user@mail.com", password="..."
+        )
+        Note.objects.bulk_create(
+            [Note(user=self.user, content=f"{x}") for x in range(3)]
+        )
+        self.query = """
+          query Comments {
+            comments(first: 10) {
+              edges {
+                node {
+                  id
+                  content
+                  user {
+                    email
+                  }
+                }
+              }
+            }
+          }
+        """
+
+    def post(self, factory, query, **data):
+        return factory.post(
+            "/graphql",
+            json.dumps({"query": query, **data}),
+            content_type="application/json",
+        )
+
+    def test_matches_sync_view(self):
+        request = self.post(RequestFactory(), self.query)
+        expected = GQLView.as_view()(request)
+
+        request = self.post(AsyncRequestFactory(), self.query)
+        response = asyncio.run(AsyncGQLView.as_view()(request))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("errors", json.loads(response.content))
+        self.assertEqual(json.loads(response.content), json.loads(expected.content))
+
+    def test_concurrent_fields(self):
+        request = self.post(AsyncRequestFactory(), "{ first second }")
+        view = AsyncGQLView.as_view(schema=graphene.Schema(query=ConcurrentQuery))
+
+        async def run():
+            request.started = asyncio.Event()
+            request.finished = asyncio.Event()
+            return await view(request)
+
+        response = asyncio.run(run())
+
+        self.assertEqual(
+            json.loads(response.content),
+            {"data": {"first": "first", "second": "second"}},
+        )
+
+    def test_loader_levels(self):
+        notes = Note.objects.bulk_create(
+            [
+                Note(
+                    user=User.objects.create(
+                        username=f"user{x}", email=f"user{x}@mail.com"
+                    ),
+                    content=f"{x}",
+                )
+                for x in range(3)
+            ]
+        )
+        query = """
+          query Comments($a: ID!, $b: ID!, $c: ID!) {
+            a: comment(id: $a) { user { email } }
+            b: comment(id: $b) { user { email } }
+            c: comment(id: $c) { user { email } }
+          }
+        """
+        ids = [to_global_id("Comment", note.pk) for note in notes]
+        batches = []
+        batch_load = ModelLoader.batch_load
+
+        def count_batch_load(loader, keys):
+            batches.append(loader.model)
+            return batch_load(loader, keys)
+
+        with mock.patch.object(ModelLoader, "batch_load", count_batch_load):
+            result = asyncio.run(
+                execute(
+                    schema.graphql_schema,
+                    parse(query),
+                    context_value=AsyncRequestFactory().post("/graphql"),
+                    variable_values=dict(zip("abc", ids)),
+                    middleware=[SyncResolverMiddleware()],
+                    execution_context_class=LoaderExecutionContext,
+                )
+            )
+
+        self.assertIsNone(result.errors)
+        self.assertEqual(
+            [result.data[name]["user"]["email"] for name in "abc"],
+            ["user0@mail.com", "user1@mail.com", "user2@mail.com"],
+        )
+        self.assertEqual(batches, [Note, User])
+
+    def test_errors(self):
+        request = self.post(AsyncRequestFactory(), "{ unknown }")
+        response = asyncio.run(AsyncGQLView.as_view()(request))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(json.loads(response.content)["errors"]), 1)
+
+    @override_settings(
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "async-persisted-query",
+            }
+        }
+    )
+    def test_persisted_query(self):
+        query_hash = sha256(self.query.encode()).hexdigest()
+        extensions = {"persistedQuery": {"version": 1, "sha256Hash": query_hash}}
+        documents.clear()
+
+        request = self.post(AsyncRequestFactory(), self.query, extensions=extensions)
+        response = asyncio.run(AsyncGQLView.as_view()(request))
+        self.assertNotIn("errors", json.loads(response.content))
+        self.assertEqual(
+            caches["default"].get(persisted_query_key(query_hash)), self.query
+        )
+
+        documents.clear()
+        request = self.post(AsyncRequestFactory(), None, extensions=extensions)
+        response = asyncio.run(AsyncGQLView.as_view()(request))
+        self.assertEqual(
+            len(json.loads(response.content)["data"]["comments"]["edges"]), 3
+        )
@@ -0,0 +1,143 @@
+from django.contrib.auth import get_user_model
+from django.test import RequestFactory, TestCase
+from graphql import execute, parse
+
+from apis.auth import TokenAuth
+from apis.gql import schema
+from apps.accounts.models import Note
+from apps.gql.loaders import DataLoader, LoaderExecutionContext, ModelLoader
+from apps.gql.utils import to_global_id
+
+User = get_user_model()
+
+
+class DataLoaderTestCase(TestCase):
+    """Data loader test case"""
+
+    def setUp(self):
+        self.batches = []
+
+        def batch_load(keys):
+            self.batches.append(keys)
+            return {key: key * 2 for key in keys}
+
+        self.loader = DataLoader(batch_load)
+
+    def test_batch(self):
+        self.loader.enqueue_many([1, 2, 3])
+
+        self.assertEqual(self.loader.load(1), 2)
+        self.assertEqual(self.loader.load_many([2, 3]), [4, 6])
+        self.assertEqual(self.batches, [[1, 2, 3]])
+
+    def test_defer(self):
+        first = self.loader.defer(1)
+        second = self.loader.defer(2).then(str)
+
+        self.assertEqual(self.batches, [])
+        self.assertEqual([first.get(), second.get()], [2, "4"])
+        self.assertEqual(self.batches, [[1, 2]])
+
+    def test_prime_and_clear(self):
+        self.loader.prime(1, "primed")
+        self.assertEqual(self.loader.load(1), "primed")
+
+        self.loader.clear(1)
+        self.assertEqual(self.loader.load(1), 2)
+        self.assertEqual(self.batches, [[1]])
+
+
+class ModelLoaderTestCase(TestCase):
+    """Model loader test case"""
+
+    def setUp(self):
+        self.users = User.objects.bulk_create(
+            [User(username=f"user{i}", email=f"user{i}@mail.com") for i in range(3)]
+        )
+        self.loader = ModelLoader(User)
+
+    def test_load_many(self):
+        pks = [str(user.pk) for user in self.users] + ["0", "invalid"]
+
+        with self.assertNumQueries(1):
+            users = self.loader.load_many(pks)
+
+        self.assertEqual([user.pk for user in users[:3]], [u.pk for u in self.users])
+        self.assertEqual(users[3:], [None, None])
+
+
+class LoaderExecutionContextTestCase(TestCase):
+    """Loader execution context test case"""
+
+    def setUp(self):
+        self.user = User.objects.create(
+            username="user", email="user@mail.com", password="..."
+        )
+        self.notes = Note.objects.bulk_create(
+            [
+                Note(
+                    user=User.objects.create(
+                        username=f"user{x}", email=f"user{x}@mail.com"
+                    ),
+                    content=f"{x}",
+                )
+                for x in range(3)
+            ]
+        )
+
+    def execute(self, query, user=None, **variables):
+        headers = {}
+        if user:
+            headers["HTTP_AUTHORIZATION"] = f"{TokenAuth.keyword} {user.get_token()}"
+        request = RequestFactory().post("/graphql", **headers)
+        return execute(
+            schema.graphql_schema,
+            parse(query),
+            variable_values=variables,
+            context_value=request,
+            execution_context_class=LoaderExecutionContext,
+        )
+
+    def test_node_lookups(self):
+        ids = [to_global_id("Comment", note.pk) for note in self.notes]
+        query = """
+          query Comments($a: ID!, $b: ID!, $c: ID!, $d: ID!) {
+            a: comment(id: $a) { content user { email } }
+            b: comment(id: $b) { content user { email } }
+            c: comment(id: $c) { content user { email } }
+            d: comment(id: $d) { content }
+          }
+        """
+
+        with self.assertNumQueries(2):
+            result = self.execute(
+                query, a=ids[0], b=ids[1], c=ids[2], d=to_global_id("Comment", "0")
+            )
+
+        self.assertIsNone(result.errors)
+        self.assertEqual(
+            [result.data[name]["content"] for name in "abc"], ["0", "1", "2"]
+        )
+        self.assertEqual(
+            [result.data[name]["user"]["email"] for name in "abc"],
+            ["user0@mail.com", "user1@mail.com", "user2@mail.com"],
+        )
+        self.assertIsNone(result.data["d"])
+
+    def test_errors(self):
+        query = """
+          query Note($id: ID!) {
+            note(id: $id) { content }
+          }
+        """
+
+        result = self.execute(
+            query,
+            user=User.objects.create(username="other", password="..."),
+            id=to_global_id("Note", self.notes[0].pk),
+        )
+
+        self.assertIsNone(result.data["note"])
+        self.assertEqual(len(result.errors), 1)
+        self.assertEqual(result.errors[0].path, ["note"])
+        self.assertIn("Permission denied.", result.errors[0].message)
@@ -0,0 +1,82 @@
+import json
+from hashlib import sha256
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from apps.gql.views import PERSISTED_QUERY_TIMEOUT, documents, persisted_query_key
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "persisted-query",
+        }
+    }
+)
+class PersistedQueryTestCase(TestCase):
+    """Persisted query test case"""
+
+    def setUp(self):
+        self.path = reverse("gql")
+        self.query = """
+          query Localtime {
+            localtime {
+              now
+              __typename
+            }
+          }
+        """
+        self.query_hash = sha256(self.query.encode()).hexdigest()
+        documents.clear()
+
+    def post(self, query=None, query_hash=None):
+        data = {"operationName": "Localtime", "variables": None}
+        if query is not None:
+            data["query"] = query
+        if query_hash is not None:
+            data["extensions"] = {
+                "persistedQuery": {"version": 1, "sha256Hash": query_hash}
+            }
+        return self.client.post(
+            self.path, json.dumps(data), content_type="application/json"
+        )
+
+    def test_document_cache(self):
+        response = self.post(self.query)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("localtime", response.json()["data"])
+        self.assertIn(self.query_hash, documents)
+
+    def test_persisted_query(self):
+        response = self.post(query_hash=self.query_hash)
+
+        self.assertEqual(response.status_code, 200)
+        error = response.json()["errors"][0]
+        self.assertEqual(error["message"], "PersistedQueryNotFound")
+
+        response = self.post(self.query, self.query_hash)
+        self.assertEqual(response.status_code, 200)
+
+        documents.clear()
+        response = self.post(query_hash=self.query_hash)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("localtime", response.json()["data"])
+
+    def test_persisted_query_timeout(self):
+        with mock.patch("apps.gql.views.caches") as caches:
+            self.post(self.query, self.query_hash)
+
+        caches["default"].set.assert_called_once_with(
+            persisted_query_key(self.query_hash), self.query, PERSISTED_QUERY_TIMEOUT
+        )
+
+    def test_hash_mismatch(self):
+        response = self.post(self.query, "0" * 64)
+
+        self.assertEqual(response.status_code, 200)
+        error = response.json()["errors"][0]
+        self.assertEqual(error["message"], "Provided sha does not match query.")
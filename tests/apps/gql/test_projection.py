@@ -0,0 +1,28 @@
+from django.test import TestCase
+
+from apis.gql.accounts import types
+from apps.gql.projection import get_projection
+
+
+class ProjectionTestCase(TestCase):
+    """Projection test case"""
+
+    def test_scalar_fields(self):
+        only, select, prefetch = get_projection(
+            types.User, {"id", "username", "dateJoined", "__typename"}
+        )
+
+        self.assertEqual(only, {"id", "username", "date_joined"})
+        self.assertEqual(select, set())
+        self.assertEqual(prefetch, set())
+
+    def test_computed_fields(self):
+        only, _, _ = get_projection(types.User, {"username", "tfaActive"})
+        self.assertEqual(only, {"username", "tfa_secret"})
+
+        only, select, _ = get_projection(types.Comment, {"content", "user"})
+        self.assertEqual(only, {"content", "user"})
+        self.assertEqual(select, set())
+
+    def test_unknown_fields(self):
+        self.assertIsNone(get_projection(types.User, {"username", "unknown"}))
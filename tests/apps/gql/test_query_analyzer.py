@@ -0,0 +1,114 @@
+from unittest import mock
+
+from django.test import TestCase
+from graphql import parse
+from graphql.error import GraphQLError
+
+from apps.gql.views import MAX_LIMIT, QueryAnalyzer, validate_document
+
+
+class QueryAnalyzerTestCase(TestCase):
+    """Query analyzer test case"""
+
+    def analyze(self, query):
+        document = parse(query)
+        return QueryAnalyzer(document).analyze(document.definitions[0])
+
+    def test_depth(self):
+        depth, cost = self.analyze("{ me { id username } }")
+
+        self.assertEqual(depth, 2)
+        self.assertEqual(cost, 3)
+
+    def test_connection_cost(self):
+        depth, cost = self.analyze("""
+            query Users($first: Int) {
+              users(first: 10) { edges { node { id notes(first: $first) { id } } } }
+            }
+            """)
+
+        self.assertEqual(depth, 5)
+        self.assertEqual(cost, 1 + 10 * (1 + 1 + 1 + 1 + MAX_LIMIT))
+
+    def test_fragments(self):
+        depth, cost = self.analyze("""
+            query Me { me { ...UserFields ... on UserType { email } } }
+            fragment UserFields on UserType { id username }
+            """)
+
+        self.assertEqual(depth, 2)
+        self.assertEqual(cost, 4)
+
+    def test_alias(self):
+        with self.assertRaisesMessage(GraphQLError, "Only 1 alias is allowed"):
+            self.analyze("{ me { id } other: me { id } }")
+
+    def test_max_depth(self):
+        query = "{ a " + "{ a " * 10 + "{ id }" + " }" * 11
+        with self.assertRaisesMessage(GraphQLError, "Query depth allowed is"):
+            validate_document(parse(query))
+
+    def test_max_cost(self):
+        query = "{ a(first: 50) { b(first: 50) { c(first: 50) { id } } } }"
+        with self.assertRaisesMessage(GraphQLError, "Query cost allowed is"):
+            validate_document(parse(query))
+
+    def test_max_fields(self):
+        with self.assertRaisesMessage(GraphQLError, "fields are allowed"):
+            validate_document(parse("{ a b c }"))
+
+    def test_inline_fragment_max_fields(self):
+        with self.assertRaisesMessage(GraphQLError, "fields are allowed"):
+            validate_document(parse("{ ... on Query { a b c d e } }"))
+
+    def test_fragment_spread_max_fields(self):
+        with self.assertRaisesMessage(GraphQLError, "fields are allowed"):
+            validate_document(parse("{ a ...Fields } fragment Fields on Query { b c }"))
+
+    def test_fragment_introspection(self):
+        with mock.patch("apps.gql.views.INTROSPECTION", False):
+            with self.assertRaisesMessage(GraphQLError, "__schema introspection"):
+                validate_document(
+                    parse("{ ... on Query { __schema { types { name } } } }")
+                )
+            with self.assertRaisesMessage(GraphQLError, "__type introspection"):
+                validate_document(
+                    parse(
+                        "{ ...Type } "
+                        'fragment Type on Query { __type(name: "A") { name } }'
+                    )
+                )
+
+    def test_fragment_alias(self):
+        with self.assertRaisesMessage(GraphQLError, "Only 1 alias is allowed"):
+            validate_document(
+                parse(
+                    "{ notes(first: 1) { id } "
+                    "... on Query { x: notes(first: 1) { id } } }"
+                )
+            )
+        with self.assertRaisesMessage(GraphQLError, "Only 1 alias is allowed"):
+            self.analyze(
+                "{ me { id ...Fields } } fragment Fields on UserType { x: id }"
+            )
+
+    def test_merged_fields(self):
+        depth, cost = self.analyze(
+            "{ me { id ...Fields ... on UserType { id } } } "
+            "fragment Fields on UserType { id }"
+        )
+
+        self.assertEqual(depth, 2)
+        validate_document(
+            parse("{ node(id: 1) { ... on UserType { id } ... on NoteType { id } } }")
+        )
+
+    def test_arguments_alias(self):
+        with self.assertRaisesMessage(GraphQLError, "Only 1 alias is allowed"):
+            self.analyze("{ notes(first: 1) { id } ... on Query { notes { id } } }")
+
+    def test_recursive_fragment(self):
+        with self.assertRaisesMessage(GraphQLError, "Query depth allowed is"):
+            validate_document(
+                parse("{ a { ...Fields } } fragment Fields on A { b { ...Fields } }")
+            )
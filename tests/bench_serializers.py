@@ -0,0 +1,89 @@
+"""
+Benchmark the compiled serializers against the DRF serializers.
+
+Rows are built in memory, so no database is needed:
+
+    python -m tests.bench_serializers [rows] [repeat]
+"""
+
+import os
+import sys
+import timeit
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.settings")
+django.setup()
+
+from django.contrib.auth import get_user_model  # noqa: E402
+from django.test import RequestFactory  # noqa: E402
+from django.utils import timezone  # noqa: E402
+from rest_framework.request import Request  # noqa: E402
+
+from apis.pi import compiled  # noqa: E402
+from apis.pi.accounts.serializers import (  # noqa: E402
+    ListCommentSerializer,
+    ListNoteSerializer,
+    ListUserSerializer,
+)
+from apps.accounts.models import Note  # noqa: E402
+
+User = get_user_model()
+
+
+def get_users(rows):
+    now = timezone.now()
+    return [
+        User(
+            username=f"user{x}",
+            email=f"user{x}@mail.com",
+            first_name="First",
+            last_name="Last",
+            last_login=now,
+            tfa_secret="secret" if x % 2 else "",
+        )
+        for x in range(rows)
+    ]
+
+
+def get_notes(rows):
+    now = timezone.now()
+    return [
+        Note(user=user, content=f"Note {x}", created=now, modified=now)
+        for x, user in enumerate(get_users(rows))
+    ]
+
+
+def bench(serializer_class, instances, repeat):
+    """Get the best time per row of the DRF and the compiled serializer."""
+    request = Request(RequestFactory().get("/"))
+
+    def get_serializer():
+        return serializer_class(instances, many=True, context={"request": request})
+
+    assert compiled.serialize(get_serializer()) == get_serializer().data
+    drf = min(timeit.repeat(lambda: get_serializer().data, number=1, repeat=repeat))
+    fast = min(
+        timeit.repeat(
+            lambda: compiled.serialize(get_serializer()), number=1, repeat=repeat
+        )
+    )
+    return drf / len(instances), fast / len(instances)
+
+
+def main(rows=50, repeat=200):
+    print(f"{'serializer':<24}{'drf us/row':>12}{'compiled us/row':>18}{'speedup':>10}")
+    for serializer_class, instances in (
+        (ListNoteSerializer, get_notes(rows)),
+        (ListCommentSerializer, get_notes(rows)),
+        (ListUserSerializer, get_users(rows)),
+    ):
+        drf, fast = bench(serializer_class, instances, repeat)
+        print(
+            f"{serializer_class.__name__:<24}{drf * 1e6:>12.1f}"
+            f"{fast * 1e6:>18.1f}{drf / fast:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -7,6 +7,9 @@ os.environ["CACHES_BACKEND"] = "dummy"
 
 from conf.settings import *  # noqa
 
+# Tests run in a single process, so the user cache is shared.
+AUTH_SHARED_CACHE = True
+
 PASSWORD_HASHERS = [
     "django.contrib.auth.hashers.MD5PasswordHasher",
 ]